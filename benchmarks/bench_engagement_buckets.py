@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark engagement-level bucketing of the posts chart.
+
+Compares the former per-element percentile bucketing (quadratic, so it is
+only timed on a small sample), the vectorized exact bucketing and the
+chunked streaming quantile sketch on heavy-tailed synthetic engagement.
+
+Usage:
+    python benchmarks/bench_engagement_buckets.py [--tweets N] [--chunk N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from x_follower_analyzer.utils.engagement import (  # noqa: E402
+    EngagementBuckets,
+    QuantileSketch,
+    engagement_buckets,
+)
+
+QUADRATIC_SAMPLE = 2000
+
+
+def quadratic_buckets(values: list) -> list:
+    """Per-element percentile bucketing, as the chart used to do it."""
+    high = [e for e in values if e > np.percentile(values, 90)]
+    medium = [
+        e for e in values if np.percentile(values, 50) < e <= np.percentile(values, 90)
+    ]
+    low = [e for e in values if e <= np.percentile(values, 50)]
+    return [len(high), len(medium), len(low)]
+
+
+def timed(func, *args):
+    """Run ``func`` once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def sketch_buckets(values: np.ndarray, chunk: int) -> EngagementBuckets:
+    """Bucket values streamed through a quantile sketch in chunks."""
+    sketch = QuantileSketch()
+    for start in range(0, values.size, chunk):
+        sketch.update(values[start : start + chunk])
+    return EngagementBuckets.from_sketch(sketch)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tweets", type=int, default=1_000_000, help="Tweets")
+    parser.add_argument("--chunk", type=int, default=50_000, help="Sketch chunk")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    values = np.floor(rng.lognormal(2.0, 1.5, args.tweets)).astype(np.int64)
+    sample = values[:QUADRATIC_SAMPLE].tolist()
+
+    quadratic, quadratic_s = timed(quadratic_buckets, sample)
+    assert quadratic == engagement_buckets(sample).counts  # nosec B101
+
+    exact, exact_s = timed(engagement_buckets, values)
+    exact_list, exact_list_s = timed(engagement_buckets, values.tolist())
+    sketched, sketch_s = timed(sketch_buckets, values, args.chunk)
+    error = max(abs(a - b) for a, b in zip(sketched.counts, exact.counts))
+
+    # The quadratic version scales with n^2 from the timed sample
+    projected = quadratic_s * (args.tweets / QUADRATIC_SAMPLE) ** 2
+
+    print(f"{'method':<34} {'tweets':>10} {'seconds':>10}")
+    print(
+        f"{'per-element percentiles':<34} {QUADRATIC_SAMPLE:>10,} {quadratic_s:>10.3f}"
+    )
+    print(f"{'  (projected)':<34} {args.tweets:>10,} {projected:>10.0f}")
+    print(f"{'vectorized (ndarray)':<34} {args.tweets:>10,} {exact_s:>10.3f}")
+    print(f"{'vectorized (list input)':<34} {args.tweets:>10,} {exact_list_s:>10.3f}")
+    print(f"{'streaming sketch':<34} {args.tweets:>10,} {sketch_s:>10.3f}")
+    print(
+        f"\nexact buckets (high/medium/low): {exact.counts}"
+        f"\nsketch buckets:                  {sketched.counts}"
+        f" (max error {error / args.tweets:.2%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark CLI startup and import cost.
+
+Each scenario runs in a fresh interpreter with ``-X importtime`` and reports
+the median wall time, the cumulative import time of the package and whether
+any heavy visualization module was loaded.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("matplotlib", "seaborn", "pandas", "plotly", "wordcloud")
+
+SCENARIOS = {
+    "cli --dry-run": [
+        "-m",
+        "x_follower_analyzer.cli",
+        "benchmark_user",
+        "--output-format",
+        "csv,json",
+        "--dry-run",
+    ],
+    "csv exporter": [
+        "-c",
+        "from x_follower_analyzer.exporters.exporter_factory import ExporterFactory;"
+        "from x_follower_analyzer.models.config import OutputFormat;"
+        "ExporterFactory.create_exporter(OutputFormat.CSV, 'bench.csv')",
+    ],
+    "dashboard exporter": [
+        "-c",
+        "from x_follower_analyzer.exporters.exporter_factory import ExporterFactory;"
+        "ExporterFactory.create_dashboard_exporter('bench.html')",
+    ],
+}
+
+
+def run_scenario(args: list, runs: int, workdir: str) -> dict:
+    """Run one scenario ``runs`` times and summarize it."""
+    env = dict(os.environ, X_BEARER_TOKEN="benchmark", PYTHONPATH=str(ROOT))
+    wall_times = []
+    import_log = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(  # nosec B603
+            [sys.executable, "-X", "importtime", *args],
+            cwd=workdir,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        wall_times.append(time.perf_counter() - start)
+        import_log = result.stderr
+
+    loaded = set()
+    package_us = 0
+    for line in import_log.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        module = name.strip()
+        loaded.add(module.split(".")[0])
+        if module == "x_follower_analyzer" or module.startswith("x_follower_analyzer."):
+            package_us = max(package_us, int(cumulative.strip()))
+
+    return {
+        "wall_ms": statistics.median(wall_times) * 1000,
+        "package_ms": package_us / 1000,
+        "heavy": sorted(loaded.intersection(HEAVY_MODULES)),
+    }
+
+
+def main() -> None:
+    """Run every scenario and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20} {'wall (ms)':>10} {'imports (ms)':>13}  heavy modules")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, scenario_args in SCENARIOS.items():
+            result = run_scenario(scenario_args, args.runs, workdir)
+            heavy = ", ".join(result["heavy"]) or "-"
+            print(
+                f"{name:<20} {result['wall_ms']:>10.1f} "
+                f"{result['package_ms']:>13.1f}  {heavy}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark streaming exports of synthetic followers.
+
+Followers are drawn chunk by chunk by ``SyntheticFollowers`` and streamed
+into each exporter, so memory stays bounded by one chunk however many
+followers are generated. Reports the generation rate alone, then each
+format's end-to-end rate, output size and the process peak RSS.
+
+Usage:
+    python benchmarks/bench_synthetic_export.py [--followers N] [--chunk N]
+        [--formats ndjson,csv,sqlite] [--seed N]
+"""
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from x_follower_analyzer.exporters.exporter_factory import (  # noqa: E402
+    ExporterFactory,
+)
+from x_follower_analyzer.models.config import OutputFormat  # noqa: E402
+from x_follower_analyzer.utils.synthetic import SyntheticFollowers  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB (Linux reports KiB)."""
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def output_size(path: Path) -> int:
+    """Size of an output file, or of every file in an output directory."""
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+    return path.stat().st_size
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--followers", type=int, default=100_000, help="Followers")
+    parser.add_argument("--chunk", type=int, default=10_000, help="Chunk size")
+    parser.add_argument(
+        "--formats", default="ndjson,csv,sqlite", help="Comma-separated formats"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    formats = [OutputFormat(value) for value in args.formats.split(",")]
+
+    def followers() -> SyntheticFollowers:
+        return SyntheticFollowers(args.followers, seed=args.seed, chunk_size=args.chunk)
+
+    print(f"{'step':<12} {'followers':>10} {'seconds':>9} {'per sec':>9} {'MB':>8}")
+
+    start = time.perf_counter()
+    tweets = sum(len(analysis.recent_tweets) for analysis in followers())
+    seconds = time.perf_counter() - start
+    print(
+        f"{'generate':<12} {args.followers:>10,} {seconds:>9.2f}"
+        f" {args.followers / seconds:>9,.0f} {'':>8}"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for output_format in formats:
+            path = Path(temp_dir) / f"followers.{output_format.value}"
+            exporter = ExporterFactory.create_exporter(output_format, str(path))
+            start = time.perf_counter()
+            exporter.open()
+            try:
+                for analysis in followers():
+                    exporter.write_analysis(analysis)
+            finally:
+                exporter.close()
+            seconds = time.perf_counter() - start
+            print(
+                f"{output_format.value:<12} {args.followers:>10,} {seconds:>9.2f}"
+                f" {args.followers / seconds:>9,.0f}"
+                f" {output_size(path) / 2**20:>8.1f}"
+            )
+
+    print(f"\n{tweets:,} recent tweets per pass, peak RSS {peak_rss_mb():.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
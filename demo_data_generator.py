@@ -186,6 +186,8 @@ def generate_demo_data(count: int = 50) -> List[FollowerAnalysis]:
                 text=random.choice(sample_tweets),
                 created_at=datetime.now() - timedelta(hours=random.randint(1, 720)),
                 liked_at=datetime.now() - timedelta(hours=random.randint(1, 168)),
+                retweet_count=random.randint(0, 5000),
+                favorite_count=random.randint(0, 50000),
             )
             liked_tweets.append(liked_tweet)
 
@@ -1,18 +1,19 @@
 """Generate demo images for README documentation."""
 
-import base64
 from pathlib import Path
 
 from demo_data_generator import generate_demo_data
+from x_follower_analyzer.models.config import RenderProfile
 from x_follower_analyzer.visualization.charts import ChartGenerator
+from x_follower_analyzer.visualization.output import ChartOutput
 
-
-def save_base64_image(base64_data: str, filename: str) -> None:
-    """Save base64 image data to file."""
-    image_data = base64.b64decode(base64_data)
-    with open(filename, "wb") as f:
-        f.write(image_data)
-    print(f"✅ Saved: {filename}")
+# Chart name (see STATIC_CHARTS) -> demo image file name, where they differ,
+# so images referenced by earlier READMEs keep their names
+DEMO_IMAGE_NAMES = {
+    "verification": "verification_status",
+    "location": "location_analysis",
+    "engagement": "engagement_analysis",
+}
 
 
 def main():
@@ -21,7 +22,7 @@ def main():
     demo_analyses = generate_demo_data(100)
 
     print("📊 Creating chart generator...")
-    chart_generator = ChartGenerator()
+    chart_generator = ChartGenerator(render_profile=RenderProfile.PRINT)
 
     # Create data directory
     data_dir = Path("data/demo_images")
@@ -29,30 +30,12 @@ def main():
 
     print("📈 Generating demo charts...")
 
-    # Generate all chart types
-    charts = {
-        "follower_distribution": chart_generator.create_follower_distribution_chart(
-            demo_analyses
-        ),
-        "verification_status": chart_generator.create_verification_pie_chart(
-            demo_analyses
-        ),
-        "location_analysis": chart_generator.create_location_analysis_chart(
-            demo_analyses
-        ),
-        "engagement_analysis": chart_generator.create_engagement_analysis_chart(
-            demo_analyses
-        ),
-        "hashtag_wordcloud": chart_generator.create_hashtag_wordcloud(demo_analyses),
-        "activity_timeline": chart_generator.create_activity_timeline_chart(
-            demo_analyses
-        ),
-    }
-
-    # Save all charts
-    for chart_name, base64_data in charts.items():
-        filename = data_dir / f"{chart_name}.png"
-        save_base64_image(base64_data, str(filename))
+    # Generate all chart types as PNG bytes
+    charts = chart_generator.create_static_charts(demo_analyses, ChartOutput.BYTES)
+    for chart_name, png in charts.items():
+        filename = data_dir / f"{DEMO_IMAGE_NAMES.get(chart_name, chart_name)}.png"
+        filename.write_bytes(png)
+        print(f"✅ Saved: {filename}")
 
     print(f"\n🎉 Generated {len(charts)} demo images in {data_dir}/")
     print("📁 Files created:")
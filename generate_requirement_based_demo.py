@@ -1,27 +1,19 @@
 """Generate demo images based on initial requirements."""
 
-import base64
 from pathlib import Path
 
 from demo_data_generator import generate_demo_data
+from x_follower_analyzer.models.config import RenderProfile
 from x_follower_analyzer.visualization.follower_charts import FollowerAnalysisCharts
 
 
-def save_base64_image(base64_data: str, filename: str) -> None:
-    """Save base64 image data to file."""
-    image_data = base64.b64decode(base64_data)
-    with open(filename, "wb") as f:
-        f.write(image_data)
-    print(f"✅ Saved: {filename}")
-
-
 def main():
     """Generate requirement-based demo images for README."""
     print("🎯 Generating demo data based on initial requirements...")
     demo_analyses = generate_demo_data(100)
 
     print("📊 Creating follower analysis chart generator...")
-    chart_generator = FollowerAnalysisCharts()
+    chart_generator = FollowerAnalysisCharts(render_profile=RenderProfile.PRINT)
 
     # Create data directory
     data_dir = Path("data/demo_images")
@@ -29,30 +21,31 @@ def main():
 
     print("📈 Generating requirement-based charts...")
 
-    # Generate all chart types based on requirements
+    # Generate all chart types based on requirements, written straight to files
     charts = {
         "01_follower_profile_overview": (
-            chart_generator.create_follower_profile_overview(demo_analyses)
+            chart_generator.create_profile_collection_analysis(
+                demo_analyses, data_dir / "01_follower_profile_overview.png"
+            )
         ),
-        "02_bio_analysis": chart_generator.create_bio_analysis_chart(demo_analyses),
-        "03_posting_behavior": chart_generator.create_posting_behavior_analysis(
-            demo_analyses
+        "02_bio_analysis": chart_generator.create_bio_analysis_chart(
+            demo_analyses, data_dir / "02_bio_analysis.png"
         ),
-        "04_likes_behavior": chart_generator.create_likes_behavior_analysis(
-            demo_analyses
+        "03_posting_behavior": chart_generator.create_posts_collection_analysis(
+            demo_analyses, data_dir / "03_posting_behavior.png"
+        ),
+        "04_likes_behavior": chart_generator.create_likes_collection_analysis(
+            demo_analyses, data_dir / "04_likes_behavior.png"
         ),
         "05_geographic_insights": chart_generator.create_geographic_insights(
-            demo_analyses
+            demo_analyses, data_dir / "05_geographic_insights.png"
         ),
         "06_comprehensive_summary": chart_generator.create_comprehensive_summary(
-            demo_analyses, "elonmusk"
+            demo_analyses, "elonmusk", data_dir / "06_comprehensive_summary.png"
         ),
     }
-
-    # Save all charts
-    for chart_name, base64_data in charts.items():
-        filename = data_dir / f"{chart_name}.png"
-        save_base64_image(base64_data, str(filename))
+    for filename in charts.values():
+        print(f"✅ Saved: {filename}")
 
     print(f"\n🎉 Generated {len(charts)} requirement-based demo images in {data_dir}/")
     print("📁 Files created:")
@@ -8,9 +8,9 @@
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-import base64
 from typing import List
 
+from x_follower_analyzer.models.config import RenderProfile
 from x_follower_analyzer.models.user import (
     UserProfile,
     Tweet,
@@ -20,6 +20,7 @@ from x_follower_analyzer.models.user import (
 from x_follower_analyzer.visualization.follower_charts import (
     FollowerAnalysisCharts,
 )
+from x_follower_analyzer.visualization.output import ChartOutput
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -111,18 +112,6 @@ def create_demo_data() -> List[FollowerAnalysis]:
     return demo_analyses
 
 
-def save_chart_as_image(base64_data: str, filename: str, output_dir: Path) -> None:
-    """Save base64 chart data as PNG file."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Decode base64 and save
-    image_data = base64.b64decode(base64_data)
-    with open(output_dir / filename, "wb") as f:
-        f.write(image_data)
-
-    print(f"✅ Saved: {output_dir / filename}")
-
-
 def main():
     """Generate requirement-focused demo visualization."""
     print("🚀 生成中: 要件対応デモ可視化...")
@@ -132,7 +121,7 @@ def main():
     demo_analyses = create_demo_data()
 
     # Initialize chart generator
-    chart_generator = FollowerAnalysisCharts()
+    chart_generator = FollowerAnalysisCharts(render_profile=RenderProfile.PRINT)
 
     # Output directory
     output_dir = Path("data/demo_images_requirement")
@@ -140,38 +129,55 @@ def main():
 
     print(f"🎯 {len(demo_analyses)}人のフォロワーデータで分析実行中...")
 
-    # Generate requirement-focused charts
+    # Generate requirement-focused charts (rendered concurrently)
     charts = [
         (
             "01_profile_collection_analysis.png",
             "プロフィール収集項目の詳細分析",
-            "create_profile_collection_analysis",
+            "profile_collection",
         ),
         (
             "02_posts_collection_analysis.png",
             "投稿収集項目の詳細分析",
-            "create_posts_collection_analysis",
+            "posts_collection",
         ),
         (
             "03_likes_collection_analysis.png",
             "いいね履歴収集項目の詳細分析",
-            "create_likes_collection_analysis",
+            "likes_collection",
+        ),
+        (
+            "04_geographic_insights.png",
+            "地理的分布の分析",
+            "geographic_insights",
+        ),
+        (
+            "05_comprehensive_summary.png",
+            "総合分析サマリー",
+            "comprehensive_summary",
         ),
     ]
 
-    for filename, description, method_name in charts:
-        print(f"📈 生成中: {description}...")
+    print("📈 生成中: 要件対応チャート（並列レンダリング）...")
+    report = chart_generator.create_requirement_report(
+        demo_analyses,
+        target_username="demo_account",
+        charts=[chart_name for _, _, chart_name in charts],
+        output=ChartOutput.BYTES,
+    )
 
-        try:
-            method = getattr(chart_generator, method_name)
-            base64_data = method(demo_analyses)
-            save_chart_as_image(base64_data, filename, output_dir)
-        except Exception as e:
-            print(f"❌ エラー in {description}: {e}")
+    for filename, description, chart_name in charts:
+        if chart_name in report.errors:
+            print(f"❌ エラー in {description}: {report.errors[chart_name]}")
             continue
+        (output_dir / filename).write_bytes(report.charts[chart_name])
+        print(f"✅ Saved: {output_dir / filename}")
+
+    print("\n⏱️ レンダリング時間:")
+    print(report.format_timings())
 
     print(f"\n✨ 完了! すべての要件対応可視化が {output_dir} に保存されました")
-    print(f"📊 生成されたチャート: {len(charts)}個")
+    print(f"📊 生成されたチャート: {len(report.charts)}個")
     print("\n📋 要件対応状況:")
     print(
         "✅ 要件1: プロフィール収集項目 (ユーザーID、ユーザー名、自己紹介文、フォロー数、フォロワー数、位置情報など)"
@@ -6,7 +6,11 @@ from pathlib import Path
 
 import pytest
 
-from x_follower_analyzer.models.config import AnalysisConfig, OutputFormat
+from x_follower_analyzer.models.config import (
+    AnalysisConfig,
+    OutputFormat,
+    RenderProfile,
+)
 from x_follower_analyzer.utils.config import (
     create_analysis_config,
     get_api_credentials,
@@ -51,6 +55,85 @@ class TestCreateAnalysisConfig:
         with pytest.raises(ValueError, match="target_username cannot be empty"):
             create_analysis_config("@")
 
+    def test_compression_suffix(self):
+        """Test compressed output gets the codec extension."""
+        config = create_analysis_config(
+            "testuser", output_format="ndjson", compression="zstd"
+        )
+        assert config.compression == "zstd"
+        assert config.output_file == "testuser_followers_analysis.ndjson.zst"
+
+        config = create_analysis_config(
+            "testuser", output_file="out.csv.gz", compression="gzip"
+        )
+        assert config.output_file == "out.csv.gz"
+
+    def test_invalid_compression(self):
+        """Test unsupported compression settings raise errors."""
+        with pytest.raises(ValueError, match="Invalid compression"):
+            create_analysis_config("testuser", compression="bzip2")
+
+        with pytest.raises(ValueError, match="Compression is not supported"):
+            create_analysis_config(
+                "testuser", output_format="sqlite", compression="gzip"
+            )
+
+    def test_multiple_output_formats(self):
+        """Test comma-separated formats derive sibling output files."""
+        config = create_analysis_config(
+            "testuser", output_format="csv,json,html,csv", output_file="out.csv"
+        )
+        assert config.output_format == OutputFormat.CSV
+        assert config.output_targets() == [
+            (OutputFormat.CSV, "out.csv"),
+            (OutputFormat.JSON, "out.json"),
+            (OutputFormat.DASHBOARD, "out.html"),
+        ]
+
+        with pytest.raises(ValueError, match="Invalid output format"):
+            create_analysis_config("testuser", output_format="csv,xml")
+
+    def test_multiple_output_formats_compression(self):
+        """Test compression applies only to compressible outputs."""
+        config = create_analysis_config(
+            "testuser",
+            output_format="sqlite,ndjson",
+            output_file="out.sqlite",
+            compression="gzip",
+            generate_dashboard=True,
+        )
+        assert config.output_targets() == [
+            (OutputFormat.SQLITE, "out.sqlite"),
+            (OutputFormat.NDJSON, "out.ndjson.gz"),
+            (OutputFormat.DASHBOARD, "testuser_dashboard.html"),
+        ]
+
+    def test_render_profile(self):
+        """Test render profiles are parsed and validated."""
+        assert create_analysis_config("testuser").render_profile == (
+            RenderProfile.STANDARD
+        )
+        config = create_analysis_config("testuser", render_profile="Preview")
+        assert config.render_profile == RenderProfile.PREVIEW
+        assert config.render_profile.dpi < RenderProfile.PRINT.dpi
+
+        with pytest.raises(ValueError, match="Invalid render profile"):
+            create_analysis_config("testuser", render_profile="poster")
+
+    def test_local_time(self):
+        """Test dashboard activity is binned in UTC unless local time is set."""
+        assert create_analysis_config("testuser").local_time is False
+        assert create_analysis_config("testuser", local_time=True).local_time
+
+    def test_live_dashboard_port(self):
+        """Test the live dashboard is off by default and its port validated."""
+        assert create_analysis_config("testuser").live_dashboard_port is None
+        config = create_analysis_config("testuser", live_dashboard_port=8050)
+        assert config.live_dashboard_port == 8050
+
+        with pytest.raises(ValueError, match="live_dashboard_port"):
+            create_analysis_config("testuser", live_dashboard_port=70000)
+
 
 class TestValidateOutputDirectory:
     """Test output directory validation."""
@@ -0,0 +1,99 @@
+"""Tests for engagement-level bucketing."""
+
+import numpy as np
+import pytest
+
+from x_follower_analyzer.utils.engagement import (
+    EngagementBuckets,
+    QuantileSketch,
+    engagement_buckets,
+)
+
+
+def _reference_buckets(values):
+    """Per-element bucketing, as the posts chart used to do it."""
+    median, p90 = np.percentile(values, 50), np.percentile(values, 90)
+    return (
+        sum(1 for e in values if e > p90),
+        sum(1 for e in values if median < e <= p90),
+        sum(1 for e in values if e <= median),
+    )
+
+
+class TestEngagementBuckets:
+    """Test exact engagement bucketing."""
+
+    def test_matches_per_element_bucketing(self):
+        """Test vectorized counts match the element-by-element definition."""
+        values = np.random.default_rng(0).poisson(5, 500).tolist()
+
+        buckets = engagement_buckets(values)
+
+        assert tuple(buckets.counts) == _reference_buckets(values)
+        assert buckets.total == len(values)
+        assert buckets.median == np.percentile(values, 50)
+
+    def test_ties_fall_into_lower_bucket(self):
+        """Test values equal to a quantile count in the bucket below it."""
+        buckets = engagement_buckets([0, 0, 0, 0, 5])
+
+        assert (buckets.low, buckets.medium, buckets.high) == (4, 0, 1)
+
+    def test_empty_series(self):
+        """Test bucketing nothing is rejected."""
+        with pytest.raises(ValueError, match="empty"):
+            engagement_buckets([])
+
+
+class TestQuantileSketch:
+    """Test the streaming quantile sketch."""
+
+    @pytest.fixture
+    def values(self):
+        """Heavy-tailed integer engagement, like real tweets."""
+        rng = np.random.default_rng(1)
+        return np.floor(rng.lognormal(2.0, 1.5, 20000))
+
+    def test_quantiles_within_relative_accuracy(self, values):
+        """Test estimates stay within the configured relative error."""
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for chunk in np.array_split(values, 7):
+            sketch.update(chunk)
+
+        assert len(sketch) == values.size
+        for q in (0.5, 0.9, 0.99):
+            exact = np.quantile(values, q, method="lower")
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_bucket_estimates(self, values):
+        """Test sketched buckets are close to the exact ones."""
+        sketch = QuantileSketch()
+        sketch.update(values)
+
+        estimate = EngagementBuckets.from_sketch(sketch)
+        exact = engagement_buckets(values)
+
+        assert estimate.total == exact.total
+        for approx, actual in zip(estimate.counts, exact.counts):
+            assert abs(approx - actual) <= 0.02 * values.size
+
+    def test_merge_equals_single_sketch(self, values):
+        """Test merging chunk sketches gives the same estimates."""
+        whole = QuantileSketch()
+        whole.update(values)
+        merged = QuantileSketch()
+        for chunk in np.array_split(values, 3):
+            part = QuantileSketch()
+            part.update(chunk)
+            merged.merge(part)
+
+        assert merged.count == whole.count
+        assert merged.quantile(0.9) == whole.quantile(0.9)
+
+    def test_invalid_input(self):
+        """Test negative values and empty sketches are rejected."""
+        sketch = QuantileSketch()
+        with pytest.raises(ValueError, match="empty"):
+            sketch.quantile(0.5)
+        with pytest.raises(ValueError, match="non-negative"):
+            sketch.update([-1])
@@ -1,23 +1,41 @@
 """Tests for data exporters."""
 
 import csv
+import gzip
 import json
+import sqlite3
+import subprocess  # nosec B404
+import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from x_follower_analyzer.exporters.csv_exporter import CSVExporter
+from x_follower_analyzer.exporters.columnar_exporter import ColumnarExporter
+from x_follower_analyzer.exporters.csv_exporter import CSV_COLUMNS, CSVExporter
 from x_follower_analyzer.exporters.exporter_factory import ExporterFactory
-from x_follower_analyzer.exporters.json_exporter import JSONExporter
-from x_follower_analyzer.models.config import OutputFormat
+from x_follower_analyzer.exporters.json_exporter import (
+    JSONExporter,
+    iter_json_followers,
+    read_json,
+)
+from x_follower_analyzer.exporters.live_dashboard_exporter import LiveDashboardExporter
+from x_follower_analyzer.exporters.multi_exporter import MultiExporter
+from x_follower_analyzer.exporters.ndjson_exporter import NDJSONExporter, read_ndjson
+from x_follower_analyzer.exporters.relational_exporter import (
+    TABLE_COLUMNS,
+    RelationalCSVExporter,
+)
+from x_follower_analyzer.exporters.sqlite_exporter import SQLiteExporter
+from x_follower_analyzer.models.config import AnalysisConfig, OutputFormat
 from x_follower_analyzer.models.user import (
     FollowerAnalysis,
     LikedTweet,
     Tweet,
     UserProfile,
 )
+from x_follower_analyzer.utils.compression import open_text
 
 
 @pytest.fixture
@@ -136,6 +154,32 @@ class TestCSVExporter:
             # File should not be created for empty data
             assert not output_file.exists()
 
+    def test_streaming_rows_flushed_before_close(self, sample_analysis):
+        """Test rows written incrementally are on disk before close()."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "stream_output.csv"
+            exporter = CSVExporter(str(output_file))
+
+            exporter.open()
+            exporter.write_analysis(sample_analysis)
+            exporter.write_analysis(sample_analysis)
+
+            with open(output_file, "r", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+
+            exporter.close()
+
+            assert rows[0] == CSV_COLUMNS
+            assert len(rows) == 3
+            assert rows[1][CSV_COLUMNS.index("username")] == "testuser"
+            assert exporter.rows_written == 2
+
+    def test_write_without_open_raises(self, sample_analysis):
+        """Test writing before open() raises an error."""
+        exporter = CSVExporter("unused.csv")
+        with pytest.raises(RuntimeError):
+            exporter.write_analysis(sample_analysis)
+
 
 class TestJSONExporter:
     """Test JSON export functionality."""
@@ -195,6 +239,403 @@ class TestJSONExporter:
                 assert "activity_level" in analysis["classification"]
 
 
+class TestNDJSONExporter:
+    """Test NDJSON export functionality."""
+
+    def test_ndjson_export(self, sample_analysis):
+        """Test one compact record per line after a metadata header."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "test_output.ndjson"
+            NDJSONExporter(str(output_file)).export([sample_analysis, sample_analysis])
+
+            lines = output_file.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 3
+            assert json.loads(lines[0])["metadata"]["export_format"] == "ndjson"
+
+            follower = json.loads(lines[1])
+            assert follower["profile"]["username"] == "testuser"
+            assert len(follower["recent_tweets"]) == 2
+            assert ": " not in lines[1]  # compact separators
+
+    def test_append_and_read(self, sample_analysis):
+        """Test appended runs keep their own headers and read back cleanly."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "appended.ndjson"
+            NDJSONExporter(str(output_file)).export([sample_analysis])
+            NDJSONExporter(str(output_file), append=True).export([sample_analysis])
+
+            lines = output_file.read_text(encoding="utf-8").splitlines()
+            headers = [line for line in lines if "metadata" in json.loads(line)]
+            assert len(headers) == 2
+
+            records = list(read_ndjson(str(output_file)))
+            assert len(records) == 2
+            assert all(r["profile"]["user_id"] == "123456789" for r in records)
+
+
+class TestRelationalCSVExporter:
+    """Test normalized multi-table export functionality."""
+
+    def test_tables_export(self, sample_analysis):
+        """Test every record is preserved in ID-keyed tables."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir) / "tables"
+            exporter = RelationalCSVExporter(str(output_dir))
+            exporter.export([sample_analysis])
+
+            tables = {}
+            for table in TABLE_COLUMNS:
+                with open(output_dir / f"{table}.csv", encoding="utf-8") as f:
+                    reader = csv.DictReader(f)
+                    assert reader.fieldnames == TABLE_COLUMNS[table]
+                    tables[table] = list(reader)
+
+            assert len(tables["followers"]) == 1
+            assert [t["tweet_id"] for t in tables["tweets"]] == ["1001", "1002"]
+            assert tables["tweets"][0]["text"] == "This is a test tweet #test"
+            assert tables["tweets"][0]["created_at"] == "2023-01-01T00:00:00"
+            assert len(tables["liked_tweets"]) == 2
+            assert tables["liked_tweets"][0]["user_id"] == "123456789"
+            assert tables["hashtags"] == [
+                {"tweet_id": "1001", "user_id": "123456789", "hashtag": "test"}
+            ]
+            assert tables["mentions"][0]["mention"] == "friend"
+
+
+class TestSQLiteExporter:
+    """Test SQLite export functionality."""
+
+    def test_sqlite_export(self, sample_analysis):
+        """Test profiles, tweets and likes land in indexed WAL-mode tables."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "test_output.sqlite"
+            SQLiteExporter(str(output_file), batch_size=1).export([sample_analysis])
+
+            conn = sqlite3.connect(output_file)
+            try:
+                journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+                assert journal_mode == "wal"
+
+                follower = conn.execute(
+                    "SELECT username, verified FROM followers WHERE user_id = ?",
+                    ("123456789",),
+                ).fetchone()
+                assert follower == ("testuser", 0)
+
+                assert conn.execute("SELECT COUNT(*) FROM tweets").fetchone()[0] == 2
+                assert (
+                    conn.execute("SELECT COUNT(*) FROM liked_tweets").fetchone()[0] == 2
+                )
+                assert conn.execute(
+                    "SELECT hashtag FROM hashtags WHERE tweet_id = '1001'"
+                ).fetchall() == [("test",)]
+
+                indexes = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index'"
+                    )
+                }
+                assert "idx_tweets_user_id" in indexes
+                assert "idx_hashtags_hashtag" in indexes
+            finally:
+                conn.close()
+
+    def test_batches_flushed_on_close(self, sample_analysis):
+        """Test rows buffered below batch_size are written on close()."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "batched.sqlite"
+            exporter = SQLiteExporter(str(output_file), batch_size=100)
+
+            exporter.open()
+            exporter.write_analysis(sample_analysis)
+            assert exporter.followers_written == 0
+            exporter.close()
+
+            assert exporter.followers_written == 1
+            conn = sqlite3.connect(output_file)
+            try:
+                count = conn.execute("SELECT COUNT(*) FROM followers").fetchone()[0]
+                assert count == 1
+            finally:
+                conn.close()
+
+    def test_commit_interval_makes_rows_visible(self, sample_analysis):
+        """Test due rows are committed and readable before close()."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "streamed.sqlite"
+            exporter = SQLiteExporter(
+                str(output_file), batch_size=100, commit_interval=0
+            )
+
+            exporter.open()
+            try:
+                exporter.write_analysis(sample_analysis)
+                assert exporter.followers_written == 1
+                conn = sqlite3.connect(output_file)
+                try:
+                    count = conn.execute("SELECT COUNT(*) FROM followers").fetchone()
+                    assert count[0] == 1
+                finally:
+                    conn.close()
+            finally:
+                exporter.close()
+
+        with pytest.raises(ValueError):
+            SQLiteExporter("out.sqlite", commit_interval=-1)
+
+
+class TestColumnarExporter:
+    """Test Parquet / Feather export functionality."""
+
+    @pytest.mark.parametrize("file_format", ["parquet", "feather"])
+    def test_columnar_export_types(self, sample_analysis, file_format):
+        """Test typed followers, tweets and likes tables round-trip via pandas."""
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        read = pd.read_parquet if file_format == "parquet" else pd.read_feather
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / f"out.{file_format}"
+            exporter = ColumnarExporter(str(output_file), file_format=file_format)
+            exporter.export([sample_analysis, sample_analysis])
+
+            followers = read(output_file)
+            tweets = read(exporter.table_path("tweets"))
+            liked = read(exporter.table_path("liked_tweets"))
+
+            assert len(followers) == 2
+            assert pd.api.types.is_datetime64_any_dtype(followers["created_at"])
+            assert pd.api.types.is_bool_dtype(followers["verified"])
+            assert len(tweets) == 4
+            assert list(tweets.loc[0, "hashtags"]) == ["test"]
+            assert pd.api.types.is_bool_dtype(tweets["is_retweet"])
+            assert len(liked) == 4
+
+    def test_row_groups(self, sample_analysis):
+        """Test one Parquet row group is written per row_group_size followers."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "groups.parquet"
+            ColumnarExporter(str(output_file), row_group_size=2).export(
+                [sample_analysis] * 5
+            )
+            assert pq.ParquetFile(output_file).metadata.num_row_groups == 3
+
+    def test_invalid_format(self):
+        """Test unsupported columnar formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported columnar format"):
+            ColumnarExporter("out.orc", file_format="orc")
+
+
+class TestCompressedExport:
+    """Test streaming compression across exporters."""
+
+    def test_gzip_csv_from_extension(self, sample_analysis):
+        """Test a .gz file name enables gzip and reads back transparently."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "out.csv.gz"
+            exporter = CSVExporter(str(output_file))
+            exporter.export([sample_analysis])
+
+            assert exporter.compression == "gzip"
+            with gzip.open(output_file, "rt", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            assert rows[0]["username"] == "testuser"
+
+            with open_text(output_file, "r", newline="") as f:
+                assert len(list(csv.DictReader(f))) == 1
+
+    def test_gzip_json_level(self, sample_analysis):
+        """Test explicit compression options and the JSON loader."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "out.json.gz"
+            JSONExporter(
+                str(output_file), compression="gzip", compression_level=9
+            ).export([sample_analysis])
+
+            data = read_json(str(output_file))
+            assert data["followers"][0]["profile"]["username"] == "testuser"
+
+    def test_iter_json_followers(self, tmp_path):
+        """Test follower records stream from a JSON export in small chunks."""
+        from x_follower_analyzer.utils.synthetic import SyntheticFollowers
+
+        output_file = tmp_path / "out.json.gz"
+        JSONExporter(str(output_file)).export(list(SyntheticFollowers(30, seed=2)))
+        expected = read_json(str(output_file))["followers"]
+
+        assert list(iter_json_followers(str(output_file), chunk_size=64)) == expected
+
+        # Other layouts (metadata first) fall back to loading the document
+        reordered = tmp_path / "reordered.json"
+        reordered.write_text(
+            json.dumps({"metadata": {}, "followers": expected}), encoding="utf-8"
+        )
+        assert list(iter_json_followers(str(reordered))) == expected
+
+    def test_zstd_ndjson_append(self, sample_analysis):
+        """Test appended zstd NDJSON runs read back as one record stream."""
+        pytest.importorskip("zstandard")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "out.ndjson.zst"
+            NDJSONExporter(str(output_file)).export([sample_analysis])
+            NDJSONExporter(str(output_file), append=True).export([sample_analysis])
+
+            assert output_file.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+            assert len(list(read_ndjson(str(output_file)))) == 2
+
+    def test_compressed_tables(self, sample_analysis):
+        """Test every normalized table is compressed."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = RelationalCSVExporter(
+                str(Path(temp_dir) / "tables"), compression="gzip"
+            )
+            exporter.export([sample_analysis])
+
+            tweets_path = exporter.table_path("tweets")
+            assert tweets_path.name == "tweets.csv.gz"
+            with open_text(tweets_path, "r", newline="") as f:
+                assert len(list(csv.DictReader(f))) == 2
+
+    def test_compressed_flushes_sync_in_batches(self, tmp_path):
+        """Test flushes sync every N calls and synced rows read back."""
+        import zlib
+
+        output_file = tmp_path / "out.txt.gz"
+        f = open_text(output_file, "w", sync_every=3, sync_interval=3600)
+        for i in range(7):
+            f.write(f"row {i}\n")
+            f.flush()
+        assert f.syncs == 2
+
+        # The stream is still open: only the synced rows are readable
+        partial = zlib.decompressobj(wbits=31).decompress(output_file.read_bytes())
+        assert partial.decode("utf-8").splitlines() == [f"row {i}" for i in range(6)]
+
+        f.close()
+        assert gzip.decompress(output_file.read_bytes()).count(b"\n") == 7
+
+        with open_text(tmp_path / "timed.gz", "w", sync_interval=0) as f:
+            f.write("row\n")
+            f.flush()
+            assert f.syncs == 1
+
+    def test_streamed_compression_ratio(self, tmp_path):
+        """Test per-row flushes do not cost compression ratio."""
+        from x_follower_analyzer.utils.synthetic import SyntheticFollowers
+
+        followers = SyntheticFollowers(3000, seed=3)
+        CSVExporter(str(tmp_path / "out.csv")).export(followers)
+        CSVExporter(str(tmp_path / "out.csv.gz")).export(followers)
+
+        one_shot = gzip.compress((tmp_path / "out.csv").read_bytes(), 6)
+        streamed = (tmp_path / "out.csv.gz").stat().st_size
+        assert streamed < len(one_shot) * 1.02
+
+
+class TestMultiExporter:
+    """Test single-pass multi-format export."""
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    def test_one_pass_feeds_every_sink(self, sample_analysis, concurrent):
+        """Test every sink receives every analysis from one traversal."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_file = Path(temp_dir) / "out.csv"
+            json_file = Path(temp_dir) / "out.json"
+            ndjson_file = Path(temp_dir) / "out.ndjson.gz"
+            exporter = MultiExporter(
+                [
+                    CSVExporter(str(csv_file)),
+                    JSONExporter(str(json_file)),
+                    NDJSONExporter(str(ndjson_file)),
+                ],
+                concurrent=concurrent,
+                queue_size=1,
+            )
+            exporter.export([sample_analysis] * 5)
+
+            with open(csv_file, newline="", encoding="utf-8") as f:
+                assert len(list(csv.DictReader(f))) == 5
+            data = read_json(str(json_file))
+            assert data["metadata"]["total_followers"] == 5
+            assert len(data["followers"]) == 5
+            assert len(list(read_ndjson(str(ndjson_file)))) == 5
+
+    def test_sink_error_is_raised(self, sample_analysis):
+        """Test a failing sink surfaces its error after every sink is closed."""
+
+        class FailingExporter:
+            closed = False
+
+            def open(self):
+                pass
+
+            def write_analysis(self, analysis):
+                raise OSError("disk full")
+
+            def close(self):
+                FailingExporter.closed = True
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_file = Path(temp_dir) / "out.csv"
+            csv_exporter = CSVExporter(str(csv_file))
+            exporter = MultiExporter([csv_exporter, FailingExporter()])
+
+            with pytest.raises(OSError, match="disk full"):
+                exporter.export([sample_analysis] * 3)
+
+            assert FailingExporter.closed
+            assert csv_exporter.rows_written == 3
+
+    def test_open_error_closes_opened_sinks(self):
+        """Test sinks opened before a failing one are closed again."""
+
+        class UnopenableExporter:
+            def open(self):
+                raise PermissionError("read-only directory")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sqlite_exporter = SQLiteExporter(str(Path(temp_dir) / "out.sqlite"))
+            exporter = MultiExporter([sqlite_exporter, UnopenableExporter()])
+
+            with pytest.raises(PermissionError, match="read-only"):
+                exporter.open()
+
+            assert sqlite_exporter._conn is None
+            assert not exporter._is_open
+
+    def test_factory_builds_configured_outputs(self):
+        """Test the factory wires the primary and additional outputs."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = AnalysisConfig(
+                target_username="testuser",
+                output_format=OutputFormat.CSV,
+                output_file=str(Path(temp_dir) / "out.csv"),
+                additional_outputs=[
+                    (OutputFormat.SQLITE, str(Path(temp_dir) / "out.sqlite"))
+                ],
+            )
+            exporter = ExporterFactory.create_multi_exporter(config)
+
+            assert [type(e) for e in exporter.exporters] == [
+                CSVExporter,
+                SQLiteExporter,
+            ]
+
+    def test_factory_adds_live_dashboard(self):
+        """Test a live dashboard port adds a live dashboard sink."""
+        config = AnalysisConfig(
+            target_username="testuser", output_file="out.csv", live_dashboard_port=0
+        )
+        exporter = ExporterFactory.create_multi_exporter(config)
+
+        assert [type(e) for e in exporter.exporters] == [
+            CSVExporter,
+            LiveDashboardExporter,
+        ]
+
+
 class TestExporterFactory:
     """Test exporter factory functionality."""
 
@@ -208,6 +649,62 @@ class TestExporterFactory:
         exporter = ExporterFactory.create_exporter(OutputFormat.JSON, "test.json")
         assert isinstance(exporter, JSONExporter)
 
+    def test_ndjson_factory(self):
+        """Test NDJSON exporter creation."""
+        exporter = ExporterFactory.create_exporter(OutputFormat.NDJSON, "test.ndjson")
+        assert isinstance(exporter, NDJSONExporter)
+
+    def test_tables_factory(self):
+        """Test relational exporter creation."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exporter = ExporterFactory.create_exporter(
+                OutputFormat.TABLES, str(Path(temp_dir) / "out.tables")
+            )
+            assert isinstance(exporter, RelationalCSVExporter)
+
+    def test_sqlite_factory(self):
+        """Test SQLite exporter creation."""
+        exporter = ExporterFactory.create_exporter(OutputFormat.SQLITE, "test.sqlite")
+        assert isinstance(exporter, SQLiteExporter)
+
+    def test_columnar_factory(self):
+        """Test Parquet and Feather exporter creation."""
+        exporter = ExporterFactory.create_exporter(OutputFormat.PARQUET, "t.parquet")
+        assert isinstance(exporter, ColumnarExporter)
+        assert exporter.file_format == "parquet"
+
+        exporter = ExporterFactory.create_exporter(OutputFormat.FEATHER, "t.feather")
+        assert exporter.file_format == "feather"
+
+    def test_compression_rejected_for_binary_formats(self):
+        """Test compression is refused for formats with their own encoding."""
+        with pytest.raises(ValueError, match="Compression is not supported"):
+            ExporterFactory.create_exporter(
+                OutputFormat.SQLITE, "test.sqlite", compression="gzip"
+            )
+
+    def test_text_exporters_skip_plotting_stack(self):
+        """Test creating a CSV exporter does not import visualization libraries."""
+        code = (
+            "import sys;"
+            "from x_follower_analyzer.exporters.exporter_factory import "
+            "ExporterFactory;"
+            "from x_follower_analyzer.models.config import OutputFormat;"
+            "ExporterFactory.create_exporter(OutputFormat.CSV, 'test.csv');"
+            "heavy = ('matplotlib', 'plotly', 'pandas', 'seaborn', 'wordcloud');"
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = subprocess.run(  # nosec B603
+                [sys.executable, "-c", code],
+                cwd=temp_dir,
+                env={"PYTHONPATH": str(Path(__file__).resolve().parent.parent)},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        assert result.stdout.strip() == ""
+
     def test_supported_formats(self):
         """Test getting supported formats."""
         formats = ExporterFactory.get_supported_formats()
@@ -0,0 +1,152 @@
+"""Tests for the shared follower metrics engine."""
+
+from datetime import datetime
+
+import pytest
+
+from x_follower_analyzer.models.user import (
+    FollowerAnalysis,
+    LikedTweet,
+    Tweet,
+    UserProfile,
+)
+from x_follower_analyzer.utils.metrics import MetricsEngine, compute_metrics
+
+
+@pytest.fixture
+def sample_analysis():
+    """Create a follower with a mix of tweets and likes."""
+    profile = UserProfile(
+        user_id="1",
+        username="metrics_user",
+        display_name="Metrics User",
+        followers_count=300,
+        following_count=100,
+    )
+    tweets = [
+        Tweet(
+            tweet_id="t1",
+            user_id="1",
+            text="first",
+            created_at=datetime(2024, 1, 1),
+            retweet_count=4,
+            favorite_count=10,
+            reply_count=1,
+            hashtags=["python", "data"],
+            mentions=["alice"],
+        ),
+        Tweet(
+            tweet_id="t2",
+            user_id="1",
+            text="RT second",
+            created_at=datetime(2024, 1, 2),
+            retweet_count=2,
+            favorite_count=0,
+            is_retweet=True,
+            hashtags=["data"],
+        ),
+    ]
+    liked = [
+        LikedTweet(
+            tweet_id=f"l{i}",
+            original_user_id="9",
+            original_username=author,
+            text="liked",
+            created_at=datetime(2024, 1, 1),
+        )
+        for i, author in enumerate(["bob", "carol", "bob"])
+    ]
+    return FollowerAnalysis(profile=profile, recent_tweets=tweets, liked_tweets=liked)
+
+
+class TestComputeMetrics:
+    """Test per-follower metric computation."""
+
+    def test_engagement_metrics(self, sample_analysis):
+        """Test totals, averages and ratios."""
+        metrics = compute_metrics(sample_analysis)
+
+        assert metrics.recent_tweets_count == 2
+        assert metrics.liked_tweets_count == 3
+        assert metrics.avg_retweets == 3.0
+        assert metrics.avg_favorites == 5.0
+        assert metrics.avg_replies == 0.5
+        assert metrics.avg_engagement == 8.0
+        assert metrics.total_engagement == 17
+        assert metrics.retweet_ratio == 0.5
+        assert metrics.follower_to_following_ratio == 3.0
+
+    def test_frequency_ordering(self, sample_analysis):
+        """Test count mappings are ordered by frequency."""
+        metrics = compute_metrics(sample_analysis)
+
+        assert metrics.top_hashtags(5) == ["data", "python"]
+        assert metrics.top_mentions(5) == ["alice"]
+        assert metrics.top_liked_authors(1) == [("bob", 2)]
+
+    def test_no_tweets(self):
+        """Test followers without tweets get zeroed averages."""
+        analysis = FollowerAnalysis(
+            profile=UserProfile(user_id="2", username="quiet", display_name="Quiet")
+        )
+        metrics = compute_metrics(analysis)
+
+        assert metrics.avg_retweets == 0.0
+        assert metrics.retweet_ratio == 0.0
+        assert metrics.hashtag_counts == {}
+
+
+class TestMetricsEngine:
+    """Test metric memoization."""
+
+    def test_metrics_computed_once(self, sample_analysis):
+        """Test repeated lookups are served from the cache."""
+        engine = MetricsEngine()
+
+        first = engine.get(sample_analysis)
+        second = engine.get(sample_analysis)
+
+        assert first is second
+        assert engine.misses == 1
+        assert engine.hits == 1
+
+    def test_lru_eviction(self, sample_analysis):
+        """Test the least recently used follower is evicted first."""
+        engine = MetricsEngine(max_entries=2)
+        others = [
+            FollowerAnalysis(
+                profile=UserProfile(user_id=str(i), username=f"u{i}", display_name="")
+            )
+            for i in range(2)
+        ]
+
+        engine.get(sample_analysis)
+        engine.get(others[0])
+        engine.get(sample_analysis)
+        engine.get(others[1])
+
+        assert len(engine) == 2
+        engine.get(sample_analysis)
+        assert engine.hits == 2
+
+    def test_get_many_batches_topics(self, sample_analysis):
+        """Test batch lookups match single lookups and fill the cache."""
+        sample_analysis.liked_tweets[0].text = "AIで看護を学ぶ講座"
+        engine = MetricsEngine()
+
+        (metrics,) = engine.get_many([sample_analysis])
+
+        assert metrics == compute_metrics(sample_analysis)
+        assert metrics.top_liked_topics(2) == ["医療・看護", "教育・学習"]
+        assert engine.get(sample_analysis) is metrics
+
+    def test_invalidate(self, sample_analysis):
+        """Test invalidated followers are recomputed."""
+        engine = MetricsEngine()
+        engine.get(sample_analysis)
+
+        sample_analysis.recent_tweets.pop()
+        engine.invalidate(sample_analysis)
+
+        assert engine.get(sample_analysis).recent_tweets_count == 1
+        assert engine.misses == 2
@@ -104,6 +104,9 @@ class TestLikedTweet:
         assert liked_tweet.original_user_id == "987654321"
         assert liked_tweet.original_username == "original_user"
         assert liked_tweet.text == "This is a liked tweet"
+        # Engagement counts are unknown unless collected
+        assert liked_tweet.retweet_count is None
+        assert liked_tweet.favorite_count is None
 
 
 class TestFollowerAnalysis:
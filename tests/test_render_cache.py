@@ -0,0 +1,98 @@
+"""Tests for the on-disk chart render cache."""
+
+import os
+import tempfile
+
+import pytest
+
+from x_follower_analyzer.models.user import FollowerAnalysis, UserProfile
+from x_follower_analyzer.visualization.render_cache import (
+    LayoutCache,
+    RenderCache,
+    analyses_digest,
+)
+
+
+class TestRenderCache:
+    """Test render cache storage and eviction."""
+
+    def test_put_and_get(self):
+        """Test stored charts are served until cleared."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RenderCache(temp_dir)
+            key = RenderCache.key("chart", {"a": 1}, dpi=300)
+
+            assert cache.get(key) is None
+            cache.put_base64(key, "iVBORw0K")
+
+            assert cache.get_base64(key) == "iVBORw0K"
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            cache.clear()
+            assert len(cache) == 0
+
+    def test_key_covers_data_and_params(self):
+        """Test keys change with the data and every render parameter."""
+        key = RenderCache.key("chart", {"a": 1}, style="s", figsize=(12, 8), dpi=300)
+
+        assert key == RenderCache.key(
+            "chart", {"a": 1}, dpi=300, figsize=(12, 8), style="s"
+        )
+        assert key != RenderCache.key(
+            "chart", {"a": 2}, style="s", figsize=(12, 8), dpi=300
+        )
+        assert key != RenderCache.key(
+            "chart", {"a": 1}, style="s", figsize=(12, 8), dpi=72
+        )
+        assert key != RenderCache.key(
+            "other", {"a": 1}, style="s", figsize=(12, 8), dpi=300
+        )
+
+    def test_lru_eviction(self):
+        """Test the least recently read entry is evicted first."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RenderCache(temp_dir, max_entries=2)
+            cache.put("first", b"1")
+            cache.put("second", b"2")
+            os.utime(cache.path("first"), ns=(1, 1))
+            os.utime(cache.path("second"), ns=(2, 2))
+
+            cache.get("first")
+            cache.put("third", b"3")
+
+            assert len(cache) == 2
+            assert cache.get("second") is None
+            assert cache.get("first") == b"1"
+
+    def test_layout_cache(self):
+        """Test layouts round-trip as JSON beside cached images."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layouts = LayoutCache(temp_dir)
+            images = RenderCache(temp_dir)
+            layouts.put_layout("key", [[["word", 1.0], 40, [0, 8], None, "red"]])
+            images.put("key", b"png")
+
+            assert layouts.get_layout("key") == [
+                [["word", 1.0], 40, [0, 8], None, "red"]
+            ]
+            assert (len(layouts), len(images)) == (1, 1)
+
+    def test_invalid_max_entries(self):
+        """Test a non-positive capacity is rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError, match="max_entries"):
+                RenderCache(temp_dir, max_entries=0)
+
+
+def test_analyses_digest_tracks_data():
+    """Test the analyses digest changes when any follower changes."""
+    analyses = [
+        FollowerAnalysis(
+            profile=UserProfile(user_id="1", username="u1", display_name="U1")
+        )
+    ]
+    digest = analyses_digest(analyses)
+
+    assert digest == analyses_digest(analyses)
+    analyses[0].profile.followers_count = 10
+    assert digest != analyses_digest(analyses)
@@ -0,0 +1,86 @@
+"""Tests for the synthetic follower generator."""
+
+import numpy as np
+import pytest
+
+from x_follower_analyzer.exporters.ndjson_exporter import NDJSONExporter, read_ndjson
+from x_follower_analyzer.utils.synthetic import DEFAULT_END, SyntheticFollowers
+
+
+class TestSyntheticFollowers:
+    """Test seeded, chunked synthetic followers."""
+
+    def test_seeded_and_reproducible(self):
+        """Test a seed always yields the same followers."""
+
+        def snapshot(followers):
+            return [
+                (
+                    a.profile.username,
+                    a.profile.followers_count,
+                    [(t.text, t.created_at) for t in a.recent_tweets],
+                    [like.tweet_id for like in a.liked_tweets],
+                )
+                for a in followers
+            ]
+
+        first = snapshot(SyntheticFollowers(50, seed=7, chunk_size=20))
+        assert first == snapshot(SyntheticFollowers(50, seed=7, chunk_size=20))
+        assert first != snapshot(SyntheticFollowers(50, seed=8, chunk_size=20))
+
+    def test_chunks(self):
+        """Test followers arrive in bounded chunks with unique ids."""
+        followers = SyntheticFollowers(25, chunk_size=10)
+
+        chunks = list(followers.chunks())
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert len(followers) == 25
+        user_ids = [a.profile.user_id for chunk in chunks for a in chunk]
+        assert len(set(user_ids)) == 25
+
+        tweet_ids = [
+            t.tweet_id for chunk in chunks for a in chunk for t in a.recent_tweets
+        ]
+        assert len(set(tweet_ids)) == len(tweet_ids)
+
+    def test_distributions(self):
+        """Test counts are capped, heavy-tailed and in both languages."""
+        analyses = list(SyntheticFollowers(5000, seed=1, max_tweets=5, max_likes=8))
+        followers = np.array([a.profile.followers_count for a in analyses])
+        tweets = [t for a in analyses for t in a.recent_tweets]
+
+        assert max(len(a.recent_tweets) for a in analyses) == 5
+        assert max(len(a.liked_tweets) for a in analyses) == 8
+        assert any(not a.recent_tweets for a in analyses)
+        # Heavy tail: the largest accounts dwarf the typical one
+        assert followers.max() > 100 * np.median(followers)
+        assert all(t.created_at < DEFAULT_END for t in tweets)
+        assert all(
+            like.created_at <= like.liked_at
+            for a in analyses
+            for like in a.liked_tweets
+        )
+
+        japanese = [a for a in analyses if a.profile.username.startswith("jp_")]
+        assert 0.4 < len(japanese) / len(analyses) < 0.6
+        assert any("の" in t.text for a in japanese for t in a.recent_tweets)
+        assert all(f"#{tag}" in t.text for t in tweets for tag in t.hashtags)
+
+    def test_invalid_arguments(self):
+        """Test out-of-range settings are rejected."""
+        with pytest.raises(ValueError):
+            SyntheticFollowers(-1)
+        with pytest.raises(ValueError):
+            SyntheticFollowers(10, chunk_size=0)
+        with pytest.raises(ValueError):
+            SyntheticFollowers(10, japanese_share=1.5)
+
+    def test_streams_into_exporter(self, tmp_path):
+        """Test an exporter consumes the generator without a list."""
+        output_file = tmp_path / "followers.ndjson.gz"
+
+        NDJSONExporter(str(output_file)).export(SyntheticFollowers(120, chunk_size=50))
+
+        records = list(read_ndjson(str(output_file)))
+        assert len(records) == 120
+        assert records[-1]["profile"]["user_id"] == "120"
@@ -0,0 +1,78 @@
+"""Tests for liked-tweet topic classification."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from x_follower_analyzer.utils.topics import (
+    DEFAULT_TOPIC_TAXONOMY,
+    TAXONOMY_ENV_VAR,
+    TopicClassifier,
+    load_taxonomy,
+)
+
+
+class TestTopicClassifier:
+    """Test compiled topic matching."""
+
+    def test_counts_distinct_keywords_per_text(self):
+        """Test each keyword scores once per text, case-insensitively."""
+        classifier = TopicClassifier()
+        scores = classifier.classify("ai と DX で看護師の転職。医療、医療")
+
+        assert scores == {"医療・看護": 2, "副業・転職": 1, "IT・テック": 2}
+
+    def test_overlapping_keywords(self):
+        """Test keywords nested inside longer keywords are all found."""
+        classifier = TopicClassifier({"short": ["ab", "b"], "long": ["abc"]})
+
+        assert classifier.classify("xABCx") == {"short": 2, "long": 1}
+
+    def test_batch_matches_individual_classification(self):
+        """Test one batch scan gives the same scores as per-group scans."""
+        classifier = TopicClassifier()
+        groups = [["AIの講座", "旅行とグルメ"], [], ["病院", "病院"], ["nothing"]]
+
+        batch = classifier.classify_batch(groups)
+
+        assert batch == [classifier.classify_texts(group) for group in groups]
+        assert batch[2] == {"医療・看護": 2}
+        assert batch[3] == {}
+
+    def test_rank(self):
+        """Test ranking by score with ties in taxonomy order."""
+        scores = {"医療・看護": 1, "IT・テック": 3, "ビジネス": 1}
+        assert TopicClassifier.rank(scores) == ["IT・テック", "医療・看護", "ビジネス"]
+
+    def test_empty_taxonomy(self):
+        """Test a classifier without keywords matches nothing."""
+        assert TopicClassifier({}).classify("anything") == {}
+
+
+class TestLoadTaxonomy:
+    """Test taxonomy loading."""
+
+    def test_default_taxonomy(self, monkeypatch):
+        """Test the built-in taxonomy is used without configuration."""
+        monkeypatch.delenv(TAXONOMY_ENV_VAR, raising=False)
+        assert load_taxonomy() == DEFAULT_TOPIC_TAXONOMY
+
+    def test_taxonomy_from_env(self, monkeypatch):
+        """Test the taxonomy file named by the environment is loaded."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "topics.json"
+            path.write_text(json.dumps({"料理": ["レシピ"]}), encoding="utf-8")
+            monkeypatch.setenv(TAXONOMY_ENV_VAR, str(path))
+
+            assert load_taxonomy() == {"料理": ["レシピ"]}
+
+    def test_invalid_taxonomy(self):
+        """Test malformed taxonomy files raise errors."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "topics.json"
+            path.write_text(json.dumps({"料理": "レシピ"}), encoding="utf-8")
+
+            with pytest.raises(ValueError, match="Invalid topic taxonomy"):
+                load_taxonomy(str(path))
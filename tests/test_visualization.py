@@ -1,15 +1,57 @@
 """Tests for visualization functionality."""
 
+import base64
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
-from x_follower_analyzer.models.user import FollowerAnalysis, UserProfile, Tweet
-from x_follower_analyzer.visualization.charts import ChartGenerator
-from x_follower_analyzer.visualization.dashboard import DashboardGenerator
 from x_follower_analyzer.exporters.dashboard_exporter import DashboardExporter
+from x_follower_analyzer.exporters.live_dashboard_exporter import LiveDashboardExporter
+from x_follower_analyzer.models.config import RenderProfile
+from x_follower_analyzer.models.user import (
+    FollowerAnalysis,
+    LikedTweet,
+    Tweet,
+    UserProfile,
+)
+from x_follower_analyzer.visualization.activity import (
+    PostingSlot,
+    activity_heatmap,
+    best_posting_times,
+    infer_utc_offset,
+    read_tweet_timestamps,
+    tweet_timestamps,
+)
+from x_follower_analyzer.visualization.aggregates import DashboardAggregates
+from x_follower_analyzer.visualization.charts import (
+    STATIC_CHARTS,
+    WORDCLOUD_MAX_WORDS,
+    ChartGenerator,
+    hashtag_payload,
+    location_payload,
+    render_hashtag_wordcloud,
+)
+from x_follower_analyzer.visualization.dashboard import DashboardGenerator
+from x_follower_analyzer.visualization.density import (
+    DENSITY_BINS,
+    OUTLIER_POINTS,
+    outlier_indices,
+    scatter_density,
+)
+from x_follower_analyzer.visualization.explorer import CHARTS as EXPLORER_CHARTS
+from x_follower_analyzer.visualization.explorer import (
+    MAX_PER_PAGE,
+    FollowerExplorer,
+    FollowerTable,
+    load_snapshot,
+)
+from x_follower_analyzer.visualization.follower_charts import FollowerAnalysisCharts
+from x_follower_analyzer.visualization.live import LiveDashboard
+from x_follower_analyzer.visualization.output import ChartOutput
+from x_follower_analyzer.visualization.render_cache import LayoutCache, RenderCache
 
 
 class TestChartGenerator:
@@ -81,6 +123,112 @@ class TestChartGenerator:
         assert isinstance(chart_data, str)
         assert len(chart_data) > 0
 
+    def test_static_charts_in_worker_processes(self, sample_analyses):
+        """Test parallel rendering matches the single-chart API."""
+        generator = ChartGenerator(max_workers=2)
+        charts = generator.create_static_charts(sample_analyses)
+
+        assert list(charts) == list(STATIC_CHARTS)
+        assert all(isinstance(chart, str) and chart for chart in charts.values())
+
+    def test_static_charts_served_from_render_cache(self, sample_analyses):
+        """Test unchanged charts are served from the cache, changed ones re-rendered."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RenderCache(temp_dir)
+            generator = ChartGenerator(render_cache=cache)
+            first = generator.create_static_charts(sample_analyses)
+            assert (cache.hits, len(cache)) == (0, len(STATIC_CHARTS))
+
+            sample_analyses[0].profile.location = "Tokyo"
+            with patch(
+                "x_follower_analyzer.visualization.charts.render_chart",
+                side_effect=AssertionError("unexpected render"),
+            ):
+                charts = generator.render_charts(
+                    {
+                        name: STATIC_CHARTS[name][0](sample_analyses)
+                        for name in ("verification", "engagement")
+                    }
+                )
+            assert charts == {
+                "verification": first["verification"],
+                "engagement": first["engagement"],
+            }
+
+            generator.create_location_analysis_chart(sample_analyses)
+            assert len(cache) == len(STATIC_CHARTS) + 1
+
+    def test_render_profiles(self, sample_analyses):
+        """Test render profiles set the image resolution."""
+        sizes = {}
+        for profile in (RenderProfile.PREVIEW, RenderProfile.PRINT):
+            generator = ChartGenerator(render_profile=profile)
+            chart = generator.create_verification_pie_chart(sample_analyses)
+            sizes[profile] = len(base64.b64decode(chart))
+
+        assert sizes[RenderProfile.PREVIEW] < sizes[RenderProfile.PRINT] / 4
+
+    def test_chart_outputs(self, sample_analyses):
+        """Test charts can be returned as bytes, base64 or written to a file."""
+        generator = ChartGenerator()
+        png = generator.create_verification_pie_chart(
+            sample_analyses, ChartOutput.BYTES
+        )
+        assert png.startswith(b"\x89PNG")
+        assert base64.b64decode(
+            generator.create_verification_pie_chart(sample_analyses)
+        ).startswith(b"\x89PNG")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "charts" / "verification.png"
+            result = generator.create_verification_pie_chart(sample_analyses, path)
+            assert result == path
+            assert path.read_bytes().startswith(b"\x89PNG")
+
+    def test_static_charts_to_directory(self, sample_analyses):
+        """Test rendering every static chart straight to files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            charts = ChartGenerator().create_static_charts(sample_analyses, temp_dir)
+
+            assert charts == {
+                name: Path(temp_dir) / f"{name}.png" for name in STATIC_CHARTS
+            }
+            assert all(path.stat().st_size > 0 for path in charts.values())
+
+    def test_chart_payloads_are_compact(self, sample_analyses):
+        """Test payloads hold aggregated data, not the analyses themselves."""
+        assert hashtag_payload(sample_analyses) == {
+            "hashtag_counts": {"tech": 3, "ai": 3, "crypto": 2}
+        }
+        assert location_payload(sample_analyses) == {
+            "top_locations": [("San Francisco", 3), ("New York", 2)]
+        }
+
+    def test_hashtag_payload_keeps_top_words(self, sample_analyses):
+        """Test the word cloud payload is the top-N frequency table."""
+        sample_analyses[0].recent_tweets[0].hashtags = [
+            f"tag{i}" for i in range(WORDCLOUD_MAX_WORDS + 20)
+        ]
+        hashtag_counts = hashtag_payload(sample_analyses)["hashtag_counts"]
+
+        assert len(hashtag_counts) == WORDCLOUD_MAX_WORDS
+        assert hashtag_counts["tech"] == 2  # user_0 no longer tags it
+
+    def test_wordcloud_layout_cache(self, sample_analyses):
+        """Test a cached layout is reused and draws the same image."""
+        payload = hashtag_payload(sample_analyses)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            layout_cache = LayoutCache(temp_dir)
+            first = render_hashtag_wordcloud(payload, layout_cache=layout_cache)
+            with patch(
+                "wordcloud.WordCloud.generate_from_frequencies",
+                side_effect=AssertionError("layout recomputed"),
+            ):
+                second = render_hashtag_wordcloud(payload, layout_cache=layout_cache)
+
+            assert len(layout_cache) == 1
+        assert second == first
+
     def test_interactive_dashboard_data(self, sample_analyses):
         """Test interactive dashboard data generation."""
         generator = ChartGenerator()
@@ -91,6 +239,148 @@ class TestChartGenerator:
         assert "followers_count" in data[0]
 
 
+class TestFollowerAnalysisCharts:
+    """Test requirement report rendering."""
+
+    @pytest.fixture
+    def sample_analyses(self):
+        """Create a few followers with tweets."""
+        from datetime import datetime
+
+        return [
+            FollowerAnalysis(
+                profile=UserProfile(
+                    user_id=str(i),
+                    username=f"user_{i}",
+                    display_name=f"User {i}",
+                    followers_count=100 * (i + 1),
+                    following_count=50,
+                    location="Tokyo, Japan" if i % 2 else None,
+                ),
+                recent_tweets=[
+                    Tweet(
+                        tweet_id=f"{i}_1",
+                        user_id=str(i),
+                        text=f"tweet {i}",
+                        created_at=datetime(2024, 1, 1, i),
+                        retweet_count=i,
+                        favorite_count=2 * i,
+                    )
+                ],
+            )
+            for i in range(4)
+        ]
+
+    def test_requirement_report(self, sample_analyses):
+        """Test charts are rendered across processes with timings."""
+        charts = ["geographic_insights", "comprehensive_summary"]
+        report = FollowerAnalysisCharts().create_requirement_report(
+            sample_analyses, target_username="target", charts=charts, max_workers=2
+        )
+
+        assert report.errors == {}
+        assert list(report.charts) == charts
+        assert all(report.charts[name] for name in charts)
+        assert set(report.timings) == set(charts)
+        assert report.total_seconds > 0
+        assert "total (wall clock)" in report.format_timings()
+
+    def test_requirement_report_render_cache(self, sample_analyses):
+        """Test a repeated report is served from the render cache."""
+        charts = ["geographic_insights", "comprehensive_summary"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            chart_generator = FollowerAnalysisCharts(render_cache=RenderCache(temp_dir))
+            first = chart_generator.create_requirement_report(
+                sample_analyses, target_username="target", charts=charts
+            )
+            second = chart_generator.create_requirement_report(
+                sample_analyses, target_username="target", charts=charts
+            )
+            renamed = chart_generator.create_requirement_report(
+                sample_analyses, target_username="other", charts=charts
+            )
+
+        assert first.cached == []
+        assert second.cached == charts
+        assert second.charts == first.charts
+        assert "(cached)" in second.format_timings()
+        assert renamed.cached == ["geographic_insights"]
+
+    def test_chart_methods_use_render_cache(self, sample_analyses):
+        """Test charts created directly are served from the render cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RenderCache(temp_dir)
+            chart_generator = FollowerAnalysisCharts(render_cache=cache)
+            first = chart_generator.create_geographic_insights(sample_analyses)
+            with patch.object(
+                FollowerAnalysisCharts, "_draw_geographic_insights"
+            ) as draw:
+                second = chart_generator.create_geographic_insights(sample_analyses)
+                report = chart_generator.create_requirement_report(
+                    sample_analyses, charts=["geographic_insights"]
+                )
+
+        assert draw.call_count == 0
+        assert second == first
+        assert report.cached == ["geographic_insights"]
+        assert cache.hits == 2
+
+    def test_requirement_report_outputs(self, sample_analyses):
+        """Test report charts can be returned as bytes or written to files."""
+        chart_generator = FollowerAnalysisCharts()
+        charts = ["geographic_insights"]
+        report = chart_generator.create_requirement_report(
+            sample_analyses, charts=charts, output=ChartOutput.BYTES
+        )
+        assert report.charts["geographic_insights"].startswith(b"\x89PNG")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = chart_generator.create_requirement_report(
+                sample_analyses, charts=charts, output=temp_dir
+            )
+            path = Path(temp_dir) / "geographic_insights.png"
+            assert report.charts == {"geographic_insights": path}
+            assert path.read_bytes().startswith(b"\x89PNG")
+
+    def test_likes_chart_without_liked_tweet_counts(self, sample_analyses):
+        """Test uncollected liked-tweet counts are marked, not plotted as 0."""
+        from datetime import datetime
+
+        sample_analyses[0].liked_tweets = [
+            LikedTweet(
+                tweet_id="l1",
+                original_user_id="9",
+                original_username="author",
+                text="liked tweet",
+                created_at=datetime(2024, 1, 1),
+            )
+        ]
+        chart_generator = FollowerAnalysisCharts()
+        with patch.object(
+            FollowerAnalysisCharts,
+            "_mark_not_collected",
+            wraps=FollowerAnalysisCharts._mark_not_collected,
+        ) as mark_not_collected:
+            report = chart_generator.create_requirement_report(
+                sample_analyses, charts=["likes_collection"]
+            )
+            assert mark_not_collected.call_count == 2
+
+            sample_analyses[0].liked_tweets[0].favorite_count = 120
+            assert chart_generator.create_likes_collection_analysis(sample_analyses)
+            assert mark_not_collected.call_count == 2
+
+        assert report.errors == {}
+        assert report.charts["likes_collection"]
+
+    def test_unknown_chart(self, sample_analyses):
+        """Test unknown chart names are rejected."""
+        with pytest.raises(ValueError, match="Unknown requirement chart"):
+            FollowerAnalysisCharts().create_requirement_report(
+                sample_analyses, charts=["nope"]
+            )
+
+
 class TestDashboardGenerator:
     """Test dashboard generation functionality."""
 
@@ -141,6 +431,98 @@ class TestDashboardGenerator:
             assert "X Follower Analysis Dashboard" in content
             assert "test_user" in content
             assert "Total Followers Analyzed" in content
+            assert "Best times to post (UTC)" in content
+
+    def test_dashboard_local_time(self, sample_analyses, tmp_path):
+        """Test the local time option reaches the heatmap and best times."""
+        from x_follower_analyzer.visualization.charts import aggregate_chart_payloads
+
+        generator = DashboardGenerator(local_time=True)
+        with patch(
+            "x_follower_analyzer.visualization.dashboard.aggregate_chart_payloads",
+            wraps=aggregate_chart_payloads,
+        ) as payloads:
+            output_path = generator.generate_dashboard(
+                analyses=sample_analyses,
+                target_username="test_user",
+                output_path=str(tmp_path / "dashboard.html"),
+            )
+
+        (aggregates,), _ = payloads.call_args
+        assert aggregates.local_time
+        content = Path(output_path).read_text()
+        assert "Best times to post (followers' local time)" in content
+
+    def test_dashboard_with_shared_assets(self, sample_analyses):
+        """Test asset mode links charts and one shared plotly.js copy."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asset_dir = Path(temp_dir) / "assets"
+            generator = DashboardGenerator(asset_dir=str(asset_dir))
+            for target in ("first", "second"):
+                generator.generate_dashboard(
+                    analyses=sample_analyses,
+                    target_username=target,
+                    output_path=str(Path(temp_dir) / "reports" / f"{target}.html"),
+                )
+
+            content = (Path(temp_dir) / "reports" / "first.html").read_text()
+            assert "data:image/png;base64" not in content
+            assert 'src="../assets/charts/follower_distribution-' in content
+            assert 'loading="lazy"' in content
+            assert len(content) < 100_000
+
+            (plotly_js,) = asset_dir.glob("plotly-*.min.js")
+            assert f'<script src="../assets/{plotly_js.name}"' in content
+            # Both reports show the same data, so identical charts are shared
+            charts = asset_dir / "charts"
+            assert len(list(charts.glob("follower_distribution-*.png"))) == 1
+            assert len(list(charts.glob("*.png"))) < 12
+
+    def test_large_scatter_plots_are_aggregated(self):
+        """Test big audiences get a density grid plus outlier points."""
+        index = np.arange(1000)
+        columns = {"x": index % 100, "y": (index * 7) % 50, "c": index}
+        kwargs = dict(
+            x_key="x",
+            y_key="y",
+            color_key="c",
+            colorscale="Viridis",
+            colorbar_title="C",
+            size=8,
+            hover=lambda i: f"u{i}",
+            name="Users",
+        )
+
+        first_ten = {name: values[:10] for name, values in columns.items()}
+        (small,) = DashboardGenerator._scatter_traces(first_ten, **kwargs)
+        assert small.type == "scatter"
+        assert list(small.text) == [f"u{i}" for i in range(10)]
+
+        with patch(
+            "x_follower_analyzer.visualization.dashboard.AGGREGATE_MIN_POINTS", 500
+        ):
+            density, outliers = DashboardGenerator._scatter_traces(columns, **kwargs)
+        assert density.type == "heatmap"
+        assert outliers.type == "scattergl"
+        assert 0 < len(outliers.x) < len(index)
+        assert outliers.text[0] == f"u{outliers.marker.color[0]}"
+
+    def test_scatter_density(self):
+        """Test the log-spaced 2D histogram counts every point."""
+        density = scatter_density([0, 1, 10, 1000], [5, 5, 5, 0], bins=4)
+
+        assert density.counts.shape == (4, 4)
+        assert density.counts.sum() == 4
+        assert density.x_edges[0] == 0
+        assert density.x_edges[-1] == pytest.approx(1000)
+
+    def test_outlier_indices(self):
+        """Test the most extreme points are kept, farthest first."""
+        x = [10] * 50 + [100000, 10]
+        y = [20] * 50 + [20, 90000]
+
+        assert list(outlier_indices(x, y, n=2)) in ([50, 51], [51, 50])
+        assert list(outlier_indices(x[:3], y[:3], n=5)) == [0, 1, 2]
 
 
 class TestDashboardExporter:
@@ -187,3 +569,577 @@ class TestDashboardExporter:
 
             # Should handle empty list gracefully
             exporter.export([], target_username="test_user")
+
+
+class TestJapaneseFonts:
+    """Test one-time Japanese font resolution."""
+
+    def test_fonts_resolved_once_across_threads(self, monkeypatch):
+        """Test concurrent chart generators share one font lookup."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from x_follower_analyzer.visualization import fonts
+
+        monkeypatch.setattr(fonts, "_fonts", None)
+        with patch.object(
+            fonts, "_resolve_japanese_fonts", return_value=["IPAexGothic"]
+        ) as resolve:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: fonts.japanese_fonts(), range(8)))
+
+        assert resolve.call_count == 1
+        assert results == [["IPAexGothic"]] * 8
+
+    def test_apply_japanese_fonts(self, monkeypatch):
+        """Test only installed fonts are configured, with a fallback."""
+        import matplotlib.pyplot as plt
+
+        from x_follower_analyzer.visualization import fonts
+
+        monkeypatch.setattr(fonts, "_fonts", ["Noto Sans CJK JP"])
+        with plt.rc_context():
+            FollowerAnalysisCharts()
+
+            assert plt.rcParams["font.sans-serif"] == [
+                "Noto Sans CJK JP",
+                "DejaVu Sans",
+            ]
+            assert plt.rcParams["axes.unicode_minus"] is False
+
+
+class TestLiveDashboard:
+    """Test the incrementally updated live dashboard."""
+
+    @pytest.fixture
+    def sample_analyses(self):
+        """Create sample analysis data for testing."""
+        from datetime import datetime
+
+        analyses = []
+        for i in range(4):
+            profile = UserProfile(
+                user_id=str(i),
+                username=f"user_{i}",
+                display_name=f"User {i}",
+                followers_count=10**i,
+                verified=i == 0,
+                location="Tokyo" if i < 3 else None,
+            )
+            tweets = [
+                Tweet(
+                    tweet_id=f"{i}_{j}",
+                    user_id=str(i),
+                    text="tweet",
+                    created_at=datetime(2024, 1, 1, 9 + j),
+                    hashtags=["python"],
+                )
+                for j in range(i)
+            ]
+            analyses.append(FollowerAnalysis(profile=profile, recent_tweets=tweets))
+        return analyses
+
+    def test_aggregates(self, sample_analyses):
+        """Test one pass gathers every dashboard statistic."""
+        aggregates = DashboardAggregates.from_analyses(sample_analyses)
+
+        stats = aggregates.summary_stats()
+        del stats["analysis_date"]
+        assert stats == {
+            "total_followers": 4,
+            "verified_count": 1,
+            "verification_rate": 25.0,
+            "avg_followers": 277,
+            "unique_locations": 1,
+            "total_tweets_analyzed": 6,
+            "unique_hashtags": 1,
+        }
+
+        labels, counts = aggregates.follower_distribution()
+        assert sum(counts) == 4
+        assert labels[0] == "0+"
+        assert aggregates.top_locations() == [("Tokyo", 3)]
+        assert aggregates.top_hashtags() == [("python", 6)]
+        assert aggregates.activity_distribution() == ([0, 1, 2, 3], [1, 1, 1, 1])
+        assert aggregates.tweet_hours[9:12].tolist() == [3, 2, 1]
+        assert aggregates.unknown_locations == 1
+
+        followers = aggregates.follower_columns()
+        assert followers["username"].tolist() == [f"user_{i}" for i in range(4)]
+        assert followers["recent_tweets_count"].tolist() == [0, 1, 2, 3]
+
+    def test_aggregates_merge_shards(self, sample_analyses):
+        """Test merged shard aggregates equal one pass over every follower."""
+        whole = DashboardAggregates.from_analyses(sample_analyses)
+        merged = DashboardAggregates.from_analyses(sample_analyses[:1])
+        merged.merge(DashboardAggregates.from_analyses(sample_analyses[1:]))
+
+        expected, stats = whole.summary_stats(), merged.summary_stats()
+        del expected["analysis_date"], stats["analysis_date"]
+        assert stats == expected
+        assert merged.locations == whole.locations
+        assert merged.follower_distribution() == whole.follower_distribution()
+        assert merged.tweet_hours.tolist() == whole.tweet_hours.tolist()
+        for name, values in whole.follower_columns().items():
+            assert merged.follower_columns()[name].tolist() == values.tolist()
+
+        with pytest.raises(ValueError):
+            merged.merge(DashboardAggregates(keep_followers=False))
+        with pytest.raises(ValueError):
+            DashboardAggregates(keep_followers=False).follower_columns()
+
+    def test_aggregate_chart_payloads(self):
+        """Test one aggregates pass yields every static chart payload."""
+        from x_follower_analyzer.utils.synthetic import SyntheticFollowers
+        from x_follower_analyzer.visualization import aggregates as aggregates_module
+        from x_follower_analyzer.visualization.charts import (
+            STATIC_CHARTS,
+            aggregate_chart_payloads,
+        )
+
+        analyses = list(SyntheticFollowers(300, seed=5))
+        # Small batches: tweet times are binned several times along the way
+        with patch.object(aggregates_module, "TWEET_TIME_BATCH", 100):
+            aggregates = DashboardAggregates.from_analyses(analyses)
+
+        assert aggregate_chart_payloads(aggregates) == {
+            name: extract(analyses) for name, (extract, _) in STATIC_CHARTS.items()
+        }
+
+    def test_aggregate_local_time_heatmap(self):
+        """Test local-time aggregates match the local heatmap payload."""
+        from x_follower_analyzer.utils.synthetic import SyntheticFollowers
+        from x_follower_analyzer.visualization import aggregates as aggregates_module
+        from x_follower_analyzer.visualization.charts import (
+            activity_heatmap_payload,
+            aggregate_chart_payloads,
+        )
+
+        analyses = list(SyntheticFollowers(300, seed=5))
+        with patch.object(aggregates_module, "TWEET_TIME_BATCH", 100):
+            aggregates = DashboardAggregates.from_analyses(analyses, local_time=True)
+            merged = DashboardAggregates.from_analyses(analyses[:120], local_time=True)
+            merged.merge(
+                DashboardAggregates.from_analyses(analyses[120:], local_time=True)
+            )
+
+        payloads = aggregate_chart_payloads(aggregates)
+        assert payloads["activity_heatmap"] == activity_heatmap_payload(analyses, True)
+        assert payloads["activity_heatmap"] != activity_heatmap_payload(analyses)
+        assert (merged.local_tweet_heatmap == aggregates.local_tweet_heatmap).all()
+        # The hourly timeline stays in UTC
+        assert payloads["activity_timeline"] == {
+            "hour_counts": aggregates.tweet_heatmap.sum(axis=0).tolist()
+        }
+
+        with pytest.raises(ValueError):
+            DashboardAggregates().local_tweet_heatmap
+        with pytest.raises(ValueError):
+            merged.merge(DashboardAggregates())
+
+    def test_server_streams_updates(self, sample_analyses):
+        """Test the page, data snapshots and 304 answers of the live server."""
+        import json
+        import urllib.error
+        import urllib.request
+
+        dashboard = LiveDashboard(target_username="target", port=0)
+        url = dashboard.start()
+        try:
+            with urllib.request.urlopen(url) as response:  # nosec B310
+                assert "@target" in response.read().decode("utf-8")
+
+            dashboard.add(sample_analyses[0])
+            with urllib.request.urlopen(url + "data.json") as response:  # nosec
+                etag = response.headers["ETag"]
+                data = json.loads(response.read())
+            assert data["stats"]["total_followers"] == "1"
+            assert len(data["figure"]["data"]) == 6
+
+            request = urllib.request.Request(
+                url + "data.json", headers={"If-None-Match": etag}
+            )
+            with pytest.raises(urllib.error.HTTPError) as not_modified:
+                urllib.request.urlopen(request)  # nosec B310
+            assert not_modified.value.code == 304
+
+            for analysis in sample_analyses[1:]:
+                dashboard.add(analysis)
+            with urllib.request.urlopen(request) as response:  # nosec B310
+                data = json.loads(response.read())
+            assert data["stats"]["total_followers"] == "4"
+            assert data["stats"]["verification_rate"] == "25.0%"
+        finally:
+            dashboard.stop()
+        assert not dashboard.running
+
+    def test_snapshot_built_once_per_change(self, sample_analyses):
+        """Test repeated polls reuse the snapshot until followers arrive."""
+        dashboard = LiveDashboard()
+        dashboard.add(sample_analyses[0])
+        with patch.object(
+            LiveDashboard, "_create_figure", wraps=LiveDashboard._create_figure
+        ) as create_figure:
+            first = dashboard.snapshot()
+            assert dashboard.snapshot() == first
+            dashboard.add(sample_analyses[1])
+            assert dashboard.snapshot()[0] == first[0] + 1
+
+        assert create_figure.call_count == 2
+
+    def test_finished_snapshot_and_escaped_page(self, sample_analyses):
+        """Test the final snapshot is flagged and the username is escaped."""
+        import json
+
+        dashboard = LiveDashboard(target_username="<b>target</b>")
+        dashboard.add(sample_analyses[0])
+        assert json.loads(dashboard.snapshot()[1])["finished"] is False
+
+        dashboard.finish()
+        version, body = dashboard.snapshot()
+        assert version == 2
+        assert json.loads(body)["finished"] is True
+
+        page = dashboard.render_page()
+        assert "@&lt;b&gt;target&lt;/b&gt;" in page
+        assert "<b>target</b>" not in page
+        assert 'id="status"' in page
+
+    def test_live_exporter_close_serves_final_snapshot(self, sample_analyses):
+        """Test close keeps serving until a watching page got the final data."""
+        import json
+        import threading
+        import time
+        import urllib.request
+
+        exporter = LiveDashboardExporter(port=0, refresh_seconds=30)
+        exporter.open()
+        url = exporter.live_dashboard.url + "data.json"
+        exporter.write_analysis(sample_analyses[0])
+        with urllib.request.urlopen(url) as response:  # nosec B310
+            assert json.loads(response.read())["finished"] is False
+
+        closer = threading.Thread(target=exporter.close)
+        closer.start()
+        while not exporter.live_dashboard.finished:
+            time.sleep(0.01)
+        assert exporter.live_dashboard.running
+        with urllib.request.urlopen(url) as response:  # nosec B310
+            data = json.loads(response.read())
+        closer.join(timeout=5)
+
+        assert data["finished"] is True
+        assert data["stats"]["total_followers"] == "1"
+        assert not closer.is_alive()
+        assert not exporter.live_dashboard.running
+
+    def test_live_exporter_sink(self, sample_analyses):
+        """Test the live dashboard sink serves while open."""
+        exporter = LiveDashboardExporter(port=0)
+        with pytest.raises(RuntimeError, match="open"):
+            exporter.write_analysis(sample_analyses[0])
+
+        exporter.open()
+        try:
+            for analysis in sample_analyses:
+                exporter.write_analysis(analysis)
+            assert exporter.live_dashboard.aggregates.total_followers == 4
+        finally:
+            exporter.close()
+        assert not exporter.live_dashboard.running
+
+
+class TestFollowerExplorer:
+    """Test the paginated follower explorer."""
+
+    @pytest.fixture
+    def table(self):
+        """Create a follower table of 1,000 synthetic followers."""
+        return FollowerTable.from_rows(
+            (
+                f"user_{i}",
+                f"User {i}",
+                i * 10,
+                100,
+                50,
+                i % 4 == 0,
+                "Tokyo" if i % 2 else "Osaka",
+                i % 7,
+                i / 100,
+                i / 10,
+            )
+            for i in range(1000)
+        )
+
+    def test_filter_sort_and_page(self, table):
+        """Test pages hold only the requested slice of the filtered rows."""
+        result = table.page(page=2, per_page=10, sort="followers_count")
+        assert (result["total"], result["pages"]) == (1000, 100)
+        assert [row["username"] for row in result["rows"]] == [
+            f"user_{i}" for i in range(989, 979, -1)
+        ]
+
+        result = table.page(
+            per_page=5,
+            sort="username",
+            descending=False,
+            verified=True,
+            location="Osaka",
+            min_followers=5000,
+        )
+        assert result["total"] == 125
+        assert all(row["verified"] for row in result["rows"])
+        assert result["rows"][0]["username"] == "user_500"
+
+        assert table.page(search="USER_99")["total"] == 11
+        assert (
+            table.page(search="osaka")["total"] == table.page(location="Osaka")["total"]
+        )
+        assert table.page(per_page=10_000)["per_page"] == MAX_PER_PAGE
+        assert table.page(page=999, per_page=100)["page"] == 10
+
+    def test_unknown_sort_and_chart(self, table):
+        """Test unknown sort columns and charts are rejected."""
+        with pytest.raises(ValueError, match="Unknown sort column"):
+            table.page(sort="description")
+        with pytest.raises(ValueError, match="Unknown chart"):
+            table.chart("nope")
+
+    def test_charts_are_aggregated(self, table):
+        """Test chart data does not grow with the number of followers."""
+        for name in EXPLORER_CHARTS:
+            fig = table.chart(name, location="Tokyo")
+            points = sum(len(trace.x) for trace in fig.data if trace.x is not None)
+            assert 0 < points <= DENSITY_BINS + 1 + OUTLIER_POINTS
+
+    def test_load_snapshot(self, sample_table_analyses):
+        """Test JSON and NDJSON exports load into the same table."""
+        from x_follower_analyzer.exporters.json_exporter import JSONExporter
+        from x_follower_analyzer.exporters.ndjson_exporter import NDJSONExporter
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tables = []
+            for exporter_class, name in (
+                (JSONExporter, "out.json"),
+                (NDJSONExporter, "out.ndjson.gz"),
+            ):
+                path = Path(temp_dir) / name
+                exporter_class(str(path)).export(sample_table_analyses)
+                tables.append(load_snapshot(path))
+
+            with pytest.raises(ValueError, match="Unsupported snapshot"):
+                load_snapshot(Path(temp_dir) / "out.csv")
+
+        expected = FollowerTable.from_analyses(sample_table_analyses).rows([0, 1])
+        for table in tables:
+            assert len(table) == 2
+            assert table.rows([0, 1]) == expected
+
+    @pytest.fixture
+    def sample_table_analyses(self):
+        """Create sample analyses with engagement for snapshot tests."""
+        from datetime import datetime
+
+        return [
+            FollowerAnalysis(
+                profile=UserProfile(
+                    user_id=str(i),
+                    username=f"user_{i}",
+                    display_name=f"User {i}",
+                    followers_count=100 * i,
+                    location="Tokyo" if i else None,
+                ),
+                recent_tweets=[
+                    Tweet(
+                        tweet_id=str(i),
+                        user_id=str(i),
+                        text="tweet",
+                        created_at=datetime(2024, 1, 1),
+                        retweet_count=4,
+                        favorite_count=10,
+                    )
+                ],
+            )
+            for i in range(2)
+        ]
+
+    def test_server_endpoints(self, table):
+        """Test the page and JSON endpoints of the explorer server."""
+        import json
+        import urllib.error
+        import urllib.request
+
+        explorer = FollowerExplorer(table, title="<snapshot>", port=0)
+        url = explorer.start()
+        try:
+            with urllib.request.urlopen(url) as response:  # nosec B310
+                page = response.read().decode("utf-8")
+            assert "&lt;snapshot&gt;" in page
+
+            query = "api/followers?page=3&per_page=20&sort=username&order=asc&q=user_1"
+            with urllib.request.urlopen(url + query) as response:  # nosec B310
+                data = json.loads(response.read())
+            assert data["total"] == 111
+            assert len(data["rows"]) == 20
+
+            with urllib.request.urlopen(  # nosec B310
+                url + "api/charts/locations?verified=true"
+            ) as response:
+                figure = json.loads(response.read())
+            assert sorted(figure["data"][0]["y"]) == ["Osaka"]
+
+            with pytest.raises(urllib.error.HTTPError) as bad_request:
+                urllib.request.urlopen(url + "api/followers?sort=nope")  # nosec
+            assert bad_request.value.code == 400
+        finally:
+            explorer.stop()
+
+
+class TestActivityHeatmap:
+    """Test weekday × hour activity binning and posting recommendations."""
+
+    @pytest.fixture
+    def sample_analyses(self):
+        """Followers in Tokyo, New York and an unknown place."""
+        from datetime import datetime, timezone
+
+        analyses = []
+        for i, location in enumerate(["東京, Japan", "New York, NY", "Earth"]):
+            profile = UserProfile(
+                user_id=str(i),
+                username=f"user_{i}",
+                display_name=f"User {i}",
+                location=location,
+            )
+            tweets = [
+                Tweet(
+                    tweet_id=f"{i}_{j}",
+                    user_id=str(i),
+                    text="tweet",
+                    # Monday 2024-01-01 02:00 UTC, then one per day
+                    created_at=datetime(2024, 1, 1 + j, 2, tzinfo=timezone.utc),
+                )
+                for j in range(i + 1)
+            ]
+            analyses.append(FollowerAnalysis(profile=profile, recent_tweets=tweets))
+        return analyses
+
+    def test_heatmap_matches_datetime_binning(self):
+        """Test vectorized binning agrees with datetime weekday and hour."""
+        from datetime import datetime, timezone
+
+        rng = np.random.default_rng(0)
+        timestamps = rng.integers(-(10**9), 2 * 10**9, size=10_000)
+        heatmap = activity_heatmap(timestamps)
+
+        expected = np.zeros((7, 24), dtype=np.int64)
+        for ts in timestamps[:500]:
+            moment = datetime.fromtimestamp(int(ts), tz=timezone.utc)
+            expected[moment.weekday(), moment.hour] += 1
+        assert heatmap.shape == (7, 24)
+        assert heatmap.sum() == len(timestamps)
+        assert (activity_heatmap(timestamps[:500]) == expected).all()
+
+    def test_utc_offsets_shift_slots(self):
+        """Test offsets move tweets across hours and days."""
+        monday_2am = 1704074400  # 2024-01-01 02:00 UTC
+        assert activity_heatmap([monday_2am])[0, 2] == 1
+        assert activity_heatmap([monday_2am], 9 * 3600)[0, 11] == 1
+        assert activity_heatmap([monday_2am], [-5 * 3600])[6, 21] == 1
+
+    def test_infer_utc_offset(self):
+        """Test location keywords map to standard-time offsets."""
+        assert infer_utc_offset("東京都渋谷区") == 9
+        assert infer_utc_offset("Brooklyn, New York") == -5
+        assert infer_utc_offset("London, UK") == 0
+        assert infer_utc_offset("Bengaluru") == 5.5
+        assert infer_utc_offset("Ukraine") is None
+        assert infer_utc_offset("Earth") is None
+        assert infer_utc_offset(None) is None
+
+    def test_tweet_timestamps(self, sample_analyses):
+        """Test per-tweet timestamps and inferred offsets line up."""
+        timestamps, offsets = tweet_timestamps(sample_analyses)
+        assert timestamps.tolist()[:2] == [1704074400, 1704074400]
+        assert offsets is None
+
+        timestamps, offsets = tweet_timestamps(sample_analyses, local_time=True)
+        assert len(offsets) == len(timestamps) == 6
+        assert offsets.tolist() == [9 * 3600] + [-5 * 3600] * 2 + [0] * 3
+
+        local = activity_heatmap(timestamps, offsets)
+        assert local[0, 11] == 1  # Tokyo: Monday 11:00
+        assert local[6, 21] == 1  # New York: Sunday 21:00
+
+    def test_aware_times_binned_in_utc(self, sample_analyses):
+        """Test aggregates and heatmap bin non-UTC aware times alike."""
+        from datetime import datetime, timedelta, timezone
+
+        jst = timezone(timedelta(hours=9))
+        sample_analyses[0].recent_tweets[0].created_at = datetime(
+            2024, 1, 1, 11, tzinfo=jst
+        )  # 02:00 UTC
+        aggregates = DashboardAggregates.from_analyses(sample_analyses)
+        heatmap = activity_heatmap(tweet_timestamps(sample_analyses)[0])
+
+        assert aggregates.tweet_hours[2] == 6
+        assert aggregates.tweet_hours[11] == 0
+        assert aggregates.tweet_hours.tolist() == heatmap.sum(axis=0).tolist()
+
+    @pytest.mark.parametrize("suffix", [".sqlite", ".parquet", ".feather"])
+    def test_read_tweet_timestamps(self, sample_analyses, tmp_path, suffix):
+        """Test export times read as arrays match the in-memory path."""
+        from datetime import datetime, timedelta, timezone
+
+        from x_follower_analyzer.exporters.columnar_exporter import (
+            ColumnarExporter,
+        )
+        from x_follower_analyzer.exporters.sqlite_exporter import SQLiteExporter
+
+        if suffix != ".sqlite":
+            pytest.importorskip("pyarrow")
+        sample_analyses[2].recent_tweets[1].created_at = datetime(
+            2024, 1, 2, 11, 30, tzinfo=timezone(timedelta(hours=9))
+        )
+        output_file = tmp_path / f"followers{suffix}"
+        if suffix == ".sqlite":
+            exporter = SQLiteExporter(str(output_file))
+        else:
+            exporter = ColumnarExporter(str(output_file), suffix[1:])
+        with exporter:
+            for analysis in sample_analyses:
+                exporter.write_analysis(analysis)
+
+        expected, expected_offsets = tweet_timestamps(sample_analyses, True)
+        timestamps, offsets = read_tweet_timestamps(output_file, local_time=True)
+        assert timestamps.tolist() == expected.tolist()
+        assert offsets.tolist() == expected_offsets.tolist()
+        assert read_tweet_timestamps(output_file)[1] is None
+
+    def test_best_posting_times(self):
+        """Test the busiest non-empty slots are recommended first."""
+        heatmap = np.zeros((7, 24), dtype=np.int64)
+        heatmap[4, 18] = 5
+        heatmap[0, 9] = 3
+        heatmap[2, 9] = 3
+
+        assert best_posting_times(heatmap) == [
+            PostingSlot(4, 18, 5),
+            PostingSlot(0, 9, 3),
+            PostingSlot(2, 9, 3),
+        ]
+        assert best_posting_times(heatmap, n=10)[-1] == PostingSlot(2, 9, 3)
+        assert PostingSlot(4, 18, 5).label == "Fri 18:00"
+        assert best_posting_times(np.zeros((7, 24))) == []
+
+    def test_activity_heatmap_chart(self, sample_analyses):
+        """Test the heatmap chart in UTC and local time."""
+        generator = ChartGenerator()
+        utc = generator.create_activity_heatmap_chart(
+            sample_analyses, ChartOutput.BYTES
+        )
+        local = generator.create_activity_heatmap_chart(
+            sample_analyses, ChartOutput.BYTES, local_time=True
+        )
+        assert utc.startswith(b"\x89PNG")
+        assert local.startswith(b"\x89PNG")
+        assert utc != local
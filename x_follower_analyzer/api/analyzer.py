@@ -1,7 +1,7 @@
 """Main analyzer class that coordinates follower analysis."""
 
 import time
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from tqdm import tqdm
 
@@ -34,9 +34,15 @@ class FollowerAnalyzer:
             "end_time": None,
         }
 
-    def analyze_followers(self) -> List[FollowerAnalysis]:
+    def analyze_followers(
+        self, on_analysis: Optional[Callable[[FollowerAnalysis], None]] = None
+    ) -> List[FollowerAnalysis]:
         """Main method to analyze followers.
 
+        Args:
+            on_analysis: Optional callback invoked with each FollowerAnalysis
+                as soon as it has been collected (e.g. a streaming exporter)
+
         Returns:
             List of FollowerAnalysis objects
         """
@@ -60,7 +66,7 @@ class FollowerAnalyzer:
             return []
 
         # Step 4: Analyze each follower (get tweets and likes)
-        analyses = self._analyze_follower_data(followers)
+        analyses = self._analyze_follower_data(followers, on_analysis)
 
         self.stats["end_time"] = time.time()
         self._print_summary()
@@ -117,7 +123,9 @@ class FollowerAnalyzer:
             return []
 
     def _analyze_follower_data(
-        self, followers: List[UserProfile]
+        self,
+        followers: List[UserProfile],
+        on_analysis: Optional[Callable[[FollowerAnalysis], None]] = None,
     ) -> List[FollowerAnalysis]:
         """Analyze each follower's tweets and likes data."""
         print(f"🔍 Collecting tweets and likes for {len(followers):,} followers...")
@@ -127,6 +135,7 @@ class FollowerAnalyzer:
 
         with tqdm(total=len(followers), desc="Collecting follower data") as pbar:
             for i, follower in enumerate(followers):
+                analysis = None
                 try:
                     analysis = self._analyze_single_follower(follower)
 
@@ -155,6 +164,11 @@ class FollowerAnalyzer:
                     pbar.update(1)
                     continue
 
+                # Outside the try block so export errors are not mistaken for
+                # per-follower collection failures
+                if analysis and on_analysis is not None:
+                    on_analysis(analysis)
+
         return analyses
 
     def _analyze_single_follower(
@@ -273,7 +273,7 @@ class XAPIClient:
             response = self.client.get_liked_tweets(
                 id=user_id,
                 max_results=min(max_results, 100),  # API limit
-                tweet_fields=["created_at", "author_id"],
+                tweet_fields=["created_at", "author_id", "public_metrics"],
                 expansions=["author_id"],
                 user_fields=["username"],
             )
@@ -295,6 +295,7 @@ class XAPIClient:
                 original_username = user_mapping.get(
                     str(tweet_data.author_id), "unknown"
                 )
+                metrics = tweet_data.public_metrics or {}
 
                 liked_tweet = LikedTweet(
                     tweet_id=str(tweet_data.id),
@@ -303,6 +304,8 @@ class XAPIClient:
                     text=tweet_data.text,
                     created_at=tweet_data.created_at,
                     liked_at=None,  # API doesn't provide when it was liked
+                    retweet_count=metrics.get("retweet_count"),
+                    favorite_count=metrics.get("like_count"),
                 )
 
                 liked_tweets.append(liked_tweet)
@@ -1,9 +1,11 @@
 """Command line interface for X Follower Analyzer."""
 
 import sys
+from pathlib import Path
 
 import click
 
+from .models.config import OutputFormat, RenderProfile
 from .utils.config import (
     create_analysis_config,
     get_api_credentials,
@@ -12,6 +14,17 @@ from .utils.config import (
 )
 
 
+def _validate_output_formats(ctx, param, value: str) -> str:
+    """Validate a comma-separated list of output formats."""
+    supported = [fmt.value for fmt in OutputFormat]
+    for format_name in value.split(","):
+        if format_name.strip().lower() not in supported:
+            raise click.BadParameter(
+                f"'{format_name}' is not one of {', '.join(supported)}"
+            )
+    return value.lower()
+
+
 @click.command()
 @click.argument("username", type=str)
 @click.option(
@@ -34,15 +47,33 @@ from .utils.config import (
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["csv", "json", "html"], case_sensitive=False),
+    type=str,
     default="csv",
-    help="Output format: csv, json, or html (interactive dashboard)",
+    callback=_validate_output_formats,
+    help=(
+        "Output format: csv, json, ndjson (one JSON record per line), "
+        "tables (directory of normalized CSV tables), "
+        "sqlite (indexed database), parquet/feather (typed columnar files), "
+        "or html (interactive dashboard). Comma-separate several formats "
+        "(e.g. csv,json,html) to write them all in a single pass"
+    ),
 )
 @click.option(
     "--output-file",
     type=str,
     help="Output file path (default: auto-generated)",
 )
+@click.option(
+    "--compress",
+    type=click.Choice(["gzip", "zstd"], case_sensitive=False),
+    help="Stream-compress csv/json/ndjson/tables output (also inferred from "
+    "a .gz/.zst --output-file)",
+)
+@click.option(
+    "--compression-level",
+    type=int,
+    help="Compression level (default: 6 for gzip, 3 for zstd)",
+)
 @click.option(
     "--no-retweets",
     is_flag=True,
@@ -64,6 +95,40 @@ from .utils.config import (
     is_flag=True,
     help="Generate additional HTML dashboard alongside primary output",
 )
+@click.option(
+    "--render-profile",
+    type=click.Choice(
+        [profile.value for profile in RenderProfile], case_sensitive=False
+    ),
+    default="standard",
+    help="Dashboard chart quality: preview (72 dpi, fastest), standard "
+    "(150 dpi) or print (300 dpi) (default: standard)",
+)
+@click.option(
+    "--asset-dir",
+    type=click.Path(file_okay=False),
+    help="Write dashboard images and plotly.js to this directory (shared "
+    "between dashboards) instead of inlining them into the HTML",
+)
+@click.option(
+    "--local-time",
+    is_flag=True,
+    help="Show the dashboard activity heatmap and best posting times in each "
+    "follower's local time, inferred from their location (UTC when unknown)",
+)
+@click.option(
+    "--render-cache-dir",
+    type=click.Path(file_okay=False),
+    help="Cache rendered dashboard charts in this directory and reuse them "
+    "when their data is unchanged",
+)
+@click.option(
+    "--live-dashboard",
+    "live_dashboard_port",
+    type=click.IntRange(0, 65535),
+    help="Serve a dashboard on this local port that updates while followers "
+    "are collected (e.g. --live-dashboard 8050)",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -76,10 +141,17 @@ def main(
     max_likes: int,
     output_format: str,
     output_file: str,
+    compress: str,
+    compression_level: int,
     no_retweets: bool,
     rate_limit_delay: float,
     config_file: str,
     generate_dashboard: bool,
+    render_profile: str,
+    asset_dir: str,
+    local_time: bool,
+    render_cache_dir: str,
+    live_dashboard_port: int,
     dry_run: bool,
 ) -> None:
     """Analyze X (Twitter) followers' profiles, posts, and likes.
@@ -113,6 +185,14 @@ def main(
                 output_file=output_file,
                 include_retweets=not no_retweets,
                 rate_limit_delay=rate_limit_delay,
+                compression=compress,
+                compression_level=compression_level,
+                generate_dashboard=generate_dashboard,
+                render_cache_dir=render_cache_dir,
+                render_profile=render_profile,
+                asset_dir=asset_dir,
+                local_time=local_time,
+                live_dashboard_port=live_dashboard_port,
             )
         except ValueError as e:
             click.echo(f"❌ Configuration error: {e}", err=True)
@@ -132,7 +212,26 @@ def main(
         click.echo(f"  Max followers: {config.max_followers:,}")
         click.echo(f"  Max tweets per user: {config.max_tweets_per_user}")
         click.echo(f"  Max likes per user: {config.max_liked_tweets_per_user}")
-        click.echo(f"  Output format: {config.output_format.value.upper()}")
+        click.echo(
+            "  Output format: "
+            + ", ".join(fmt.value.upper() for fmt, _ in config.output_targets())
+        )
+        if config.compression:
+            click.echo(f"  Compression: {config.compression}")
+        if any(fmt == OutputFormat.DASHBOARD for fmt, _ in config.output_targets()):
+            click.echo(f"  Render profile: {config.render_profile.value}")
+            click.echo(
+                "  Activity times: "
+                + ("followers' local time" if config.local_time else "UTC")
+            )
+        if config.asset_dir:
+            click.echo(f"  Dashboard assets: {config.asset_dir}")
+        if config.render_cache_dir:
+            click.echo(f"  Render cache: {config.render_cache_dir}")
+        if config.live_dashboard_port is not None:
+            click.echo(
+                f"  Live dashboard: http://127.0.0.1:{config.live_dashboard_port}/"
+            )
         click.echo(f"  Include retweets: {config.include_retweets}")
         click.echo(f"  Rate limit delay: {config.rate_limit_delay}s")
 
@@ -146,48 +245,39 @@ def main(
             from .exporters.exporter_factory import ExporterFactory
 
             analyzer = FollowerAnalyzer(credentials, config)
-            analyses = analyzer.analyze_followers()
+
+            # Every output is fed from the same traversal: each follower is
+            # streamed to all sinks as soon as it is collected, so partial
+            # results survive an interrupted run
+            exporter = ExporterFactory.create_multi_exporter(config)
+            exporter.open()
+            try:
+                analyses = analyzer.analyze_followers(
+                    on_analysis=exporter.write_analysis
+                )
+            finally:
+                exporter.close()
 
             if analyses:
                 click.echo(
                     f"\\n✅ Analysis completed! Found {len(analyses)} follower profiles."
                 )
-
-                # Export data
                 click.echo(
-                    f"📤 Exporting data to "
-                    f"{config.output_format.value.upper()} format..."
+                    f"📤 Streamed {len(analyses):,} followers to "
+                    + ", ".join(fmt.value.upper() for fmt, _ in config.output_targets())
+                    + " format"
                 )
-                exporter = ExporterFactory.create_exporter(
-                    config.output_format, config.output_file
-                )
-
-                # Export with target username for dashboard
-                if (
-                    hasattr(exporter, "export")
-                    and hasattr(exporter.export, "__code__")
-                    and "target_username" in exporter.export.__code__.co_varnames
-                ):
-                    exporter.export(analyses, target_username=config.target_username)
-                else:
-                    exporter.export(analyses)
 
                 click.echo("\\n🎉 Analysis and export completed successfully!")
-                click.echo(f"📁 Output file: {config.output_file}")
-
-                # Generate additional dashboard if requested
-                if generate_dashboard and config.output_format.value != "html":
-                    click.echo("\\n📊 Generating additional HTML dashboard...")
-                    dashboard_file = f"{config.target_username}_dashboard.html"
-                    dashboard_exporter = ExporterFactory.create_dashboard_exporter(
-                        dashboard_file
-                    )
-                    dashboard_exporter.export(
-                        analyses, target_username=config.target_username
-                    )
-                    click.echo(f"📁 Dashboard file: {dashboard_file}")
+                for output_format, output_file in config.output_targets():
+                    if output_format == OutputFormat.DASHBOARD:
+                        click.echo(f"📁 Dashboard file: {output_file}")
+                    else:
+                        click.echo(f"📁 Output file: {output_file}")
 
-                if config.output_format.value == "html":
+                if any(
+                    fmt == OutputFormat.DASHBOARD for fmt, _ in config.output_targets()
+                ):
                     click.echo(
                         "\\n🌐 Open the HTML file in your web browser to view "
                         "the interactive dashboard!"
@@ -207,5 +297,41 @@ def main(
         sys.exit(1)
 
 
+@click.command()
+@click.argument("snapshot", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Interface to serve the explorer on (default: 127.0.0.1)",
+)
+@click.option(
+    "--port",
+    default=8060,
+    type=click.IntRange(0, 65535),
+    help="Port to serve the explorer on (default: 8060)",
+)
+def explore(snapshot: str, host: str, port: int) -> None:
+    """Browse a collected follower snapshot in a local, paginated explorer.
+
+    SNAPSHOT: JSON or NDJSON export (optionally .gz/.zst compressed)
+    """
+    from .visualization.explorer import FollowerExplorer, load_snapshot
+
+    try:
+        click.echo(f"📂 Loading {snapshot}...")
+        table = load_snapshot(snapshot)
+    except (ValueError, KeyError) as e:
+        click.echo(f"❌ Cannot load snapshot: {e}", err=True)
+        sys.exit(1)
+
+    explorer = FollowerExplorer(table, title=Path(snapshot).name, host=host, port=port)
+    click.echo(f"✓ Loaded {len(table):,} followers")
+    click.echo(f"🔎 Explorer running at {explorer.start()} (Ctrl+C to stop)")
+    try:
+        explorer.serve()
+    except KeyboardInterrupt:
+        click.echo("\n👋 Explorer stopped")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,230 @@
+"""Columnar (Parquet / Feather) export functionality for follower analysis data."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..models.user import FollowerAnalysis
+from ..utils.paths import columnar_table_path
+from .relational_exporter import liked_tweet_row, profile_row, tweet_row
+
+COLUMNAR_FORMATS = ("parquet", "feather")
+
+# Tables written by the columnar exporter. Hashtags and mentions stay as list
+# columns on ``tweets`` instead of separate link tables.
+COLUMNAR_TABLES = ("followers", "tweets", "liked_tweets")
+
+
+def _arrow_schemas() -> Dict[str, Any]:
+    """Build the Arrow schema of every columnar table."""
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    return {
+        "followers": pa.schema(
+            [
+                ("user_id", pa.string()),
+                ("username", pa.string()),
+                ("display_name", pa.string()),
+                ("description", pa.string()),
+                ("followers_count", pa.int64()),
+                ("following_count", pa.int64()),
+                ("tweets_count", pa.int64()),
+                ("location", pa.string()),
+                ("profile_image_url", pa.string()),
+                ("verified", pa.bool_()),
+                ("created_at", timestamp),
+                ("url", pa.string()),
+            ]
+        ),
+        "tweets": pa.schema(
+            [
+                ("tweet_id", pa.string()),
+                ("user_id", pa.string()),
+                ("text", pa.string()),
+                ("created_at", timestamp),
+                ("retweet_count", pa.int64()),
+                ("favorite_count", pa.int64()),
+                ("reply_count", pa.int64()),
+                ("is_retweet", pa.bool_()),
+                ("reply_to_tweet_id", pa.string()),
+                ("hashtags", pa.list_(pa.string())),
+                ("mentions", pa.list_(pa.string())),
+            ]
+        ),
+        "liked_tweets": pa.schema(
+            [
+                ("user_id", pa.string()),
+                ("tweet_id", pa.string()),
+                ("original_user_id", pa.string()),
+                ("original_username", pa.string()),
+                ("text", pa.string()),
+                ("created_at", timestamp),
+                ("liked_at", timestamp),
+                ("retweet_count", pa.int64()),
+                ("favorite_count", pa.int64()),
+            ]
+        ),
+    }
+
+
+class ColumnarExporter:
+    """Export follower analysis data to typed columnar files.
+
+    ``output_file`` receives the followers table; tweets and liked tweets are
+    written next to it as ``<stem>.tweets.<ext>`` and
+    ``<stem>.liked_tweets.<ext>``. Datetimes are stored as UTC timestamps,
+    flags as booleans and hashtags/mentions as list columns. Rows are buffered
+    and written one row group (Parquet) or record batch (Feather) per
+    ``row_group_size`` followers.
+
+    Requires the optional ``pyarrow`` dependency.
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        file_format: str = "parquet",
+        row_group_size: int = 10000,
+    ):
+        """Initialize columnar exporter.
+
+        Args:
+            output_file: Path to the followers output file
+            file_format: ``parquet`` or ``feather``
+            row_group_size: Number of followers buffered per row group
+        """
+        if file_format not in COLUMNAR_FORMATS:
+            raise ValueError(
+                f"Unsupported columnar format: {file_format}. "
+                f"Must be one of {', '.join(COLUMNAR_FORMATS)}"
+            )
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+
+        self.output_file = Path(output_file)
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.followers_written = 0
+        self._schemas: Dict[str, Any] = {}
+        self._writers: Dict[str, Any] = {}
+        self._pending: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._pending_followers = 0
+
+    def export(self, analyses: List[FollowerAnalysis]) -> None:
+        """Export follower analyses to columnar files.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+        """
+        if not analyses:
+            print("⚠️ No data to export")
+            return
+
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
+
+        print(f"✅ {self.file_format.capitalize()} exported to: {self.output_file}")
+        print(f"   Followers: {self.followers_written:,}")
+        for table in COLUMNAR_TABLES[1:]:
+            print(f"   {table}: {self.table_path(table)}")
+
+    def table_path(self, table: str) -> Path:
+        """Get the output path for a table."""
+        return columnar_table_path(self.output_file, table)
+
+    def open(self) -> None:
+        """Open one columnar writer per table."""
+        if self._writers:
+            return
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Columnar export requires pyarrow. "
+                "Install it with: pip install 'x-follower-analyzer[columnar]'"
+            ) from e
+
+        self._schemas = _arrow_schemas()
+        for table in COLUMNAR_TABLES:
+            path = str(self.table_path(table))
+            schema = self._schemas[table]
+            if self.file_format == "parquet":
+                self._writers[table] = pq.ParquetWriter(path, schema)
+            else:
+                self._writers[table] = pa.ipc.new_file(
+                    path, schema, options=pa.ipc.IpcWriteOptions(compression="lz4")
+                )
+
+        self._pending = {table: [] for table in COLUMNAR_TABLES}
+        self._pending_followers = 0
+        self.followers_written = 0
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Buffer one follower's rows, flushing a row group when it is full.
+
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if not self._writers:
+            raise RuntimeError("ColumnarExporter.open() must be called before writing")
+
+        user_id = analysis.profile.user_id
+        self._pending["followers"].append(profile_row(analysis.profile))
+        self._pending["tweets"].extend(
+            tweet_row(tweet) + (tweet.hashtags or [], tweet.mentions or [])
+            for tweet in analysis.recent_tweets or []
+        )
+        self._pending["liked_tweets"].extend(
+            liked_tweet_row(user_id, liked_tweet)
+            for liked_tweet in analysis.liked_tweets or []
+        )
+        self._pending_followers += 1
+
+        if self._pending_followers >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group per table."""
+        if not self._writers or not self._pending_followers:
+            return
+
+        import pyarrow as pa
+
+        for table, rows in self._pending.items():
+            if not rows:
+                continue
+            schema = self._schemas[table]
+            columns = list(zip(*rows))
+            arrow_table = pa.Table.from_arrays(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, schema)
+                ],
+                schema=schema,
+            )
+            self._writers[table].write_table(arrow_table)
+            rows.clear()
+
+        self.followers_written += self._pending_followers
+        self._pending_followers = 0
+
+    def close(self) -> None:
+        """Flush remaining rows and finalize every file."""
+        if not self._writers:
+            return
+
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    def __enter__(self) -> "ColumnarExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,22 +2,70 @@
 
 import csv
 from pathlib import Path
-from typing import Any, Dict, List
-
-from ..models.user import FollowerAnalysis, LikedTweet, Tweet
+from typing import Any, Dict, List, Optional, TextIO
+
+from ..models.user import FollowerAnalysis, Tweet
+from ..utils.compression import detect_compression, open_text, validate_compression
+from ..utils.metrics import get_metrics
+
+CSV_COLUMNS = [
+    "user_id",
+    "username",
+    "display_name",
+    "description",
+    "followers_count",
+    "following_count",
+    "tweets_count",
+    "location",
+    "profile_image_url",
+    "verified",
+    "created_at",
+    "url",
+    "recent_tweets_count",
+    "recent_tweets_text",
+    "recent_tweets_hashtags",
+    "recent_tweets_mentions",
+    "avg_retweet_count",
+    "avg_favorite_count",
+    "retweet_ratio",
+    "liked_tweets_count",
+    "liked_tweets_topics",
+    "liked_tweets_authors",
+]
 
 
 class CSVExporter:
-    """Export follower analysis data to CSV format."""
-
-    def __init__(self, output_file: str):
+    """Export follower analysis data to CSV format.
+
+    Rows can be written all at once with ``export`` or incrementally with
+    ``open`` / ``write_analysis`` / ``close``, which flushes every row to disk
+    as soon as its follower has been collected. Output is compressed on the
+    fly when ``compression`` is set or the file name ends in ``.gz``/``.zst``;
+    compressed rows are then synced in batches (see ``open_text``).
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
         """Initialize CSV exporter.
 
         Args:
             output_file: Path to output CSV file
+            compression: ``gzip`` or ``zstd`` (default: detect from extension)
+            compression_level: Compression level (default: codec default)
         """
         self.output_file = Path(output_file)
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.compression = validate_compression(compression) or detect_compression(
+            output_file
+        )
+        self.compression_level = compression_level
+        self.rows_written = 0
+        self._file: Optional[TextIO] = None
+        self._writer = None
 
     def export(self, analyses: List[FollowerAnalysis]) -> None:
         """Export follower analyses to CSV.
@@ -29,26 +77,60 @@ class CSVExporter:
             print("⚠️ No data to export")
             return
 
-        # Prepare flattened data for CSV
-        rows = []
-        for analysis in analyses:
-            row = self._flatten_analysis(analysis)
-            rows.append(row)
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
+
+        print(f"✅ CSV exported to: {self.output_file}")
+        print(f"   Rows: {self.rows_written:,}")
+        print(f"   Columns: {len(CSV_COLUMNS)}")
+
+    def open(self) -> None:
+        """Open the output file and write the header row."""
+        if self._file is not None:
+            return
+
+        self._file = open_text(
+            self.output_file,
+            "w",
+            compression=self.compression,
+            level=self.compression_level,
+            newline="",
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_COLUMNS)
+        self._file.flush()
+        self.rows_written = 0
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Write a single follower row and flush it to disk.
 
-        # Write to CSV
-        if rows:
-            fieldnames = list(rows[0].keys())
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if self._file is None:
+            raise RuntimeError("CSVExporter.open() must be called before writing")
 
-            with open(self.output_file, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
+        row = self._flatten_analysis(analysis)
+        self._writer.writerow([row[column] for column in CSV_COLUMNS])
+        self._file.flush()
+        self.rows_written += 1
+
+    def close(self) -> None:
+        """Close the output file."""
+        if self._file is None:
+            return
 
-            print(f"✅ CSV exported to: {self.output_file}")
-            print(f"   Rows: {len(rows):,}")
-            print(f"   Columns: {len(fieldnames)}")
-        else:
-            print("❌ No data rows to export")
+        self._file.close()
+        self._file = None
+        self._writer = None
+
+    def __enter__(self) -> "CSVExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _flatten_analysis(self, analysis: FollowerAnalysis) -> Dict[str, Any]:
         """Flatten a FollowerAnalysis object to a dictionary suitable for CSV.
@@ -78,30 +160,34 @@ class CSVExporter:
         }
 
         # Recent tweets summary
+        metrics = get_metrics(analysis)
         recent_tweets = analysis.recent_tweets or []
         row.update(
             {
-                "recent_tweets_count": len(recent_tweets),
+                "recent_tweets_count": metrics.recent_tweets_count,
                 "recent_tweets_text": self._serialize_tweets_text(recent_tweets),
-                "recent_tweets_hashtags": self._extract_all_hashtags(recent_tweets),
-                "recent_tweets_mentions": self._extract_all_mentions(recent_tweets),
-                "avg_retweet_count": self._calculate_avg_metric(
-                    recent_tweets, "retweet_count"
+                # Top 10 unique hashtags / mentions, alphabetically
+                "recent_tweets_hashtags": ", ".join(
+                    sorted(metrics.hashtag_counts)[:10]
                 ),
-                "avg_favorite_count": self._calculate_avg_metric(
-                    recent_tweets, "favorite_count"
+                "recent_tweets_mentions": ", ".join(
+                    sorted(metrics.mention_counts)[:10]
                 ),
-                "retweet_ratio": self._calculate_retweet_ratio(recent_tweets),
+                "avg_retweet_count": round(metrics.avg_retweets, 2),
+                "avg_favorite_count": round(metrics.avg_favorites, 2),
+                "retweet_ratio": round(metrics.retweet_ratio, 2),
             }
         )
 
         # Liked tweets summary
-        liked_tweets = analysis.liked_tweets or []
         row.update(
             {
-                "liked_tweets_count": len(liked_tweets),
-                "liked_tweets_topics": self._extract_liked_topics(liked_tweets),
-                "liked_tweets_authors": self._extract_liked_authors(liked_tweets),
+                "liked_tweets_count": metrics.liked_tweets_count,
+                "liked_tweets_topics": ", ".join(sorted(metrics.liked_topic_counts)),
+                "liked_tweets_authors": ", ".join(
+                    f"@{author}({count})"
+                    for author, count in metrics.top_liked_authors(5)
+                ),
             }
         )
 
@@ -121,75 +207,3 @@ class CSVExporter:
             texts.append(text)
 
         return " | ".join(texts)
-
-    def _extract_all_hashtags(self, tweets: List[Tweet]) -> str:
-        """Extract all unique hashtags from tweets."""
-        hashtags = set()
-        for tweet in tweets:
-            hashtags.update(tweet.hashtags or [])
-
-        return ", ".join(sorted(hashtags)[:10])  # Top 10 hashtags
-
-    def _extract_all_mentions(self, tweets: List[Tweet]) -> str:
-        """Extract all unique mentions from tweets."""
-        mentions = set()
-        for tweet in tweets:
-            mentions.update(tweet.mentions or [])
-
-        return ", ".join(sorted(mentions)[:10])  # Top 10 mentions
-
-    def _calculate_avg_metric(self, tweets: List[Tweet], metric: str) -> float:
-        """Calculate average metric value for tweets."""
-        if not tweets:
-            return 0.0
-
-        total = sum(getattr(tweet, metric, 0) for tweet in tweets)
-        return round(total / len(tweets), 2)
-
-    def _calculate_retweet_ratio(self, tweets: List[Tweet]) -> float:
-        """Calculate ratio of retweets to total tweets."""
-        if not tweets:
-            return 0.0
-
-        retweet_count = sum(1 for tweet in tweets if tweet.is_retweet)
-        return round(retweet_count / len(tweets), 2)
-
-    def _extract_liked_topics(self, liked_tweets: List[LikedTweet]) -> str:
-        """Extract topics from liked tweets based on keywords."""
-        if not liked_tweets:
-            return ""
-
-        # Simple keyword-based topic extraction
-        topics = set()
-        keywords = {
-            "医療": ["医療", "看護", "病院", "医師", "ナース", "患者"],
-            "副業": ["副業", "サイドビジネス", "在宅ワーク", "フリーランス"],
-            "教育": ["教育", "学習", "勉強", "研修", "スキル"],
-            "IT": ["プログラミング", "AI", "DX", "システム", "アプリ"],
-            "ビジネス": ["ビジネス", "経営", "マーケティング", "営業"],
-        }
-
-        for tweet in liked_tweets:
-            text = tweet.text.lower()
-            for topic, words in keywords.items():
-                if any(word in text for word in words):
-                    topics.add(topic)
-
-        return ", ".join(sorted(topics))
-
-    def _extract_liked_authors(self, liked_tweets: List[LikedTweet]) -> str:
-        """Extract frequently liked authors."""
-        if not liked_tweets:
-            return ""
-
-        # Count authors
-        author_counts = {}
-        for tweet in liked_tweets:
-            author = tweet.original_username
-            author_counts[author] = author_counts.get(author, 0) + 1
-
-        # Get top 5 authors
-        top_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[
-            :5
-        ]
-        return ", ".join([f"@{author}({count})" for author, count in top_authors])
@@ -1,18 +1,79 @@
 """Dashboard exporter for generating HTML visualization dashboards."""
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+from ..models.config import RenderProfile
 from ..models.user import FollowerAnalysis
-from ..visualization.dashboard import DashboardGenerator
 
 
 class DashboardExporter:
-    """Export follower analysis data as interactive HTML dashboard."""
+    """Export follower analysis data as interactive HTML dashboard.
+
+    As a streaming sink (``open`` / ``write_analysis`` / ``close``) analyses
+    are collected as they arrive and the dashboard is rendered on ``close``,
+    since every chart needs the full follower set.
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        target_username: str = "unknown",
+        render_cache_dir: Optional[str] = None,
+        render_profile: RenderProfile = RenderProfile.STANDARD,
+        asset_dir: Optional[str] = None,
+        local_time: bool = False,
+    ):
+        """Initialize dashboard exporter.
 
-    def __init__(self, output_file: str):
-        """Initialize dashboard exporter."""
+        Args:
+            output_file: Path to output HTML file
+            target_username: Target account shown in the dashboard
+            render_cache_dir: Directory caching rendered charts between runs
+            render_profile: Render quality of the dashboard charts
+            asset_dir: Shared directory for chart images and plotly.js
+                (default: inline them into the HTML)
+            local_time: Show the activity heatmap in the followers' local time
+        """
         self.output_file = output_file
-        self.dashboard_generator = DashboardGenerator()
+        self.target_username = target_username
+
+        # Imported here so the plotting stack (matplotlib, plotly, wordcloud)
+        # only loads when a dashboard is actually requested
+        from ..visualization.dashboard import DashboardGenerator
+        from ..visualization.render_cache import LayoutCache, RenderCache
+
+        render_cache = layout_cache = None
+        if render_cache_dir:
+            render_cache = RenderCache(render_cache_dir)
+            layout_cache = LayoutCache(Path(render_cache_dir) / "layouts")
+        self.dashboard_generator = DashboardGenerator(
+            render_cache=render_cache,
+            render_profile=render_profile,
+            asset_dir=asset_dir,
+            layout_cache=layout_cache,
+            local_time=local_time,
+        )
+        self._analyses: Optional[List[FollowerAnalysis]] = None
+
+    def open(self) -> None:
+        """Start collecting analyses for the dashboard."""
+        if self._analyses is None:
+            self._analyses = []
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Collect a single follower analysis."""
+        if self._analyses is None:
+            raise RuntimeError("DashboardExporter.open() must be called before writing")
+        self._analyses.append(analysis)
+
+    def close(self) -> None:
+        """Render the dashboard from every collected analysis."""
+        if self._analyses is None:
+            return
+
+        analyses, self._analyses = self._analyses, None
+        self.export(analyses, target_username=self.target_username)
 
     def export(
         self, analyses: List[FollowerAnalysis], target_username: str = "unknown"
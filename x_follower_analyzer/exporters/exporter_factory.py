@@ -1,11 +1,17 @@
 """Factory for creating appropriate exporters based on output format."""
 
-from typing import Union
+from typing import Optional, Union
 
-from ..models.config import OutputFormat
+from ..models.config import COMPRESSIBLE_FORMATS, AnalysisConfig, OutputFormat
+from .columnar_exporter import ColumnarExporter
 from .csv_exporter import CSVExporter
-from .json_exporter import JSONExporter
 from .dashboard_exporter import DashboardExporter
+from .json_exporter import JSONExporter
+from .live_dashboard_exporter import LiveDashboardExporter
+from .multi_exporter import MultiExporter
+from .ndjson_exporter import NDJSONExporter
+from .relational_exporter import RelationalCSVExporter
+from .sqlite_exporter import SQLiteExporter
 
 
 class ExporterFactory:
@@ -13,29 +19,110 @@ class ExporterFactory:
 
     @staticmethod
     def create_exporter(
-        output_format: OutputFormat, output_file: str
-    ) -> Union[CSVExporter, JSONExporter, DashboardExporter]:
+        output_format: OutputFormat,
+        output_file: str,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ) -> Union[
+        CSVExporter,
+        JSONExporter,
+        NDJSONExporter,
+        RelationalCSVExporter,
+        SQLiteExporter,
+        ColumnarExporter,
+        DashboardExporter,
+    ]:
         """Create appropriate exporter based on output format.
 
         Args:
             output_format: OutputFormat enum value
-            output_file: Path to output file
+            output_file: Path to output file (a directory for TABLES)
+            compression: ``gzip`` or ``zstd`` for text-based formats
+            compression_level: Compression level (default: codec default)
 
         Returns:
             Exporter instance
 
         Raises:
-            ValueError: If output format is not supported
+            ValueError: If output format is not supported, or compression is
+                requested for a format that cannot be compressed
         """
+        compression_options = {
+            "compression": compression,
+            "compression_level": compression_level,
+        }
+
         if output_format == OutputFormat.CSV:
-            return CSVExporter(output_file)
+            return CSVExporter(output_file, **compression_options)
         elif output_format == OutputFormat.JSON:
-            return JSONExporter(output_file)
+            return JSONExporter(output_file, **compression_options)
+        elif output_format == OutputFormat.NDJSON:
+            return NDJSONExporter(output_file, **compression_options)
+        elif output_format == OutputFormat.TABLES:
+            return RelationalCSVExporter(output_file, **compression_options)
+        elif compression:
+            raise ValueError(
+                f"Compression is not supported for {output_format.value} output"
+            )
+        elif output_format == OutputFormat.SQLITE:
+            return SQLiteExporter(output_file)
+        elif output_format in (OutputFormat.PARQUET, OutputFormat.FEATHER):
+            return ColumnarExporter(output_file, file_format=output_format.value)
         elif output_format == OutputFormat.DASHBOARD:
             return DashboardExporter(output_file)
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
 
+    @staticmethod
+    def create_multi_exporter(
+        config: AnalysisConfig, concurrent: bool = True
+    ) -> MultiExporter:
+        """Create one exporter that writes every configured output in one pass.
+
+        With a live dashboard port configured, a live dashboard sink is fed
+        from the same pass.
+
+        Args:
+            config: Analysis configuration (primary and additional outputs)
+            concurrent: Run each sink in its own writer thread
+
+        Returns:
+            MultiExporter instance
+        """
+        exporters = []
+        for output_format, output_file in config.output_targets():
+            if output_format == OutputFormat.DASHBOARD:
+                exporters.append(
+                    DashboardExporter(
+                        output_file,
+                        target_username=config.target_username,
+                        render_cache_dir=config.render_cache_dir,
+                        render_profile=config.render_profile,
+                        asset_dir=config.asset_dir,
+                        local_time=config.local_time,
+                    )
+                )
+            elif output_format in COMPRESSIBLE_FORMATS:
+                exporters.append(
+                    ExporterFactory.create_exporter(
+                        output_format,
+                        output_file,
+                        compression=config.compression,
+                        compression_level=config.compression_level,
+                    )
+                )
+            else:
+                exporters.append(
+                    ExporterFactory.create_exporter(output_format, output_file)
+                )
+        if config.live_dashboard_port is not None:
+            exporters.append(
+                LiveDashboardExporter(
+                    config.live_dashboard_port, target_username=config.target_username
+                )
+            )
+        return MultiExporter(exporters, concurrent=concurrent)
+
     @staticmethod
     def create_dashboard_exporter(output_file: str) -> DashboardExporter:
         """Create dashboard exporter specifically.
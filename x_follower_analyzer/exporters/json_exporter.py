@@ -1,24 +1,108 @@
 """JSON export functionality for follower analysis data."""
 
 import json
+import re
+import textwrap
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, TextIO
 
 from ..models.user import FollowerAnalysis, LikedTweet, Tweet, UserProfile
+from ..utils.compression import detect_compression, open_text, validate_compression
+from ..utils.metrics import get_metrics
+
+# Start of the document JSONExporter writes: the followers array comes first
+_FOLLOWERS_START = re.compile(r'\s*\{\s*"followers"\s*:\s*\[')
+# Whitespace and commas between array items
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def read_json(input_file: str) -> Dict[str, Any]:
+    """Load a JSON export, decompressing ``.gz`` / ``.zst`` files transparently.
+
+    Args:
+        input_file: Path to JSON file
+
+    Returns:
+        Exported data with ``metadata`` and ``followers`` keys
+    """
+    with open_text(input_file, "r") as f:
+        return json.load(f)
+
+
+def iter_json_followers(
+    input_file: str, chunk_size: int = 1 << 16
+) -> Iterator[Dict[str, Any]]:
+    """Stream the follower records of a JSON export one at a time.
+
+    Exports written by ``JSONExporter`` open with the ``followers`` array, so
+    records are decoded one by one from a bounded read buffer and memory
+    stays at one record plus one chunk. Documents laid out differently are
+    loaded whole with ``read_json``.
+
+    Args:
+        input_file: Path to JSON file (optionally ``.gz`` / ``.zst``)
+        chunk_size: Characters read at a time
+
+    Yields:
+        Follower records in file order
+    """
+    decoder = json.JSONDecoder()
+    with open_text(input_file, "r") as f:
+        buffer = f.read(chunk_size)
+        match = _FOLLOWERS_START.match(buffer)
+        if match is not None:
+            pos = match.end()
+            while True:
+                pos = _SEPARATORS.match(buffer, pos).end()
+                if pos < len(buffer) and buffer[pos] == "]":
+                    return
+                try:
+                    if pos == len(buffer):
+                        raise json.JSONDecodeError("Need more data", buffer, pos)
+                    record, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        raise
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                yield record
+
+    yield from read_json(input_file)["followers"]
 
 
 class JSONExporter:
-    """Export follower analysis data to JSON format."""
+    """Export follower analysis data to JSON format.
 
-    def __init__(self, output_file: str):
+    Followers can be exported all at once with ``export`` or incrementally with
+    ``open`` / ``write_analysis`` / ``close``; records are streamed into the
+    ``followers`` array and the ``metadata`` object is written last, once the
+    follower count is known.
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
         """Initialize JSON exporter.
 
         Args:
             output_file: Path to output JSON file
+            compression: ``gzip`` or ``zstd`` (default: detect from extension)
+            compression_level: Compression level (default: codec default)
         """
         self.output_file = Path(output_file)
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.compression = validate_compression(compression) or detect_compression(
+            output_file
+        )
+        self.compression_level = compression_level
+        self.records_written = 0
+        self._file: Optional[TextIO] = None
+        self._export_timestamp = ""
 
     def export(self, analyses: List[FollowerAnalysis]) -> None:
         """Export follower analyses to JSON.
@@ -30,22 +114,12 @@ class JSONExporter:
             print("⚠️ No data to export")
             return
 
-        # Convert to JSON-serializable format
-        data = {
-            "metadata": {
-                "export_timestamp": datetime.now().isoformat(),
-                "total_followers": len(analyses),
-                "export_format": "json",
-            },
-            "followers": [self._serialize_analysis(analysis) for analysis in analyses],
-        }
-
-        # Write to JSON file
-        with open(self.output_file, "w", encoding="utf-8") as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False, default=str)
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
 
         print(f"✅ JSON exported to: {self.output_file}")
-        print(f"   Followers: {len(analyses):,}")
+        print(f"   Followers: {self.records_written:,}")
 
         # Calculate file size
         file_size = self.output_file.stat().st_size
@@ -54,6 +128,69 @@ class JSONExporter:
         else:
             print(f"   File size: {file_size / 1024:.1f} KB")
 
+    def open(self) -> None:
+        """Open the output file and start the ``followers`` array."""
+        if self._file is not None:
+            return
+
+        self._file = open_text(
+            self.output_file,
+            "w",
+            compression=self.compression,
+            level=self.compression_level,
+        )
+        self._export_timestamp = datetime.now().isoformat()
+        self._file.write('{\n  "followers": [')
+        self.records_written = 0
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Serialize a single follower into the ``followers`` array.
+
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if self._file is None:
+            raise RuntimeError("JSONExporter.open() must be called before writing")
+
+        record = json.dumps(
+            self._serialize_analysis(analysis),
+            indent=2,
+            ensure_ascii=False,
+            default=str,
+        )
+        separator = ",\n" if self.records_written else "\n"
+        self._file.write(separator + textwrap.indent(record, "    "))
+        self.records_written += 1
+
+    def close(self) -> None:
+        """Write the ``metadata`` object and close the output file."""
+        if self._file is None:
+            return
+
+        metadata = json.dumps(
+            {
+                "export_timestamp": self._export_timestamp,
+                "total_followers": self.records_written,
+                "export_format": "json",
+            },
+            indent=2,
+        )
+        closing = "\n  " if self.records_written else ""
+        self._file.write(
+            f"{closing}],\n"
+            f'  "metadata": {textwrap.indent(metadata, "  ").lstrip()}\n'
+            "}\n"
+        )
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "JSONExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _serialize_analysis(self, analysis: FollowerAnalysis) -> Dict[str, Any]:
         """Serialize a FollowerAnalysis object to JSON-compatible dict.
 
@@ -123,6 +260,8 @@ class JSONExporter:
             "liked_at": (
                 liked_tweet.liked_at.isoformat() if liked_tweet.liked_at else None
             ),
+            "retweet_count": liked_tweet.retweet_count,
+            "favorite_count": liked_tweet.favorite_count,
         }
 
     def _generate_analysis_summary(self, analysis: FollowerAnalysis) -> Dict[str, Any]:
@@ -131,51 +270,31 @@ class JSONExporter:
         recent_tweets = analysis.recent_tweets or []
         liked_tweets = analysis.liked_tweets or []
 
-        # Calculate engagement metrics
-        total_retweets = sum(tweet.retweet_count for tweet in recent_tweets)
-        total_favorites = sum(tweet.favorite_count for tweet in recent_tweets)
-        total_replies = sum(tweet.reply_count for tweet in recent_tweets)
-
-        # Extract topics from liked tweets
-        topics = self._extract_topics_from_liked_tweets(liked_tweets)
-
-        # Calculate activity metrics
-        retweet_ratio = (
-            len([t for t in recent_tweets if t.is_retweet]) / len(recent_tweets)
-            if recent_tweets
-            else 0
-        )
+        metrics = get_metrics(analysis)
 
         return {
             "engagement_metrics": {
-                "avg_retweets_per_tweet": (
-                    round(total_retweets / len(recent_tweets), 2)
-                    if recent_tweets
-                    else 0
-                ),
-                "avg_favorites_per_tweet": (
-                    round(total_favorites / len(recent_tweets), 2)
-                    if recent_tweets
-                    else 0
-                ),
-                "avg_replies_per_tweet": (
-                    round(total_replies / len(recent_tweets), 2) if recent_tweets else 0
-                ),
-                "total_engagement": total_retweets + total_favorites + total_replies,
+                "avg_retweets_per_tweet": round(metrics.avg_retweets, 2),
+                "avg_favorites_per_tweet": round(metrics.avg_favorites, 2),
+                "avg_replies_per_tweet": round(metrics.avg_replies, 2),
+                "total_engagement": metrics.total_engagement,
             },
             "activity_metrics": {
-                "recent_tweets_count": len(recent_tweets),
-                "liked_tweets_count": len(liked_tweets),
-                "retweet_ratio": round(retweet_ratio, 2),
+                "recent_tweets_count": metrics.recent_tweets_count,
+                "liked_tweets_count": metrics.liked_tweets_count,
+                "retweet_ratio": round(metrics.retweet_ratio, 2),
                 "follower_to_following_ratio": round(
-                    profile.followers_count / max(profile.following_count, 1), 2
+                    metrics.follower_to_following_ratio, 2
                 ),
             },
             "content_analysis": {
-                "primary_hashtags": self._extract_hashtags(recent_tweets)[:5],
-                "frequent_mentions": self._extract_mentions(recent_tweets)[:5],
-                "liked_content_topics": topics[:5],
-                "most_liked_authors": self._extract_liked_authors(liked_tweets)[:5],
+                "primary_hashtags": metrics.top_hashtags(5),
+                "frequent_mentions": metrics.top_mentions(5),
+                "liked_content_topics": metrics.top_liked_topics(5),
+                "most_liked_authors": [
+                    {"username": author, "likes_count": count}
+                    for author, count in metrics.top_liked_authors(5)
+                ],
             },
             "classification": {
                 "account_type": self._classify_account_type(
@@ -183,116 +302,11 @@ class JSONExporter:
                 ),
                 "activity_level": self._classify_activity_level(profile, recent_tweets),
                 "engagement_level": self._classify_engagement_level(
-                    total_retweets + total_favorites + total_replies, len(recent_tweets)
+                    metrics.total_engagement, metrics.recent_tweets_count
                 ),
             },
         }
 
-    def _extract_topics_from_liked_tweets(
-        self, liked_tweets: List[LikedTweet]
-    ) -> List[str]:
-        """Extract topics from liked tweets using keyword analysis."""
-        if not liked_tweets:
-            return []
-
-        topic_keywords = {
-            "医療・看護": [
-                "医療",
-                "看護",
-                "病院",
-                "医師",
-                "ナース",
-                "患者",
-                "治療",
-                "健康",
-            ],
-            "副業・転職": [
-                "副業",
-                "サイドビジネス",
-                "在宅ワーク",
-                "フリーランス",
-                "転職",
-                "求人",
-            ],
-            "教育・学習": ["教育", "学習", "勉強", "研修", "スキル", "資格", "講座"],
-            "IT・テック": [
-                "プログラミング",
-                "AI",
-                "DX",
-                "システム",
-                "アプリ",
-                "データ",
-            ],
-            "ビジネス": ["ビジネス", "経営", "マーケティング", "営業", "起業"],
-            "ライフスタイル": [
-                "ライフスタイル",
-                "趣味",
-                "旅行",
-                "グルメ",
-                "ファッション",
-            ],
-        }
-
-        topic_scores = {}
-        for tweet in liked_tweets:
-            text = tweet.text.lower()
-            for topic, keywords in topic_keywords.items():
-                score = sum(1 for keyword in keywords if keyword in text)
-                topic_scores[topic] = topic_scores.get(topic, 0) + score
-
-        # Return topics sorted by score
-        return [
-            topic
-            for topic, score in sorted(
-                topic_scores.items(), key=lambda x: x[1], reverse=True
-            )
-            if score > 0
-        ]
-
-    def _extract_hashtags(self, tweets: List[Tweet]) -> List[str]:
-        """Extract most frequent hashtags."""
-        hashtag_counts = {}
-        for tweet in tweets:
-            for hashtag in tweet.hashtags or []:
-                hashtag_counts[hashtag] = hashtag_counts.get(hashtag, 0) + 1
-
-        return [
-            hashtag
-            for hashtag, count in sorted(
-                hashtag_counts.items(), key=lambda x: x[1], reverse=True
-            )
-        ]
-
-    def _extract_mentions(self, tweets: List[Tweet]) -> List[str]:
-        """Extract most frequent mentions."""
-        mention_counts = {}
-        for tweet in tweets:
-            for mention in tweet.mentions or []:
-                mention_counts[mention] = mention_counts.get(mention, 0) + 1
-
-        return [
-            mention
-            for mention, count in sorted(
-                mention_counts.items(), key=lambda x: x[1], reverse=True
-            )
-        ]
-
-    def _extract_liked_authors(
-        self, liked_tweets: List[LikedTweet]
-    ) -> List[Dict[str, Any]]:
-        """Extract most liked authors with counts."""
-        author_counts = {}
-        for tweet in liked_tweets:
-            author = tweet.original_username
-            author_counts[author] = author_counts.get(author, 0) + 1
-
-        return [
-            {"username": author, "likes_count": count}
-            for author, count in sorted(
-                author_counts.items(), key=lambda x: x[1], reverse=True
-            )
-        ]
-
     def _classify_account_type(
         self,
         profile: UserProfile,
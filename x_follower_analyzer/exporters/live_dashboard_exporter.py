@@ -0,0 +1,62 @@
+"""Live dashboard sink serving statistics while followers are collected."""
+
+from ..models.user import FollowerAnalysis
+
+
+class LiveDashboardExporter:
+    """Serve a live-updating dashboard during a collection run.
+
+    As a streaming sink (``open`` / ``write_analysis`` / ``close``) the local
+    server starts on ``open``, every analysis is folded into the dashboard's
+    incremental aggregates as it arrives. On ``close`` the dashboard is marked
+    finished; if a page is watching, the server keeps serving until the page
+    has picked up the final snapshot (at most two polls) before it stops.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        target_username: str = "unknown",
+        host: str = "127.0.0.1",
+        refresh_seconds: float = 5.0,
+    ):
+        """Initialize live dashboard exporter.
+
+        Args:
+            port: Port to serve the dashboard on (0 picks a free one)
+            target_username: Target account shown in the dashboard
+            host: Interface to listen on
+            refresh_seconds: Interval at which the page polls for updates
+        """
+        # Imported here so plotly only loads when a live dashboard is requested
+        from ..visualization.live import LiveDashboard
+
+        self.live_dashboard = LiveDashboard(
+            target_username=target_username,
+            host=host,
+            port=port,
+            refresh_seconds=refresh_seconds,
+        )
+
+    def open(self) -> None:
+        """Start the dashboard server."""
+        if not self.live_dashboard.running:
+            url = self.live_dashboard.start()
+            print(f"📡 Live dashboard: {url}")
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Add a single follower analysis to the live dashboard."""
+        if not self.live_dashboard.running:
+            raise RuntimeError(
+                "LiveDashboardExporter.open() must be called before writing"
+            )
+        self.live_dashboard.add(analysis)
+
+    def close(self) -> None:
+        """Mark the dashboard finished and stop the server."""
+        if self.live_dashboard.running:
+            self.live_dashboard.finish()
+            if self.live_dashboard.polled:
+                refresh_seconds = self.live_dashboard.refresh_seconds
+                self.live_dashboard.wait_final_delivered(2 * refresh_seconds + 1)
+        self.live_dashboard.stop()
@@ -0,0 +1,160 @@
+"""Single-pass export of follower analyses into several output formats."""
+
+import queue
+import threading
+from typing import Any, List, Optional
+
+from ..models.user import FollowerAnalysis
+
+_STOP = object()
+
+
+class MultiExporter:
+    """Feed one traversal of follower analyses into several exporters.
+
+    Every wrapped exporter must implement the streaming sink protocol
+    (``open`` / ``write_analysis`` / ``close``). With ``concurrent=True`` each
+    sink gets a dedicated writer thread fed through a bounded queue, so
+    I/O-bound sinks (file writes, compression, SQLite commits) overlap instead
+    of running one after another.
+    """
+
+    def __init__(
+        self, exporters: List[Any], concurrent: bool = True, queue_size: int = 256
+    ):
+        """Initialize multi-format exporter.
+
+        Args:
+            exporters: Streaming exporters to feed
+            concurrent: Run each sink in its own writer thread
+            queue_size: Maximum analyses buffered per sink
+        """
+        if not exporters:
+            raise ValueError("At least one exporter is required")
+
+        self.exporters = exporters
+        self.concurrent = concurrent and len(exporters) > 1
+        self.queue_size = queue_size
+        self._queues: List[queue.Queue] = []
+        self._threads: List[threading.Thread] = []
+        self._errors: List[BaseException] = []
+        self._is_open = False
+
+    def export(self, analyses: List[FollowerAnalysis]) -> None:
+        """Export follower analyses to every sink in a single pass.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+        """
+        if not analyses:
+            print("⚠️ No data to export")
+            return
+
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
+
+    def open(self) -> None:
+        """Open every sink and start the writer threads.
+
+        If a sink fails to open, the sinks opened before it are closed again
+        before the error is raised.
+        """
+        if self._is_open:
+            return
+
+        self._errors = []
+        opened: List[Any] = []
+        try:
+            for exporter in self.exporters:
+                exporter.open()
+                opened.append(exporter)
+        except BaseException:
+            for exporter in reversed(opened):
+                try:
+                    exporter.close()
+                except Exception:  # nosec B110 - the open error is raised
+                    pass
+            raise
+
+        if self.concurrent:
+            for exporter in self.exporters:
+                sink_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+                thread = threading.Thread(
+                    target=self._drain,
+                    args=(exporter, sink_queue),
+                    name=f"export-{type(exporter).__name__}",
+                    daemon=True,
+                )
+                thread.start()
+                self._queues.append(sink_queue)
+                self._threads.append(thread)
+
+        self._is_open = True
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Hand a single follower analysis to every sink.
+
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if not self._is_open:
+            raise RuntimeError("MultiExporter.open() must be called before writing")
+        if self._errors:
+            raise self._errors[0]
+
+        if self.concurrent:
+            for sink_queue in self._queues:
+                sink_queue.put(analysis)
+        else:
+            for exporter in self.exporters:
+                exporter.write_analysis(analysis)
+
+    def close(self) -> None:
+        """Drain the writer threads and close every sink.
+
+        Raises:
+            The first error raised by any sink, after all sinks are closed
+        """
+        if not self._is_open:
+            return
+
+        for sink_queue in self._queues:
+            sink_queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._queues = []
+        self._threads = []
+
+        for exporter in self.exporters:
+            try:
+                exporter.close()
+            except Exception as e:
+                self._errors.append(e)
+
+        self._is_open = False
+        if self._errors:
+            raise self._errors[0]
+
+    def __enter__(self) -> "MultiExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _drain(self, exporter: Any, sink_queue: queue.Queue) -> None:
+        """Writer thread: feed queued analyses into one sink."""
+        failed: Optional[BaseException] = None
+        while True:
+            analysis = sink_queue.get()
+            if analysis is _STOP:
+                break
+            if failed is not None:
+                # Keep draining so the producer never blocks on a dead sink
+                continue
+            try:
+                exporter.write_analysis(analysis)
+            except Exception as e:
+                failed = e
+                self._errors.append(e)
@@ -0,0 +1,126 @@
+"""NDJSON (JSON Lines) export functionality for follower analysis data."""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..models.user import FollowerAnalysis
+from ..utils.compression import open_text
+from .json_exporter import JSONExporter
+
+
+def read_ndjson(input_file: str) -> Iterator[Dict[str, Any]]:
+    """Iterate over follower records in an NDJSON export.
+
+    Metadata header lines (one per export run, so appended files may contain
+    several) are skipped. ``.gz`` / ``.zst`` files are decompressed on the fly.
+
+    Args:
+        input_file: Path to NDJSON file
+
+    Yields:
+        Follower record dictionaries
+    """
+    with open_text(input_file, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "metadata" in record:
+                continue
+            yield record
+
+
+class NDJSONExporter(JSONExporter):
+    """Export follower analysis data as newline-delimited JSON.
+
+    The first line of each run is a ``{"metadata": {...}}`` header; every
+    following line is one compact, self-contained follower record. Files can be
+    appended to across runs and split on line boundaries for parallel
+    processing.
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        append: bool = False,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
+        """Initialize NDJSON exporter.
+
+        Args:
+            output_file: Path to output NDJSON file
+            append: Append to an existing file instead of overwriting it
+            compression: ``gzip`` or ``zstd`` (default: detect from extension)
+            compression_level: Compression level (default: codec default)
+        """
+        super().__init__(output_file, compression, compression_level)
+        self.append = append
+
+    def export(self, analyses: List[FollowerAnalysis]) -> None:
+        """Export follower analyses to NDJSON.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+        """
+        if not analyses:
+            print("⚠️ No data to export")
+            return
+
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
+
+        print(f"✅ NDJSON exported to: {self.output_file}")
+        print(f"   Followers: {self.records_written:,}")
+
+    def open(self) -> None:
+        """Open the output file and write the metadata header line."""
+        if self._file is not None:
+            return
+
+        mode = "a" if self.append else "w"
+        self._file = open_text(
+            self.output_file,
+            mode,
+            compression=self.compression,
+            level=self.compression_level,
+        )
+        self._write_line(
+            {
+                "metadata": {
+                    "export_timestamp": datetime.now().isoformat(),
+                    "export_format": "ndjson",
+                }
+            }
+        )
+        self.records_written = 0
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Write a single follower record and flush it to disk.
+
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if self._file is None:
+            raise RuntimeError("NDJSONExporter.open() must be called before writing")
+
+        self._write_line(self._serialize_analysis(analysis))
+        self.records_written += 1
+
+    def close(self) -> None:
+        """Close the output file."""
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+
+    def _write_line(self, record: Dict[str, Any]) -> None:
+        """Write one compact JSON record followed by a newline."""
+        self._file.write(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        )
+        self._file.write("\n")
+        self._file.flush()
@@ -0,0 +1,254 @@
+"""Normalized multi-table export for follower analysis data."""
+
+import csv
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from ..models.user import FollowerAnalysis, LikedTweet, Tweet, UserProfile
+from ..utils.compression import (
+    COMPRESSION_EXTENSIONS,
+    open_text,
+    validate_compression,
+)
+
+# Table name -> ordered column names. Every table is keyed by IDs so the
+# tables can be joined without re-parsing concatenated strings.
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    "followers": [
+        "user_id",
+        "username",
+        "display_name",
+        "description",
+        "followers_count",
+        "following_count",
+        "tweets_count",
+        "location",
+        "profile_image_url",
+        "verified",
+        "created_at",
+        "url",
+    ],
+    "tweets": [
+        "tweet_id",
+        "user_id",
+        "text",
+        "created_at",
+        "retweet_count",
+        "favorite_count",
+        "reply_count",
+        "is_retweet",
+        "reply_to_tweet_id",
+    ],
+    "liked_tweets": [
+        "user_id",
+        "tweet_id",
+        "original_user_id",
+        "original_username",
+        "text",
+        "created_at",
+        "liked_at",
+        "retweet_count",
+        "favorite_count",
+    ],
+    "hashtags": ["tweet_id", "user_id", "hashtag"],
+    "mentions": ["tweet_id", "user_id", "mention"],
+}
+
+
+def profile_row(profile: UserProfile) -> Tuple[Any, ...]:
+    """Build a ``followers`` table row."""
+    return (
+        profile.user_id,
+        profile.username,
+        profile.display_name,
+        profile.description,
+        profile.followers_count,
+        profile.following_count,
+        profile.tweets_count,
+        profile.location,
+        profile.profile_image_url,
+        profile.verified,
+        profile.created_at,
+        profile.url,
+    )
+
+
+def tweet_row(tweet: Tweet) -> Tuple[Any, ...]:
+    """Build a ``tweets`` table row."""
+    return (
+        tweet.tweet_id,
+        tweet.user_id,
+        tweet.text,
+        tweet.created_at,
+        tweet.retweet_count,
+        tweet.favorite_count,
+        tweet.reply_count,
+        tweet.is_retweet,
+        tweet.reply_to_tweet_id,
+    )
+
+
+def liked_tweet_row(user_id: str, liked_tweet: LikedTweet) -> Tuple[Any, ...]:
+    """Build a ``liked_tweets`` table row for the follower ``user_id``."""
+    return (
+        user_id,
+        liked_tweet.tweet_id,
+        liked_tweet.original_user_id,
+        liked_tweet.original_username,
+        liked_tweet.text,
+        liked_tweet.created_at,
+        liked_tweet.liked_at,
+        liked_tweet.retweet_count,
+        liked_tweet.favorite_count,
+    )
+
+
+def analysis_to_rows(analysis: FollowerAnalysis) -> Dict[str, List[Tuple[Any, ...]]]:
+    """Split a FollowerAnalysis into rows for every normalized table.
+
+    Values keep their Python types (datetimes, booleans, None) so each sink
+    can encode them natively.
+
+    Args:
+        analysis: FollowerAnalysis object
+
+    Returns:
+        Mapping of table name to list of row tuples in TABLE_COLUMNS order
+    """
+    user_id = analysis.profile.user_id
+    rows: Dict[str, List[Tuple[Any, ...]]] = {
+        "followers": [profile_row(analysis.profile)],
+        "tweets": [],
+        "liked_tweets": [],
+        "hashtags": [],
+        "mentions": [],
+    }
+
+    for tweet in analysis.recent_tweets or []:
+        rows["tweets"].append(tweet_row(tweet))
+        for hashtag in tweet.hashtags or []:
+            rows["hashtags"].append((tweet.tweet_id, tweet.user_id, hashtag))
+        for mention in tweet.mentions or []:
+            rows["mentions"].append((tweet.tweet_id, tweet.user_id, mention))
+
+    for liked_tweet in analysis.liked_tweets or []:
+        rows["liked_tweets"].append(liked_tweet_row(user_id, liked_tweet))
+
+    return rows
+
+
+class RelationalCSVExporter:
+    """Export follower analysis data as normalized CSV tables.
+
+    ``output_dir`` receives one CSV file per table (``followers.csv``,
+    ``tweets.csv``, ``liked_tweets.csv``, ``hashtags.csv``, ``mentions.csv``)
+    with every collected record preserved. With ``compression`` set each
+    table is compressed on the fly (``followers.csv.gz`` etc.).
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+    ):
+        """Initialize relational exporter.
+
+        Args:
+            output_dir: Directory that receives the table files
+            compression: ``gzip`` or ``zstd`` (default: uncompressed)
+            compression_level: Compression level (default: codec default)
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compression = validate_compression(compression)
+        self.compression_level = compression_level
+        self.rows_written: Dict[str, int] = {table: 0 for table in TABLE_COLUMNS}
+        self._files: Dict[str, TextIO] = {}
+        self._writers: Dict[str, Any] = {}
+
+    def export(self, analyses: List[FollowerAnalysis]) -> None:
+        """Export follower analyses to normalized tables.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+        """
+        if not analyses:
+            print("⚠️ No data to export")
+            return
+
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
+
+        print(f"✅ Tables exported to: {self.output_dir}")
+        for table, count in self.rows_written.items():
+            print(f"   {table}: {count:,} rows")
+
+    def open(self) -> None:
+        """Open every table file and write its header row."""
+        if self._files:
+            return
+
+        for table, columns in TABLE_COLUMNS.items():
+            table_file = open_text(
+                self.table_path(table),
+                "w",
+                compression=self.compression,
+                level=self.compression_level,
+                newline="",
+            )
+            writer = csv.writer(table_file)
+            writer.writerow(columns)
+            self._files[table] = table_file
+            self._writers[table] = writer
+            self.rows_written[table] = 0
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Append one follower's rows to every table.
+
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if not self._files:
+            raise RuntimeError(
+                "RelationalCSVExporter.open() must be called before writing"
+            )
+
+        for table, rows in analysis_to_rows(analysis).items():
+            if not rows:
+                continue
+            self._writers[table].writerows(
+                [self._format_value(value) for value in row] for row in rows
+            )
+            self._files[table].flush()
+            self.rows_written[table] += len(rows)
+
+    def close(self) -> None:
+        """Close every table file."""
+        for table_file in self._files.values():
+            table_file.close()
+        self._files = {}
+        self._writers = {}
+
+    def table_path(self, table: str) -> Path:
+        """Get the CSV path for a table."""
+        extension = COMPRESSION_EXTENSIONS.get(self.compression, "")
+        return self.output_dir / f"{table}.csv{extension}"
+
+    def __enter__(self) -> "RelationalCSVExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _format_value(value: Optional[Any]) -> Any:
+        """Encode a typed value for CSV output."""
+        if value is None:
+            return ""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
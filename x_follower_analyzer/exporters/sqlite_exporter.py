@@ -0,0 +1,219 @@
+"""SQLite export functionality for follower analysis data."""
+
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.user import FollowerAnalysis
+from .relational_exporter import TABLE_COLUMNS, analysis_to_rows
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS followers (
+    user_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    display_name TEXT,
+    description TEXT,
+    followers_count INTEGER,
+    following_count INTEGER,
+    tweets_count INTEGER,
+    location TEXT,
+    profile_image_url TEXT,
+    verified INTEGER,
+    created_at TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS tweets (
+    tweet_id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    text TEXT,
+    created_at TEXT,
+    retweet_count INTEGER,
+    favorite_count INTEGER,
+    reply_count INTEGER,
+    is_retweet INTEGER,
+    reply_to_tweet_id TEXT
+);
+CREATE TABLE IF NOT EXISTS liked_tweets (
+    user_id TEXT NOT NULL,
+    tweet_id TEXT NOT NULL,
+    original_user_id TEXT,
+    original_username TEXT,
+    text TEXT,
+    created_at TEXT,
+    liked_at TEXT,
+    retweet_count INTEGER,
+    favorite_count INTEGER,
+    PRIMARY KEY (user_id, tweet_id)
+);
+CREATE TABLE IF NOT EXISTS hashtags (
+    tweet_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    hashtag TEXT NOT NULL,
+    PRIMARY KEY (tweet_id, hashtag)
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    tweet_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    mention TEXT NOT NULL,
+    PRIMARY KEY (tweet_id, mention)
+);
+CREATE INDEX IF NOT EXISTS idx_followers_username ON followers (username);
+CREATE INDEX IF NOT EXISTS idx_tweets_user_id ON tweets (user_id);
+CREATE INDEX IF NOT EXISTS idx_tweets_created_at ON tweets (created_at);
+CREATE INDEX IF NOT EXISTS idx_liked_tweets_tweet_id ON liked_tweets (tweet_id);
+CREATE INDEX IF NOT EXISTS idx_liked_tweets_original_user_id
+    ON liked_tweets (original_user_id);
+CREATE INDEX IF NOT EXISTS idx_hashtags_hashtag ON hashtags (hashtag);
+CREATE INDEX IF NOT EXISTS idx_hashtags_user_id ON hashtags (user_id);
+CREATE INDEX IF NOT EXISTS idx_mentions_mention ON mentions (mention);
+CREATE INDEX IF NOT EXISTS idx_mentions_user_id ON mentions (user_id);
+"""
+
+
+class SQLiteExporter:
+    """Export follower analysis data to an indexed SQLite database.
+
+    Rows are buffered and written with ``executemany`` in one transaction per
+    ``batch_size`` followers, or sooner once ``commit_interval`` seconds have
+    passed since the last commit. A slow, rate-limited collection therefore
+    commits every few seconds instead of holding up to ``batch_size - 1``
+    followers that a crash or ^C would lose; followers written before a pause
+    are committed with the next write or on ``close``. The database runs in
+    WAL mode so dashboards and ad-hoc queries can read it while a collection
+    run is still writing.
+    """
+
+    def __init__(
+        self, output_file: str, batch_size: int = 500, commit_interval: float = 5.0
+    ):
+        """Initialize SQLite exporter.
+
+        Args:
+            output_file: Path to output SQLite database
+            batch_size: Number of followers buffered per write transaction
+            commit_interval: Seconds after which buffered followers are
+                committed even if the batch is not full
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if commit_interval < 0:
+            raise ValueError("commit_interval must not be negative")
+
+        self.output_file = Path(output_file)
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.followers_written = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._pending_followers = 0
+        self._last_commit = time.monotonic()
+        self._statements = {
+            table: self._insert_statement(table, columns)
+            for table, columns in TABLE_COLUMNS.items()
+        }
+
+    def export(self, analyses: List[FollowerAnalysis]) -> None:
+        """Export follower analyses to SQLite.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+        """
+        if not analyses:
+            print("⚠️ No data to export")
+            return
+
+        with self:
+            for analysis in analyses:
+                self.write_analysis(analysis)
+
+        print(f"✅ SQLite exported to: {self.output_file}")
+        print(f"   Followers: {self.followers_written:,}")
+
+    def open(self) -> None:
+        """Open the database, enable WAL mode and create tables and indexes."""
+        if self._conn is not None:
+            return
+
+        self._conn = sqlite3.connect(self.output_file)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        self._pending = {table: [] for table in TABLE_COLUMNS}
+        self._pending_followers = 0
+        self._last_commit = time.monotonic()
+        self.followers_written = 0
+
+    def write_analysis(self, analysis: FollowerAnalysis) -> None:
+        """Buffer one follower's rows, flushing when the batch is full or due.
+
+        Args:
+            analysis: FollowerAnalysis object
+        """
+        if self._conn is None:
+            raise RuntimeError("SQLiteExporter.open() must be called before writing")
+
+        for table, rows in analysis_to_rows(analysis).items():
+            self._pending[table].extend(
+                tuple(self._encode(value) for value in row) for row in rows
+            )
+        self._pending_followers += 1
+
+        if (
+            self._pending_followers >= self.batch_size
+            or time.monotonic() - self._last_commit >= self.commit_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows in a single transaction."""
+        if self._conn is None or not self._pending_followers:
+            return
+
+        with self._conn:
+            for table, rows in self._pending.items():
+                if rows:
+                    self._conn.executemany(self._statements[table], rows)
+                    rows.clear()
+
+        self.followers_written += self._pending_followers
+        self._pending_followers = 0
+        self._last_commit = time.monotonic()
+
+    def close(self) -> None:
+        """Flush remaining rows and close the database."""
+        if self._conn is None:
+            return
+
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def __enter__(self) -> "SQLiteExporter":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _insert_statement(table: str, columns: List[str]) -> str:
+        """Build an upsert statement for a table."""
+        placeholders = ", ".join("?" for _ in columns)
+        # Table and column names come from TABLE_COLUMNS, never from user input
+        return (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "  # nosec
+            f"VALUES ({placeholders})"
+        )
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        """Encode a typed value for SQLite storage."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, bool):
+            return int(value)
+        return value
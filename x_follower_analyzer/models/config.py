@@ -1,8 +1,8 @@
 """Configuration data models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class OutputFormat(Enum):
@@ -10,9 +10,43 @@ class OutputFormat(Enum):
 
     CSV = "csv"
     JSON = "json"
+    NDJSON = "ndjson"
+    TABLES = "tables"
+    SQLITE = "sqlite"
+    PARQUET = "parquet"
+    FEATHER = "feather"
     DASHBOARD = "html"
 
 
+# Formats whose output is streamed through a text file and can be compressed
+COMPRESSIBLE_FORMATS = (
+    OutputFormat.CSV,
+    OutputFormat.JSON,
+    OutputFormat.NDJSON,
+    OutputFormat.TABLES,
+)
+
+
+class RenderProfile(Enum):
+    """Chart render quality: fast previews through print-ready images."""
+
+    PREVIEW = "preview"
+    STANDARD = "standard"
+    PRINT = "print"
+
+    @property
+    def dpi(self) -> int:
+        """Resolution of rendered chart images."""
+        return _RENDER_PROFILE_DPI[self]
+
+
+_RENDER_PROFILE_DPI = {
+    RenderProfile.PREVIEW: 72,
+    RenderProfile.STANDARD: 150,
+    RenderProfile.PRINT: 300,
+}
+
+
 @dataclass
 class APICredentials:
     """X API credentials."""
@@ -36,9 +70,26 @@ class AnalysisConfig:
     output_file: Optional[str] = None
     include_retweets: bool = True
     rate_limit_delay: float = 1.0  # seconds between API calls
+    compression: Optional[str] = None  # "gzip" or "zstd"
+    compression_level: Optional[int] = None
+    # Extra (format, file) outputs written in the same pass as the primary one
+    additional_outputs: List[Tuple[OutputFormat, str]] = field(default_factory=list)
+    # Directory of cached dashboard chart images (None disables the cache)
+    render_cache_dir: Optional[str] = None
+    render_profile: RenderProfile = RenderProfile.STANDARD
+    # Directory of dashboard images and plotly.js (None inlines them)
+    asset_dir: Optional[str] = None
+    # Bin dashboard tweet activity in followers' inferred local time, not UTC
+    local_time: bool = False
+    # Port of the live dashboard served during collection (None disables it)
+    live_dashboard_port: Optional[int] = None
 
     def __post_init__(self) -> None:
         if self.output_file is None:
             self.output_file = (
                 f"{self.target_username}_followers_analysis.{self.output_format.value}"
             )
+
+    def output_targets(self) -> List[Tuple[OutputFormat, str]]:
+        """Get every (format, file) output, primary first."""
+        return [(self.output_format, self.output_file)] + self.additional_outputs
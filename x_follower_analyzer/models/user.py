@@ -56,6 +56,9 @@ class LikedTweet:
     text: str
     created_at: datetime
     liked_at: Optional[datetime] = None
+    # Engagement of the liked tweet (None when it was not collected)
+    retweet_count: Optional[int] = None
+    favorite_count: Optional[int] = None
 
 
 @dataclass
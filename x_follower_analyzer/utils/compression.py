@@ -0,0 +1,191 @@
+"""Transparent streaming compression for export files."""
+
+import gzip
+import time
+from pathlib import Path
+from typing import Any, Optional, TextIO, Union
+
+COMPRESSION_EXTENSIONS = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+DEFAULT_COMPRESSION_LEVELS = {
+    "gzip": 6,
+    "zstd": 3,
+}
+
+# Every flush() of a compressed stream ends a compression block, so flushes
+# (one per exported row) only sync after this many calls or seconds
+COMPRESSED_SYNC_EVERY = 1000
+COMPRESSED_SYNC_INTERVAL = 5.0
+
+
+def validate_compression(compression: Optional[str]) -> Optional[str]:
+    """Normalize and validate a compression name.
+
+    Args:
+        compression: ``gzip``, ``zstd``, ``none`` or None
+
+    Returns:
+        Normalized compression name, or None for uncompressed output
+
+    Raises:
+        ValueError: If the compression is not supported
+    """
+    if compression is None or compression.lower() == "none":
+        return None
+
+    compression = compression.lower()
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(
+            f"Invalid compression: {compression}. "
+            f"Must be one of {', '.join(COMPRESSION_EXTENSIONS)}"
+        )
+    return compression
+
+
+def detect_compression(path: Union[str, Path]) -> Optional[str]:
+    """Detect compression from a file extension (``.gz`` / ``.zst``)."""
+    suffix = Path(path).suffix.lower()
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if suffix == extension:
+            return compression
+    return None
+
+
+def with_compression_suffix(path: str, compression: Optional[str]) -> str:
+    """Append the compression extension to ``path`` if it is missing."""
+    if compression is None or detect_compression(path) == compression:
+        return path
+    return f"{path}{COMPRESSION_EXTENSIONS[compression]}"
+
+
+class _ThrottledSyncWriter:
+    """Compressed text writer whose ``flush()`` only syncs now and then.
+
+    A sync point ends a compression block: syncing after every row costs
+    a third or more of the compression ratio. ``flush()`` therefore syncs
+    once ``sync_every`` calls have accumulated, or on the first call at
+    least ``sync_interval`` seconds after the previous sync. ``close()``
+    always writes everything.
+    """
+
+    def __init__(self, stream: TextIO, sync_every: int, sync_interval: float):
+        self._stream = stream
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.syncs = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def write(self, text: str) -> int:
+        return self._stream.write(text)
+
+    def flush(self) -> None:
+        """Count a flush request, syncing if enough have accumulated."""
+        self._pending += 1
+        if (
+            self._pending >= self.sync_every
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        """Emit a sync point now, so everything written can be read back."""
+        self._stream.flush()
+        self.syncs += 1
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def __enter__(self) -> "_ThrottledSyncWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def open_text(
+    path: Union[str, Path],
+    mode: str = "r",
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    newline: Optional[str] = None,
+    sync_every: int = COMPRESSED_SYNC_EVERY,
+    sync_interval: float = COMPRESSED_SYNC_INTERVAL,
+) -> TextIO:
+    """Open a UTF-8 text stream, compressing or decompressing on the fly.
+
+    Data is (de)compressed incrementally, so the whole output is never held
+    in memory. On an uncompressed writer ``flush()`` writes through at once.
+    On a compressed writer it emits a sync point (after which everything
+    written so far can be read back) only every ``sync_every`` calls, or on
+    the first call ``sync_interval`` seconds after the previous sync. If the
+    process dies, at most the last ``sync_every - 1`` flushed rows are lost;
+    while rows keep arriving that is also at most ``sync_interval`` seconds
+    of them, but rows written before a pause stay pending until the next
+    flush or ``close()``.
+
+    Args:
+        path: File path
+        mode: ``r``, ``w`` or ``a``
+        compression: ``gzip``, ``zstd`` or None to detect from the extension
+        level: Compression level (defaults per codec)
+        newline: Passed through to the text wrapper (``""`` for CSV)
+        sync_every: Flush calls per sync point of a compressed writer
+        sync_interval: Seconds after which a compressed writer's next flush
+            syncs regardless of ``sync_every``
+
+    Returns:
+        Text file object
+
+    Raises:
+        ImportError: If zstd is requested but ``zstandard`` is not installed
+    """
+    if mode not in ("r", "w", "a"):
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    compression = validate_compression(compression) or detect_compression(path)
+
+    if compression is None:
+        return open(path, mode, encoding="utf-8", newline=newline)
+
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS[compression]
+
+    if compression == "gzip":
+        stream = gzip.open(
+            path,
+            f"{mode}t",
+            compresslevel=level,
+            encoding="utf-8",
+            newline=newline,
+        )
+    else:
+        stream = _open_zstd(path, mode, level, newline)
+
+    if mode == "r":
+        return stream
+    return _ThrottledSyncWriter(stream, sync_every, sync_interval)
+
+
+def _open_zstd(
+    path: Union[str, Path], mode: str, level: int, newline: Optional[str]
+) -> TextIO:
+    """Open a zstd-compressed text stream."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires zstandard. "
+            "Install it with: pip install 'x-follower-analyzer[zstd]'"
+        ) from e
+
+    cctx = zstandard.ZstdCompressor(level=level) if mode != "r" else None
+    return zstandard.open(path, mode, cctx=cctx, encoding="utf-8", newline=newline)
@@ -2,11 +2,22 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
-from ..models.config import AnalysisConfig, APICredentials, OutputFormat
+from ..models.config import (
+    COMPRESSIBLE_FORMATS,
+    AnalysisConfig,
+    APICredentials,
+    OutputFormat,
+    RenderProfile,
+)
+from .compression import (
+    detect_compression,
+    validate_compression,
+    with_compression_suffix,
+)
 
 
 def load_environment_config(env_file: Optional[str] = None) -> None:
@@ -50,17 +61,54 @@ def create_analysis_config(
     output_file: Optional[str] = None,
     include_retweets: bool = True,
     rate_limit_delay: float = 1.0,
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+    generate_dashboard: bool = False,
+    render_cache_dir: Optional[str] = None,
+    render_profile: str = "standard",
+    asset_dir: Optional[str] = None,
+    local_time: bool = False,
+    live_dashboard_port: Optional[int] = None,
 ) -> AnalysisConfig:
-    """Create analysis configuration with validation."""
-
-    # Validate and convert output format
+    """Create analysis configuration with validation.
+
+    ``output_format`` may list several comma-separated formats
+    (e.g. ``"csv,json,html"``); the first one is the primary output and the
+    others are written alongside it in the same pass.
+    """
+
+    # Validate and convert output formats
+    output_formats: List[OutputFormat] = []
+    for format_name in output_format.split(","):
+        try:
+            format_enum = OutputFormat(format_name.strip().lower())
+        except ValueError:
+            supported = ", ".join(f"'{fmt.value}'" for fmt in OutputFormat)
+            raise ValueError(
+                f"Invalid output format: {format_name}. Must be one of {supported}"
+            )
+        if format_enum not in output_formats:
+            output_formats.append(format_enum)
+    output_format_enum = output_formats[0]
+
+    # Validate render profile
     try:
-        output_format_enum = OutputFormat(output_format.lower())
+        render_profile_enum = RenderProfile(render_profile.lower())
     except ValueError:
+        supported = ", ".join(f"'{profile.value}'" for profile in RenderProfile)
         raise ValueError(
-            f"Invalid output format: {output_format}. Must be 'csv' or 'json'"
+            f"Invalid render profile: {render_profile}. Must be one of {supported}"
         )
 
+    # Validate compression
+    compression = validate_compression(compression)
+    if compression and not any(fmt in COMPRESSIBLE_FORMATS for fmt in output_formats):
+        raise ValueError(
+            f"Compression is not supported for {output_format_enum.value} output"
+        )
+    if compression_level is not None and compression_level < 0:
+        raise ValueError("compression_level must be non-negative")
+
     # Validate numeric parameters
     if max_followers <= 0:
         raise ValueError("max_followers must be positive")
@@ -70,13 +118,15 @@ def create_analysis_config(
         raise ValueError("max_liked_tweets_per_user must be non-negative")
     if rate_limit_delay < 0:
         raise ValueError("rate_limit_delay must be non-negative")
+    if live_dashboard_port is not None and not 0 <= live_dashboard_port <= 65535:
+        raise ValueError("live_dashboard_port must be between 0 and 65535")
 
     # Clean username (remove @ if present)
     clean_username = target_username.lstrip("@")
     if not clean_username:
         raise ValueError("target_username cannot be empty")
 
-    return AnalysisConfig(
+    config = AnalysisConfig(
         target_username=clean_username,
         max_followers=max_followers,
         max_tweets_per_user=max_tweets_per_user,
@@ -85,8 +135,54 @@ def create_analysis_config(
         output_file=output_file,
         include_retweets=include_retweets,
         rate_limit_delay=rate_limit_delay,
+        compression=compression,
+        compression_level=compression_level,
+        render_cache_dir=render_cache_dir,
+        render_profile=render_profile_enum,
+        asset_dir=asset_dir,
+        local_time=local_time,
+        live_dashboard_port=live_dashboard_port,
     )
 
+    # Additional formats share the primary file name with their own extension
+    output_base = Path(config.output_file)
+    if detect_compression(output_base):
+        output_base = output_base.with_suffix("")
+    if output_base.suffix == f".{output_format_enum.value}":
+        output_base = output_base.with_suffix("")
+    for format_enum in output_formats[1:]:
+        config.additional_outputs.append(
+            (format_enum, f"{output_base}.{format_enum.value}")
+        )
+    if generate_dashboard and OutputFormat.DASHBOARD not in output_formats:
+        config.additional_outputs.append(
+            (OutputFormat.DASHBOARD, f"{clean_username}_dashboard.html")
+        )
+
+    if compression:
+        config.output_file = _compressed_file(
+            output_format_enum, config.output_file, compression
+        )
+        config.additional_outputs = [
+            (fmt, _compressed_file(fmt, path, compression))
+            for fmt, path in config.additional_outputs
+        ]
+
+    return config
+
+
+def _compressed_file(
+    output_format: OutputFormat, output_file: str, compression: str
+) -> str:
+    """Add the compression suffix to a compressible single-file output."""
+    # Tables are written into a directory; each table file gets the suffix
+    if (
+        output_format not in COMPRESSIBLE_FORMATS
+        or output_format == OutputFormat.TABLES
+    ):
+        return output_file
+    return with_compression_suffix(output_file, compression)
+
 
 def validate_output_directory(output_file: str) -> Path:
     """Validate and create output directory if needed."""
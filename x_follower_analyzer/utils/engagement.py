@@ -0,0 +1,165 @@
+"""Engagement-level bucketing of tweets.
+
+Tweets are split by engagement (retweets + favorites) into the bottom half,
+the 50-90th percentile band and the top 10%. The two quantiles are computed
+once per dataset and every bucket is then counted with one vectorized
+comparison. ``QuantileSketch`` gives the same buckets, approximately, for
+engagement streamed in chunks that is too large to hold in memory.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+
+Values = Union[np.ndarray, Iterable[float]]
+
+
+@dataclass(frozen=True)
+class EngagementBuckets:
+    """Tweet counts per engagement level and the quantiles separating them."""
+
+    median: float
+    p90: float
+    low: int  # engagement <= median
+    medium: int  # median < engagement <= p90
+    high: int  # engagement > p90
+
+    @property
+    def total(self) -> int:
+        return self.low + self.medium + self.high
+
+    @property
+    def counts(self) -> List[int]:
+        """Counts ordered high, medium, low (the chart order)."""
+        return [self.high, self.medium, self.low]
+
+    @classmethod
+    def from_sketch(cls, sketch: "QuantileSketch") -> "EngagementBuckets":
+        """Estimate the buckets from a streaming quantile sketch."""
+        median = sketch.quantile(0.5)
+        p90 = sketch.quantile(0.9)
+        low = sketch.count_at_most(median)
+        high = sketch.count - sketch.count_at_most(p90)
+        return cls(median, p90, low, sketch.count - low - high, high)
+
+
+def engagement_buckets(values: Values) -> EngagementBuckets:
+    """Bucket engagement values by their median and 90th percentile.
+
+    Args:
+        values: Engagement of each tweet
+
+    Returns:
+        EngagementBuckets with exact counts
+
+    Raises:
+        ValueError: If there are no values
+    """
+    data = np.asarray(values if isinstance(values, np.ndarray) else list(values))
+    if data.size == 0:
+        raise ValueError("Cannot bucket an empty engagement series")
+
+    # One selection pass for both quantiles instead of one per comparison
+    median, p90 = np.percentile(data, [50, 90])
+    low = int(np.count_nonzero(data <= median))
+    high = int(np.count_nonzero(data > p90))
+    return EngagementBuckets(
+        float(median), float(p90), low, data.size - low - high, high
+    )
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch with bounded relative error.
+
+    Non-negative values are counted in logarithmic bins, so every quantile
+    estimate is within ``relative_accuracy`` of a true value of that rank and
+    memory grows with the logarithm of the value range rather than with the
+    number of values. Sketches of separate chunks can be merged.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize quantile sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def update(self, values: Values) -> None:
+        """Add a chunk of values to the sketch."""
+        data = np.asarray(
+            values if isinstance(values, np.ndarray) else list(values),
+            dtype=np.float64,
+        ).ravel()
+        if data.size == 0:
+            return
+        if np.any(data < 0):
+            raise ValueError("QuantileSketch only accepts non-negative values")
+
+        positive = data[data > 0]
+        self.zero_count += data.size - positive.size
+        self.count += data.size
+        if positive.size:
+            indices = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            keys, counts = np.unique(indices, return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                self._bins[key] = self._bins.get(key, 0) + count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add every value counted by another sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0 <= q <= 1)."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            raise ValueError("Cannot take a quantile of an empty sketch")
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if rank < seen:
+                return self._bin_value(index)
+        return self._bin_value(max(self._bins))
+
+    def count_at_most(self, value: float) -> int:
+        """Count values falling in bins up to the one holding ``value``."""
+        if value < 0:
+            return 0
+        if value == 0:
+            return self.zero_count
+
+        limit = self._bin_index(value)
+        return self.zero_count + sum(
+            count for index, count in self._bins.items() if index <= limit
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _bin_index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _bin_value(self, index: int) -> float:
+        """Representative value of a bin (relative error <= accuracy)."""
+        return 2 * self._gamma**index / (self._gamma + 1)
@@ -0,0 +1,250 @@
+"""Shared, memoized per-follower metrics.
+
+Exporters and charts read derived metrics (average retweets, retweet ratio,
+hashtag counts, ...) from here instead of recomputing them, so each
+follower's tweets are scanned once and every output reports the same numbers.
+"""
+
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ..models.user import FollowerAnalysis
+from .topics import TopicClassifier, get_topic_classifier
+
+
+@dataclass(frozen=True)
+class FollowerMetrics:
+    """Derived metrics for a single follower.
+
+    Averages are unrounded; each output rounds for display. Count mappings
+    are ordered by descending frequency, ties in first-seen order.
+    """
+
+    recent_tweets_count: int
+    liked_tweets_count: int
+    total_retweets: int
+    total_favorites: int
+    total_replies: int
+    retweets_count: int
+    hashtag_counts: Dict[str, int]
+    mention_counts: Dict[str, int]
+    liked_author_counts: Dict[str, int]
+    liked_topic_counts: Dict[str, int]
+    follower_to_following_ratio: float
+
+    @property
+    def total_engagement(self) -> int:
+        """Retweets, favorites and replies across recent tweets."""
+        return self.total_retweets + self.total_favorites + self.total_replies
+
+    @property
+    def avg_retweets(self) -> float:
+        """Average retweets per recent tweet."""
+        return self._per_tweet(self.total_retweets)
+
+    @property
+    def avg_favorites(self) -> float:
+        """Average favorites (likes) per recent tweet."""
+        return self._per_tweet(self.total_favorites)
+
+    @property
+    def avg_replies(self) -> float:
+        """Average replies per recent tweet."""
+        return self._per_tweet(self.total_replies)
+
+    @property
+    def avg_engagement(self) -> float:
+        """Average retweets plus favorites per recent tweet."""
+        return self._per_tweet(self.total_retweets + self.total_favorites)
+
+    @property
+    def retweet_ratio(self) -> float:
+        """Share of recent tweets that are retweets."""
+        return self._per_tweet(self.retweets_count)
+
+    def top_hashtags(self, limit: int) -> List[str]:
+        """Most frequent hashtags."""
+        return list(self.hashtag_counts)[:limit]
+
+    def top_mentions(self, limit: int) -> List[str]:
+        """Most frequent mentions."""
+        return list(self.mention_counts)[:limit]
+
+    def top_liked_authors(self, limit: int) -> List[Tuple[str, int]]:
+        """Most liked authors with their like counts."""
+        return list(self.liked_author_counts.items())[:limit]
+
+    def top_liked_topics(self, limit: int) -> List[str]:
+        """Highest scoring topics of liked tweets."""
+        return TopicClassifier.rank(self.liked_topic_counts)[:limit]
+
+    def _per_tweet(self, total: int) -> float:
+        if not self.recent_tweets_count:
+            return 0.0
+        return total / self.recent_tweets_count
+
+
+def _by_frequency(counter: Counter) -> Dict[str, int]:
+    """Order counts by descending frequency, keeping first-seen order on ties."""
+    return dict(counter.most_common())
+
+
+def compute_metrics(
+    analysis: FollowerAnalysis, liked_topic_counts: Optional[Dict[str, int]] = None
+) -> FollowerMetrics:
+    """Compute a follower's metrics in one pass over its tweets.
+
+    Args:
+        analysis: FollowerAnalysis object
+        liked_topic_counts: Precomputed topic scores of the liked tweets
+            (default: classify them with the shared topic classifier)
+
+    Returns:
+        FollowerMetrics for the follower
+    """
+    recent_tweets = analysis.recent_tweets or []
+    liked_tweets = analysis.liked_tweets or []
+
+    total_retweets = total_favorites = total_replies = retweets_count = 0
+    hashtags: Counter = Counter()
+    mentions: Counter = Counter()
+    for tweet in recent_tweets:
+        total_retweets += tweet.retweet_count
+        total_favorites += tweet.favorite_count
+        total_replies += tweet.reply_count
+        retweets_count += tweet.is_retweet
+        hashtags.update(tweet.hashtags or [])
+        mentions.update(tweet.mentions or [])
+
+    authors = Counter(liked_tweet.original_username for liked_tweet in liked_tweets)
+    if liked_topic_counts is None:
+        liked_topic_counts = get_topic_classifier().classify_texts(
+            liked_tweet.text for liked_tweet in liked_tweets
+        )
+    profile = analysis.profile
+
+    return FollowerMetrics(
+        recent_tweets_count=len(recent_tweets),
+        liked_tweets_count=len(liked_tweets),
+        total_retweets=total_retweets,
+        total_favorites=total_favorites,
+        total_replies=total_replies,
+        retweets_count=retweets_count,
+        hashtag_counts=_by_frequency(hashtags),
+        mention_counts=_by_frequency(mentions),
+        liked_author_counts=_by_frequency(authors),
+        liked_topic_counts=liked_topic_counts,
+        follower_to_following_ratio=(
+            profile.followers_count / max(profile.following_count, 1)
+        ),
+    )
+
+
+class MetricsEngine:
+    """Compute follower metrics once and serve them to every consumer.
+
+    Results are cached per FollowerAnalysis object in a bounded LRU. The cache
+    keeps a reference to each analysis, so an entry can never be served for a
+    different object that reused a freed ``id``. Safe to share across the
+    writer threads of a multi-format export.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize metrics engine.
+
+        Args:
+            max_entries: Maximum number of followers kept in the cache
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[int, Tuple[FollowerAnalysis, FollowerMetrics]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, analysis: FollowerAnalysis) -> FollowerMetrics:
+        """Get (computing on first use) the metrics of a follower.
+
+        Args:
+            analysis: FollowerAnalysis object
+
+        Returns:
+            FollowerMetrics for the follower
+        """
+        key = id(analysis)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] is analysis:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        return self._store(analysis, compute_metrics(analysis))
+
+    def get_many(self, analyses: List[FollowerAnalysis]) -> List[FollowerMetrics]:
+        """Get the metrics of several followers, in order.
+
+        Liked tweets of every uncached follower are topic-classified together
+        in a single batch scan.
+        """
+        with self._lock:
+            missing = [
+                analysis
+                for analysis in analyses
+                if self._cache.get(id(analysis), (None,))[0] is not analysis
+            ]
+
+        topic_counts = get_topic_classifier().classify_analyses(missing)
+        for analysis, liked_topic_counts in zip(missing, topic_counts):
+            self._store(analysis, compute_metrics(analysis, liked_topic_counts))
+
+        return [self.get(analysis) for analysis in analyses]
+
+    def _store(
+        self, analysis: FollowerAnalysis, metrics: FollowerMetrics
+    ) -> FollowerMetrics:
+        """Cache freshly computed metrics, evicting the least recently used."""
+        key = id(analysis)
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = (analysis, metrics)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return metrics
+
+    def invalidate(self, analysis: FollowerAnalysis) -> None:
+        """Drop a follower's cached metrics (e.g. after its tweets changed)."""
+        with self._lock:
+            entry = self._cache.get(id(analysis))
+            if entry is not None and entry[0] is analysis:
+                del self._cache[id(analysis)]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_default_engine = MetricsEngine()
+
+
+def get_metrics_engine() -> MetricsEngine:
+    """Get the process-wide metrics engine shared by exporters and charts."""
+    return _default_engine
+
+
+def get_metrics(analysis: FollowerAnalysis) -> FollowerMetrics:
+    """Get a follower's metrics from the shared engine."""
+    return _default_engine.get(analysis)
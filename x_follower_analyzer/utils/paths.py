@@ -0,0 +1,12 @@
+"""File layout helpers shared by the exporters and the readers of exports."""
+
+from pathlib import Path
+from typing import Union
+
+
+def columnar_table_path(output_file: Union[str, Path], table: str) -> Path:
+    """Get the path of a table written next to a columnar followers file."""
+    output_file = Path(output_file)
+    if table == "followers":
+        return output_file
+    return output_file.with_name(f"{output_file.stem}.{table}{output_file.suffix}")
@@ -0,0 +1,443 @@
+"""Seeded synthetic follower data for demos and performance testing.
+
+``SyntheticFollowers`` draws followers chunk by chunk: every numeric field of
+a chunk (follower counts, tweet and like counts, engagement, timestamps,
+pool indices for text) comes from one vectorized NumPy draw, and only the
+final objects are assembled in Python. Follower counts and engagement are
+heavy-tailed, tweet times follow a daily rhythm in each follower's local
+time, and followers write in Japanese or English.
+
+Only one chunk is held at a time, and streaming exporters consume any sized
+iterable, so millions of followers can be exported without materializing
+them::
+
+    NDJSONExporter("followers.ndjson.gz").export(SyntheticFollowers(1_000_000))
+"""
+
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.user import FollowerAnalysis, LikedTweet, Tweet, UserProfile
+
+DEFAULT_CHUNK_SIZE = 10_000
+# Fixed reference time, so a seed always yields the same data
+DEFAULT_END = datetime(2025, 1, 1)
+# Days of tweet and like history before the reference time
+HISTORY_DAYS = 30
+
+# Relative tweet volume per local hour of day (quiet nights, evening peak)
+HOURLY_ACTIVITY = np.array(
+    [3, 2, 1, 1, 1, 1, 2, 4, 6, 6, 5, 6, 8, 7, 5, 5, 5, 6, 7, 8, 10, 10, 9, 6],
+    dtype=np.float64,
+)
+HOURLY_ACTIVITY /= HOURLY_ACTIVITY.sum()
+
+# Language pools: (location, UTC offset in hours) pairs, with None for
+# followers who leave the location empty
+JA_LOCATIONS: List[Tuple[Optional[str], int]] = [
+    ("東京都", 9),
+    ("大阪府", 9),
+    ("神奈川県", 9),
+    ("福岡県", 9),
+    ("北海道", 9),
+    ("Japan", 9),
+    (None, 9),
+    (None, 9),
+]
+EN_LOCATIONS: List[Tuple[Optional[str], int]] = [
+    ("New York, NY", -5),
+    ("San Francisco, CA", -8),
+    ("Austin, TX", -6),
+    ("London, UK", 0),
+    ("Berlin, Germany", 1),
+    ("Toronto", -5),
+    ("Sydney", 10),
+    ("Bengaluru", 5),
+    (None, 0),
+    (None, -5),
+]
+JA_NAMES = ["佐藤", "鈴木", "高橋", "田中", "伊藤", "渡辺", "山本", "中村", "小林"]
+EN_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie"]
+JA_DESCRIPTIONS = [
+    "看護師として働いています。",
+    "駆け出しエンジニア。Pythonとデータ分析を勉強中",
+    "副業でブログ運営しています",
+    "旅行とカフェ巡りが好きです",
+    "",
+]
+EN_DESCRIPTIONS = [
+    "Software engineer. Opinions are my own.",
+    "Building things on the internet.",
+    "Coffee, code and travel.",
+    "Marketing @ a startup",
+    "",
+]
+JA_TEMPLATES = [
+    "今日は{topic}について勉強しました",
+    "{topic}の最新ニュースが気になる",
+    "週末は{topic}のイベントに行ってきました",
+    "{topic}って本当に奥が深い",
+    "おすすめの{topic}を教えてください",
+]
+EN_TEMPLATES = [
+    "Just shipped a new {topic} project",
+    "Thoughts on the future of {topic}?",
+    "Reading up on {topic} this weekend",
+    "Big news for {topic} today",
+    "Anyone else excited about {topic}?",
+]
+JA_TOPICS = ["プログラミング", "AI", "看護", "副業", "転職", "旅行", "グルメ", "資格"]
+EN_TOPICS = ["AI", "Python", "startups", "space", "crypto", "design", "marketing"]
+# Ordered by popularity (drawn with Zipf-like weights)
+JA_HASHTAGS = ["AI", "プログラミング", "駆け出しエンジニア", "副業", "看護師", "旅行"]
+EN_HASHTAGS = ["AI", "Python", "Tech", "Startup", "Crypto", "Space", "OpenSource"]
+# Accounts whose posts get liked, most popular first
+POPULAR_ACCOUNTS = [
+    "elonmusk",
+    "nhk_news",
+    "OpenAI",
+    "YahooNewsTopics",
+    "github",
+    "nikkei",
+    "NASA",
+    "Python",
+]
+
+# Profile pools per language
+LANGUAGES = {
+    "ja": (JA_LOCATIONS, JA_NAMES, JA_DESCRIPTIONS),
+    "en": (EN_LOCATIONS, EN_NAMES, EN_DESCRIPTIONS),
+}
+# Share of tweets with no, one and two hashtags
+HASHTAG_COUNT_SHARES = (0.5, 0.35, 0.15)
+
+
+def _zipf_weights(size: int) -> np.ndarray:
+    """Probabilities proportional to 1 / rank."""
+    weights = 1.0 / np.arange(1, size + 1)
+    return weights / weights.sum()
+
+
+def _object_array(values: list) -> np.ndarray:
+    """1-D object array of arbitrary values (tuples stay elements)."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+class _TextPool:
+    """Every tweet text of one language, so texts are drawn by index."""
+
+    def __init__(self, templates: List[str], topics: List[str], hashtags: List[str]):
+        sentences = [template.format(topic=t) for template in templates for t in topics]
+        weights = _zipf_weights(len(hashtags))
+        none, one, two = HASHTAG_COUNT_SHARES
+
+        tag_sets: List[Tuple[str, ...]] = [()]
+        probabilities = [none]
+        for a, tag in enumerate(hashtags):
+            tag_sets.append((tag,))
+            probabilities.append(one * weights[a])
+        # Two distinct hashtags, drawn by popularity without replacement
+        for a, first in enumerate(hashtags):
+            for b, second in enumerate(hashtags):
+                if a != b:
+                    tag_sets.append((first, second))
+                    probabilities.append(
+                        two * weights[a] * weights[b] / (1 - weights[a])
+                    )
+
+        self.sentence_count = len(sentences)
+        self.tag_sets = _object_array(tag_sets)
+        self.tag_probabilities = np.array(probabilities) / sum(probabilities)
+        self.texts = _object_array(
+            [
+                " ".join([sentence] + [f"#{tag}" for tag in tags])
+                for sentence in sentences
+                for tags in tag_sets
+            ]
+        )
+
+    def draw(
+        self, rng: np.random.Generator, size: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw ``size`` texts and their hashtag tuples."""
+        sentence = rng.integers(0, self.sentence_count, size)
+        tags = rng.choice(len(self.tag_sets), size, p=self.tag_probabilities)
+        return self.texts[sentence * len(self.tag_sets) + tags], self.tag_sets[tags]
+
+
+_TEXT_POOLS = {
+    "ja": _TextPool(JA_TEMPLATES, JA_TOPICS, JA_HASHTAGS),
+    "en": _TextPool(EN_TEMPLATES, EN_TOPICS, EN_HASHTAGS),
+}
+_UTC_OFFSETS = {
+    language: np.array([offset for _, offset in pools[0]], dtype=np.int64)
+    for language, pools in LANGUAGES.items()
+}
+
+
+class SyntheticFollowers:
+    """Reproducible synthetic follower analyses, drawn chunk by chunk.
+
+    The same ``seed`` and ``chunk_size`` always produce the same followers.
+    Iterating yields followers one at a time while holding a single chunk.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        seed: int = 0,
+        max_tweets: int = 10,
+        max_likes: int = 20,
+        japanese_share: float = 0.5,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        end: datetime = DEFAULT_END,
+    ):
+        """Initialize synthetic follower generator.
+
+        Args:
+            count: Followers to generate
+            seed: Random seed
+            max_tweets: Maximum recent tweets per follower
+            max_likes: Maximum liked tweets per follower
+            japanese_share: Share of followers writing in Japanese
+            chunk_size: Followers drawn per vectorized batch
+            end: Latest tweet and like time (naive UTC)
+
+        Raises:
+            ValueError: If a count or the Japanese share is out of range
+        """
+        if count < 0 or max_tweets < 0 or max_likes < 0 or chunk_size < 1:
+            raise ValueError("Counts must be non-negative and chunk_size positive")
+        if not 0 <= japanese_share <= 1:
+            raise ValueError("japanese_share must be between 0 and 1")
+
+        self.count = count
+        self.seed = seed
+        self.max_tweets = max_tweets
+        self.max_likes = max_likes
+        self.japanese_share = japanese_share
+        self.chunk_size = chunk_size
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[FollowerAnalysis]:
+        for chunk in self.chunks():
+            yield from chunk
+            # Release the chunk before the next one is drawn
+            del chunk
+
+    def chunks(self) -> Iterator[List[FollowerAnalysis]]:
+        """Yield the followers in lists of at most ``chunk_size``."""
+        for index, start in enumerate(range(0, self.count, self.chunk_size)):
+            rng = np.random.default_rng([self.seed, index])
+            yield self._chunk(rng, start, min(self.chunk_size, self.count - start))
+
+    def _chunk(
+        self, rng: np.random.Generator, start: int, size: int
+    ) -> List[FollowerAnalysis]:
+        """Draw one chunk of followers, numeric fields first."""
+        japanese = rng.random(size) < self.japanese_share
+        followers = np.floor(rng.lognormal(4.5, 1.8, size)).astype(np.int64)
+        following = np.minimum(np.floor(rng.lognormal(5.0, 1.1, size)), 7500)
+        statuses = np.floor(rng.lognormal(6.0, 1.8, size)).astype(np.int64)
+        # Larger accounts are more often verified
+        verified_p = np.clip(np.log10(followers + 1) / 6 - 0.45, 0.005, 0.9)
+        verified = rng.random(size) < verified_p
+        account_days = rng.integers(30, 6000, size)
+        # Pool indices are drawn once and wrapped to each language's pool
+        location_draw = rng.integers(0, 1 << 30, size)
+        name_draw = rng.integers(0, 1 << 30, size)
+        description_draw = rng.integers(0, 1 << 30, size)
+
+        # Inactive followers have no tweets; active ones cluster at the cap
+        tweet_counts = np.where(
+            rng.random(size) < 0.85,
+            np.minimum(
+                rng.negative_binomial(1, 1 / (1 + 1.5 * self.max_tweets), size),
+                self.max_tweets,
+            ),
+            0,
+        )
+        like_counts = np.minimum(
+            rng.negative_binomial(1, 1 / (1 + self.max_likes), size), self.max_likes
+        )
+
+        location_index = np.where(
+            japanese,
+            location_draw % len(JA_LOCATIONS),
+            location_draw % len(EN_LOCATIONS),
+        )
+        offsets = np.where(
+            japanese,
+            _UTC_OFFSETS["ja"][location_draw % len(JA_LOCATIONS)],
+            _UTC_OFFSETS["en"][location_draw % len(EN_LOCATIONS)],
+        )
+        user_ids = [str(start + i + 1) for i in range(size)]
+        # Position of each tweet among its author's tweets
+        positions = np.arange(tweet_counts.sum()) - np.repeat(
+            np.cumsum(tweet_counts) - tweet_counts, tweet_counts
+        )
+        tweets = self._tweets(
+            rng,
+            np.repeat(user_ids, tweet_counts).tolist(),
+            positions.tolist(),
+            np.repeat(followers, tweet_counts),
+            np.repeat(offsets, tweet_counts),
+            np.repeat(japanese, tweet_counts),
+        )
+        likes = self._liked_tweets(rng, np.repeat(japanese, like_counts))
+
+        created_at = (
+            np.datetime64(self.end, "us") - np.timedelta64(1, "D") * account_days
+        ).tolist()
+        columns = zip(
+            user_ids,
+            japanese.tolist(),
+            followers.tolist(),
+            following.astype(np.int64).tolist(),
+            statuses.tolist(),
+            verified.tolist(),
+            location_index.tolist(),
+            name_draw.tolist(),
+            description_draw.tolist(),
+            created_at,
+            tweet_counts.tolist(),
+            like_counts.tolist(),
+        )
+
+        analyses = []
+        tweet_at = like_at = 0
+        for row in columns:
+            user_id, ja, n_followers, n_following, n_statuses, is_verified = row[:6]
+            location, name, description, created, n_tweets, n_likes = row[6:]
+            locations, names, descriptions = LANGUAGES["ja" if ja else "en"]
+            profile = UserProfile(
+                user_id=user_id,
+                username=f"{'jp' if ja else 'en'}_user{user_id}",
+                display_name=f"{names[name % len(names)]}{user_id}",
+                description=descriptions[description % len(descriptions)] or None,
+                followers_count=n_followers,
+                following_count=n_following,
+                tweets_count=n_statuses,
+                location=locations[location][0],
+                verified=is_verified,
+                created_at=created,
+            )
+            analyses.append(
+                FollowerAnalysis(
+                    profile=profile,
+                    recent_tweets=tweets[tweet_at : tweet_at + n_tweets],
+                    liked_tweets=likes[like_at : like_at + n_likes],
+                )
+            )
+            tweet_at += n_tweets
+            like_at += n_likes
+        return analyses
+
+    def _times(self, rng: np.random.Generator, size: int, utc_offsets=0) -> np.ndarray:
+        """Draw times over the history window following HOURLY_ACTIVITY."""
+        midnight = np.datetime64(self.end.date(), "s")
+        local = (
+            midnight
+            - np.timedelta64(1, "D") * rng.integers(1, HISTORY_DAYS + 1, size)
+            + np.timedelta64(1, "h") * rng.choice(24, size, p=HOURLY_ACTIVITY)
+            + np.timedelta64(1, "s") * rng.integers(0, 3600, size)
+        )
+        times = local - np.timedelta64(1, "h") * utc_offsets
+        # Evenings west of UTC can fall after the end; keep their hour of day
+        end = np.datetime64(self.end, "s")
+        return np.where(times < end, times, times - np.timedelta64(1, "D"))
+
+    @staticmethod
+    def _texts(rng: np.random.Generator, japanese: np.ndarray) -> Tuple[list, list]:
+        """Draw texts and hashtag tuples in each author's language."""
+        texts = np.empty(len(japanese), dtype=object)
+        hashtags = np.empty(len(japanese), dtype=object)
+        for language, rows in (("ja", japanese), ("en", ~japanese)):
+            texts[rows], hashtags[rows] = _TEXT_POOLS[language].draw(
+                rng, int(rows.sum())
+            )
+        return texts.tolist(), hashtags.tolist()
+
+    def _tweets(
+        self,
+        rng: np.random.Generator,
+        user_ids: List[str],
+        positions: List[int],
+        followers: np.ndarray,
+        utc_offsets: np.ndarray,
+        japanese: np.ndarray,
+    ) -> List[Tweet]:
+        """Draw every recent tweet of a chunk, grouped by author."""
+        size = len(user_ids)
+        # Engagement grows with the author's audience and is heavy-tailed
+        favorites = np.floor(
+            rng.lognormal(-1.0, 1.6, size) * np.sqrt(followers + 1)
+        ).astype(np.int64)
+        texts, hashtags = self._texts(rng, japanese)
+        created_at = self._times(rng, size, utc_offsets).astype("datetime64[us]")
+        rows = zip(
+            user_ids,
+            positions,
+            texts,
+            hashtags,
+            created_at.tolist(),
+            favorites.tolist(),
+            rng.binomial(favorites, 0.15).tolist(),
+            rng.binomial(favorites, 0.05).tolist(),
+            (rng.random(size) < 0.15).tolist(),
+        )
+        tweets = []
+        for row in rows:
+            user_id, position, text, tags, created, likes, retweets, replies = row[:8]
+            tweets.append(
+                Tweet(
+                    tweet_id=f"{user_id}-{position}",
+                    user_id=user_id,
+                    text=text,
+                    created_at=created,
+                    retweet_count=retweets,
+                    favorite_count=likes,
+                    reply_count=replies,
+                    is_retweet=row[8],
+                    hashtags=list(tags),
+                )
+            )
+        return tweets
+
+    def _liked_tweets(
+        self, rng: np.random.Generator, japanese: np.ndarray
+    ) -> List[LikedTweet]:
+        """Draw every liked tweet of a chunk, grouped by follower."""
+        size = len(japanese)
+        authors = rng.choice(
+            len(POPULAR_ACCOUNTS), size, p=_zipf_weights(len(POPULAR_ACCOUNTS))
+        )
+        liked_at = self._times(rng, size)
+        # Posts are liked a few hours (sometimes days) after being posted
+        age = np.floor(rng.lognormal(9.0, 1.5, size)).astype(np.int64)
+        created_at = liked_at - np.timedelta64(1, "s") * age
+        texts, _ = self._texts(rng, japanese)
+        return [
+            LikedTweet(
+                tweet_id=tweet_id,
+                original_user_id=str(1000 + author),
+                original_username=POPULAR_ACCOUNTS[author],
+                text=text,
+                created_at=created,
+                liked_at=liked,
+            )
+            for tweet_id, author, text, created, liked in zip(
+                rng.integers(10**17, 10**18, size).astype(str).tolist(),
+                authors.tolist(),
+                texts,
+                created_at.astype("datetime64[us]").tolist(),
+                liked_at.astype("datetime64[us]").tolist(),
+            )
+        ]
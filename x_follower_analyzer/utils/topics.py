@@ -0,0 +1,232 @@
+"""Keyword-based topic classification for liked tweets.
+
+One taxonomy (topic -> keywords) is compiled into a single case-insensitive
+alternation regex, so each text is scanned once regardless of how many
+keywords the taxonomy holds.
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..models.user import FollowerAnalysis
+
+# Environment variable pointing to a JSON file that overrides the taxonomy
+TAXONOMY_ENV_VAR = "X_TOPIC_TAXONOMY"
+
+DEFAULT_TOPIC_TAXONOMY: Dict[str, List[str]] = {
+    "医療・看護": ["医療", "看護", "病院", "医師", "ナース", "患者", "治療", "健康"],
+    "副業・転職": [
+        "副業",
+        "サイドビジネス",
+        "在宅ワーク",
+        "フリーランス",
+        "転職",
+        "求人",
+    ],
+    "教育・学習": ["教育", "学習", "勉強", "研修", "スキル", "資格", "講座"],
+    "IT・テック": ["プログラミング", "AI", "DX", "システム", "アプリ", "データ"],
+    "ビジネス": ["ビジネス", "経営", "マーケティング", "営業", "起業"],
+    "ライフスタイル": ["ライフスタイル", "趣味", "旅行", "グルメ", "ファッション"],
+}
+
+# Never appears in a keyword, so batch scans cannot match across two texts
+_TEXT_SEPARATOR = "\x00"
+
+
+def load_taxonomy(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Load a topic taxonomy.
+
+    Args:
+        path: JSON file mapping topic names to keyword lists. Defaults to the
+            file named by ``X_TOPIC_TAXONOMY``, then the built-in taxonomy.
+
+    Returns:
+        Mapping of topic name to keywords
+
+    Raises:
+        ValueError: If the file is not a mapping of topics to keyword lists
+    """
+    path = path or os.getenv(TAXONOMY_ENV_VAR)
+    if not path:
+        return DEFAULT_TOPIC_TAXONOMY
+
+    with open(path, "r", encoding="utf-8") as f:
+        taxonomy = json.load(f)
+
+    if not isinstance(taxonomy, dict) or not all(
+        isinstance(keywords, list) and all(isinstance(k, str) for k in keywords)
+        for keywords in taxonomy.values()
+    ):
+        raise ValueError(
+            f"Invalid topic taxonomy in {path}: expected {{topic: [keywords]}}"
+        )
+    return taxonomy
+
+
+class TopicClassifier:
+    """Classify texts into topics with one compiled multi-keyword pattern.
+
+    A topic's score for a text is the number of its distinct keywords found
+    in that text; scores add up across texts. Matching is case-insensitive
+    and keywords may overlap (``看護`` is found inside ``看護師``).
+    """
+
+    def __init__(self, taxonomy: Optional[Dict[str, List[str]]] = None):
+        """Initialize topic classifier.
+
+        Args:
+            taxonomy: Mapping of topic name to keywords (default: load_taxonomy())
+        """
+        self.taxonomy = taxonomy if taxonomy is not None else load_taxonomy()
+        self.topics = list(self.taxonomy)
+
+        # Normalized keyword -> topics it belongs to
+        self._keyword_topics: Dict[str, List[str]] = {}
+        for topic, keywords in self.taxonomy.items():
+            for keyword in keywords:
+                if keyword:
+                    topics = self._keyword_topics.setdefault(keyword.lower(), [])
+                    if topic not in topics:
+                        topics.append(topic)
+
+        # The alternation tries longer keywords first, so at any position it
+        # reports the longest match; shorter keywords matching at the same
+        # position are exactly its prefixes, recorded here.
+        keywords = sorted(self._keyword_topics, key=len, reverse=True)
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+        self._pattern: Optional[re.Pattern] = (
+            re.compile(
+                "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))",
+                re.IGNORECASE,
+            )
+            if keywords
+            else None
+        )
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        """Get the distinct (normalized) keywords found in a text."""
+        if self._pattern is None or not text:
+            return set()
+
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text):
+            found.update(self._keywords_at(match.group(1)))
+        return found
+
+    def classify(self, text: str) -> Dict[str, int]:
+        """Score a single text.
+
+        Returns:
+            Mapping of matched topic to score, in taxonomy order
+        """
+        return self._score([self.matched_keywords(text)])
+
+    def classify_texts(self, texts: Iterable[str]) -> Dict[str, int]:
+        """Score several texts together in a single scan.
+
+        Returns:
+            Mapping of matched topic to summed score, in taxonomy order
+        """
+        return self._score(self._matched_keywords_batch(list(texts)))
+
+    def classify_batch(self, text_groups: List[List[str]]) -> List[Dict[str, int]]:
+        """Score many groups of texts (e.g. every follower's likes in a run).
+
+        All groups are scanned together in one pass over the concatenated text.
+
+        Args:
+            text_groups: One list of texts per group
+
+        Returns:
+            Topic scores per group, in input order
+        """
+        texts = [text for group in text_groups for text in group]
+        matched = self._matched_keywords_batch(texts)
+
+        results = []
+        start = 0
+        for group in text_groups:
+            results.append(self._score(matched[start : start + len(group)]))
+            start += len(group)
+        return results
+
+    def classify_analyses(
+        self, analyses: List[FollowerAnalysis]
+    ) -> List[Dict[str, int]]:
+        """Score the liked tweets of every follower in a run."""
+        return self.classify_batch(
+            [
+                [liked_tweet.text for liked_tweet in analysis.liked_tweets or []]
+                for analysis in analyses
+            ]
+        )
+
+    @staticmethod
+    def rank(scores: Dict[str, int]) -> List[str]:
+        """Topics ordered by descending score, ties in taxonomy order."""
+        return [
+            topic
+            for topic, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        ]
+
+    def _matched_keywords_batch(self, texts: List[str]) -> List[Set[str]]:
+        """Find each text's distinct keywords with one scan over all texts."""
+        found: List[Set[str]] = [set() for _ in texts]
+        if self._pattern is None or not texts:
+            return found
+
+        # Start offset of every text inside the joined string
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + len(_TEXT_SEPARATOR)
+
+        joined = _TEXT_SEPARATOR.join(texts)
+        for match in self._pattern.finditer(joined):
+            index = bisect.bisect_right(offsets, match.start()) - 1
+            found[index].update(self._keywords_at(match.group(1)))
+        return found
+
+    def _keywords_at(self, matched: str) -> List[str]:
+        """Keywords implied by the longest keyword match ``matched``."""
+        keywords = self._prefixes.get(matched.lower())
+        if keywords is None:
+            # Case-insensitive matching and str.lower() disagree on a few
+            # characters; fall back to comparing with the regex semantics
+            keyword = next(
+                k
+                for k in self._prefixes
+                if re.fullmatch(re.escape(k), matched, re.IGNORECASE)
+            )
+            keywords = self._prefixes[keyword]
+        return keywords
+
+    def _score(self, matched: List[Set[str]]) -> Dict[str, int]:
+        """Turn per-text keyword sets into topic scores in taxonomy order."""
+        counts: Counter = Counter()
+        for keywords in matched:
+            for keyword in keywords:
+                counts.update(self._keyword_topics[keyword])
+        return {topic: counts[topic] for topic in self.topics if counts[topic]}
+
+
+_default_classifier: Optional[TopicClassifier] = None
+_default_lock = threading.Lock()
+
+
+def get_topic_classifier() -> TopicClassifier:
+    """Get the shared classifier for the configured taxonomy (compiled once)."""
+    global _default_classifier
+    with _default_lock:
+        if _default_classifier is None:
+            _default_classifier = TopicClassifier()
+        return _default_classifier
@@ -0,0 +1,294 @@
+"""Day-of-week × hour tweet activity.
+
+Tweets are reduced to epoch seconds once; the 7×24 heatmap is then a single
+``np.bincount`` over week-slot indices, so binning costs a few array passes
+however many tweets there are. Heatmaps of separate chunks add up, so very
+large collections can be binned chunk by chunk.
+
+In-memory analyses are reduced by gathering every tweet time into one list
+and converting it as a batch; for exports too large to load,
+``read_tweet_timestamps`` reads the times of a SQLite or Parquet/Feather
+export straight into arrays.
+
+Timestamps can be shifted to each follower's local time. Offsets are
+inferred from profile locations with a keyword table of standard-time UTC
+offsets (daylight saving time is ignored); unknown locations stay in UTC.
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..models.user import FollowerAnalysis
+from ..utils.paths import columnar_table_path
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# Recommended posting slots shown with the heatmap
+BEST_TIMES = 3
+
+SECONDS_PER_HOUR = 3600
+# 1970-01-01 was a Thursday (Monday = 0)
+_EPOCH_WEEKDAY = 3
+
+# Location keyword -> standard-time UTC offset in hours
+LOCATION_UTC_OFFSETS: Dict[str, float] = {
+    **dict.fromkeys(
+        ["japan", "tokyo", "osaka", "kyoto", "nagoya", "yokohama", "fukuoka"], 9
+    ),
+    **dict.fromkeys(["日本", "東京", "大阪", "京都", "名古屋", "横浜", "福岡"], 9),
+    **dict.fromkeys(["korea", "seoul", "한국", "서울"], 9),
+    **dict.fromkeys(["china", "beijing", "shanghai", "中国", "北京", "上海"], 8),
+    **dict.fromkeys(["hong kong", "香港", "taiwan", "taipei", "台湾", "台北"], 8),
+    **dict.fromkeys(["singapore", "manila", "philippines"], 8),
+    **dict.fromkeys(["india", "mumbai", "delhi", "bangalore", "bengaluru"], 5.5),
+    **dict.fromkeys(["dubai", "uae"], 4),
+    **dict.fromkeys(
+        ["germany", "berlin", "france", "paris", "spain", "madrid", "italy"], 1
+    ),
+    **dict.fromkeys(["rome", "netherlands", "amsterdam", "sweden", "stockholm"], 1),
+    **dict.fromkeys(
+        ["uk", "united kingdom", "england", "london", "ireland", "dublin"], 0
+    ),
+    **dict.fromkeys(["portugal", "lisbon"], 0),
+    **dict.fromkeys(["brazil", "são paulo", "sao paulo", "rio de janeiro"], -3),
+    **dict.fromkeys(
+        ["new york", "nyc", "boston", "miami", "atlanta", "toronto", "montreal"], -5
+    ),
+    **dict.fromkeys(["chicago", "texas", "dallas", "houston", "austin"], -6),
+    **dict.fromkeys(["mexico city", "guadalajara"], -6),
+    **dict.fromkeys(["denver", "colorado"], -7),
+    **dict.fromkeys(
+        ["california", "san francisco", "los angeles", "seattle", "vancouver"], -8
+    ),
+    **dict.fromkeys(["silicon valley", "bay area", "san diego", "sf"], -8),
+    **dict.fromkeys(["sydney", "melbourne", "brisbane"], 10),
+    **dict.fromkeys(["new zealand", "auckland"], 12),
+}
+
+# Longest keywords first, so the most specific place at a position wins
+_LOCATION_PATTERN = re.compile(
+    r"(?<![a-z])(?:"
+    + "|".join(
+        re.escape(keyword) for keyword in sorted(LOCATION_UTC_OFFSETS, key=len)[::-1]
+    )
+    + r")(?![a-z])",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class PostingSlot:
+    """One hour of the week and the tweets posted in it."""
+
+    weekday: int  # Monday = 0
+    hour: int
+    tweets: int
+
+    @property
+    def label(self) -> str:
+        """Slot label such as ``Mon 09:00``."""
+        return f"{WEEKDAYS[self.weekday]} {self.hour:02d}:00"
+
+
+@lru_cache(maxsize=4096)
+def infer_utc_offset(location: Optional[str]) -> Optional[float]:
+    """Infer the UTC offset (hours) of a free-text profile location.
+
+    Returns:
+        Standard-time offset of the first known place named, or None
+    """
+    if not location:
+        return None
+    match = _LOCATION_PATTERN.search(location)
+    return LOCATION_UTC_OFFSETS[match.group(0).lower()] if match else None
+
+
+def follower_utc_offsets(locations: Iterable[Optional[str]]) -> np.ndarray:
+    """UTC offsets in seconds per follower (0 where none can be inferred)."""
+    return np.fromiter(map(utc_offset_seconds, locations), dtype=np.int64)
+
+
+def utc_offset_seconds(location: Optional[str]) -> int:
+    """UTC offset in seconds of a profile location (0 when unknown)."""
+    return int((infer_utc_offset(location) or 0) * SECONDS_PER_HOUR)
+
+
+def epoch_seconds_array(times: Sequence[datetime]) -> np.ndarray:
+    """Epoch seconds of many tweet times at once (naive times are UTC).
+
+    pandas converts the whole batch, naive and timezone-aware times alike, in
+    compiled code rather than with one ``timestamp()`` call per tweet.
+    """
+    micros = pd.to_datetime(list(times), utc=True).as_unit("us").asi8
+    return micros // 1_000_000
+
+
+def tweet_timestamps(
+    analyses: Iterable[FollowerAnalysis], local_time: bool = False
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Collect the recent tweet times of every follower as arrays.
+
+    The times are gathered into one list and converted as a single batch;
+    use ``read_tweet_timestamps`` to bin an export without loading it.
+
+    Args:
+        analyses: Follower analyses
+        local_time: Also return each tweet's inferred UTC offset
+
+    Returns:
+        Epoch seconds per tweet, and UTC offsets in seconds per tweet (None
+        unless ``local_time``)
+    """
+    analyses = list(analyses)
+    times: List[datetime] = []
+    counts = np.zeros(len(analyses), dtype=np.int64)
+    for i, analysis in enumerate(analyses):
+        before = len(times)
+        times.extend(
+            tweet.created_at
+            for tweet in analysis.recent_tweets or []
+            if tweet.created_at
+        )
+        counts[i] = len(times) - before
+    timestamps = epoch_seconds_array(times)
+    if not local_time:
+        return timestamps, None
+
+    offsets = follower_utc_offsets(analysis.profile.location for analysis in analyses)
+    return timestamps, np.repeat(offsets, counts)
+
+
+def read_tweet_timestamps(
+    path: Union[str, Path], local_time: bool = False
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Read the tweet times of a SQLite or Parquet/Feather export as arrays.
+
+    No analyses or Tweet objects are built: SQLite converts the stored times
+    to epoch seconds itself, and Arrow casts the timestamp column as a whole.
+
+    Args:
+        path: SQLite database, or the followers file of a ``.parquet`` /
+            ``.feather`` export (its ``tweets`` table is read next to it)
+        local_time: Also return each tweet's inferred UTC offset
+
+    Returns:
+        Epoch seconds per tweet, and UTC offsets in seconds per tweet (None
+        unless ``local_time``)
+    """
+    path = Path(path)
+    if path.suffix in (".parquet", ".feather"):
+        return _read_columnar_timestamps(path, local_time)
+    return _read_sqlite_timestamps(path, local_time)
+
+
+def _read_sqlite_timestamps(
+    path: Path, local_time: bool
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Read tweet times (and author offsets) from a SQLite export."""
+    if not path.exists():
+        raise FileNotFoundError(f"SQLite export not found: {path}")
+
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        epoch = "CAST(strftime('%s', tweets.created_at) AS INTEGER)"
+        if not local_time:
+            rows = connection.execute(
+                f"SELECT {epoch} FROM tweets "  # nosec B608 - constant SQL
+                "WHERE tweets.created_at IS NOT NULL"
+            )
+            return np.fromiter(chain.from_iterable(rows), dtype=np.int64), None
+
+        connection.create_function(
+            "utc_offset", 1, utc_offset_seconds, deterministic=True
+        )
+        rows = connection.execute(
+            f"SELECT {epoch}, utc_offset(followers.location) "  # nosec B608
+            "FROM tweets LEFT JOIN followers USING (user_id) "
+            "WHERE tweets.created_at IS NOT NULL"
+        )
+        pairs = np.fromiter(chain.from_iterable(rows), dtype=np.int64)
+    finally:
+        connection.close()
+    pairs = pairs.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _read_columnar_timestamps(
+    path: Path, local_time: bool
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Read tweet times (and author offsets) from a Parquet/Feather export."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Reading columnar exports requires pyarrow. "
+            "Install it with: pip install 'x-follower-analyzer[columnar]'"
+        ) from e
+
+    read_table = pq.read_table if path.suffix == ".parquet" else feather.read_table
+    tweets = read_table(
+        str(columnar_table_path(path, "tweets")), columns=["user_id", "created_at"]
+    )
+    tweets = tweets.filter(pc.is_valid(tweets["created_at"]))
+    # Timestamps are stored in microseconds since the epoch (UTC)
+    micros = tweets["created_at"].cast(pa.int64()).to_numpy()
+    timestamps = micros // 1_000_000
+    if not local_time:
+        return timestamps, None
+
+    followers = read_table(str(path), columns=["user_id", "location"])
+    # One trailing zero offset for tweets whose author is missing
+    offsets = np.append(follower_utc_offsets(followers["location"].to_pylist()), 0)
+    authors = pc.index_in(tweets["user_id"], value_set=followers["user_id"])
+    authors = pc.fill_null(authors, -1).to_numpy()
+    return timestamps, offsets[authors]
+
+
+def activity_heatmap(timestamps, utc_offsets=None) -> np.ndarray:
+    """Count tweets per hour of the week.
+
+    Args:
+        timestamps: Epoch seconds (UTC)
+        utc_offsets: Offsets in seconds added to the timestamps, one per
+            timestamp or a single value (None keeps UTC)
+
+    Returns:
+        Counts of shape (7, 24), indexed [weekday (Monday = 0), hour]
+    """
+    seconds = np.asarray(timestamps, dtype=np.int64)
+    if utc_offsets is not None:
+        seconds = seconds + np.asarray(utc_offsets, dtype=np.int64)
+
+    hours = seconds // SECONDS_PER_HOUR
+    slots = (hours // 24 + _EPOCH_WEEKDAY) % 7 * 24 + hours % 24
+    return np.bincount(slots, minlength=7 * 24).reshape(7, 24)
+
+
+def best_posting_times(heatmap, n: int = BEST_TIMES) -> List[PostingSlot]:
+    """Find the busiest hours of the week.
+
+    Args:
+        heatmap: Tweet counts of shape (7, 24)
+        n: Slots to recommend
+
+    Returns:
+        Up to ``n`` non-empty slots, busiest first (earlier in the week on ties)
+    """
+    counts = np.asarray(heatmap).ravel()
+    busiest = np.argsort(-counts, kind="stable")[:n]
+    return [
+        PostingSlot(int(slot) // 24, int(slot) % 24, int(counts[slot]))
+        for slot in busiest
+        if counts[slot]
+    ]
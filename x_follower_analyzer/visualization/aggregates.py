@@ -0,0 +1,226 @@
+"""Dashboard statistics accumulated in a single pass over the followers.
+
+Every aggregate behind the dashboard's summary cards and charts is updated
+once per follower as it arrives, so the static dashboard reads all of them
+(and every static chart payload) from one traversal, and a live dashboard
+refreshes in time proportional to the chart sizes only. Tweet times are
+buffered and binned into the weekday × hour heatmap in batches (optionally
+also in each follower's inferred local time). Accumulators of separate shards
+can be merged.
+"""
+
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ..models.user import FollowerAnalysis
+from ..utils.metrics import get_metrics
+from .activity import activity_heatmap, epoch_seconds_array, utc_offset_seconds
+
+# Log-spaced follower count bins per decade (1-9, 10-99, ... split in four)
+FOLLOWER_BINS_PER_DECADE = 4
+TOP_LOCATIONS = 10
+TOP_HASHTAGS = 15
+# Tweet times buffered before they are binned into the heatmap
+TWEET_TIME_BATCH = 65536
+# Per-follower values kept for the interactive scatter plots
+FOLLOWER_COLUMNS = (
+    "username",
+    "followers_count",
+    "following_count",
+    "avg_retweets",
+    "avg_likes",
+    "recent_tweets_count",
+)
+
+
+class DashboardAggregates:
+    """Running dashboard statistics, updated with each added follower."""
+
+    def __init__(self, keep_followers: bool = True, local_time: bool = False):
+        """Initialize empty aggregates.
+
+        Args:
+            keep_followers: Keep the per-follower FOLLOWER_COLUMNS needed by
+                the interactive scatter plots (memory grows with followers)
+            local_time: Also bin tweet times in each follower's local time
+                inferred from their location (UTC where unknown)
+        """
+        self.keep_followers = keep_followers
+        self.local_time = local_time
+        self.total_followers = 0
+        self.verified_count = 0
+        self.followers_sum = 0
+        self.total_tweets = 0
+        self.locations: Counter = Counter()
+        self.unknown_locations = 0
+        self.hashtags: Counter = Counter()
+        # Recent tweets collected per follower -> followers
+        self.activity: Counter = Counter()
+        # Log-spaced follower count bin -> followers
+        self.follower_bins: Counter = Counter()
+        self._tweet_heatmap = np.zeros((7, 24), dtype=np.int64)
+        self._local_tweet_heatmap = np.zeros((7, 24), dtype=np.int64)
+        self._pending_times: List[datetime] = []
+        # UTC offset in seconds and buffered tweet times of each follower
+        self._pending_offsets: List[int] = []
+        self._pending_counts: List[int] = []
+        self._followers: Dict[str, list] = {name: [] for name in FOLLOWER_COLUMNS}
+
+    @classmethod
+    def from_analyses(
+        cls,
+        analyses: Iterable[FollowerAnalysis],
+        keep_followers: bool = True,
+        local_time: bool = False,
+    ) -> "DashboardAggregates":
+        """Accumulate every follower of ``analyses`` in one pass."""
+        aggregates = cls(keep_followers, local_time)
+        for analysis in analyses:
+            aggregates.add(analysis)
+        return aggregates
+
+    def add(self, analysis: FollowerAnalysis) -> None:
+        """Fold one follower into the aggregates."""
+        profile = analysis.profile
+        metrics = get_metrics(analysis)
+
+        self.total_followers += 1
+        self.verified_count += profile.verified
+        self.followers_sum += profile.followers_count
+        self.total_tweets += metrics.recent_tweets_count
+        if profile.location:
+            self.locations[profile.location] += 1
+        else:
+            self.unknown_locations += 1
+        self.hashtags.update(metrics.hashtag_counts)
+        self.activity[metrics.recent_tweets_count] += 1
+        self.follower_bins[self.follower_bin(profile.followers_count)] += 1
+        pending = len(self._pending_times)
+        self._pending_times.extend(
+            tweet.created_at for tweet in analysis.recent_tweets if tweet.created_at
+        )
+        if self.local_time:
+            self._pending_offsets.append(utc_offset_seconds(profile.location))
+            self._pending_counts.append(len(self._pending_times) - pending)
+        if len(self._pending_times) >= TWEET_TIME_BATCH:
+            self._bin_pending_times()
+
+        if self.keep_followers:
+            followers = self._followers
+            followers["username"].append(profile.username)
+            followers["followers_count"].append(profile.followers_count)
+            followers["following_count"].append(profile.following_count)
+            followers["avg_retweets"].append(metrics.avg_retweets)
+            followers["avg_likes"].append(metrics.avg_favorites)
+            followers["recent_tweets_count"].append(metrics.recent_tweets_count)
+
+    def merge(self, other: "DashboardAggregates") -> None:
+        """Add every follower accumulated by another instance (e.g. a shard)."""
+        if other.keep_followers != self.keep_followers:
+            raise ValueError("Cannot merge aggregates with and without followers")
+        if other.local_time != self.local_time:
+            raise ValueError("Cannot merge aggregates with and without local time")
+
+        self.total_followers += other.total_followers
+        self.verified_count += other.verified_count
+        self.followers_sum += other.followers_sum
+        self.total_tweets += other.total_tweets
+        self.locations.update(other.locations)
+        self.unknown_locations += other.unknown_locations
+        self.hashtags.update(other.hashtags)
+        self.activity.update(other.activity)
+        self.follower_bins.update(other.follower_bins)
+        self._tweet_heatmap += other.tweet_heatmap
+        if self.local_time:
+            self._local_tweet_heatmap += other.local_tweet_heatmap
+        for name, values in other._followers.items():
+            self._followers[name].extend(values)
+
+    @property
+    def tweet_heatmap(self) -> np.ndarray:
+        """Tweets per weekday (Monday = 0) and hour (UTC), shape (7, 24)."""
+        self._bin_pending_times()
+        return self._tweet_heatmap
+
+    @property
+    def local_tweet_heatmap(self) -> np.ndarray:
+        """Tweets per weekday and hour in the followers' local time."""
+        if not self.local_time:
+            raise ValueError("Local tweet times were not binned")
+        self._bin_pending_times()
+        return self._local_tweet_heatmap
+
+    @property
+    def tweet_hours(self) -> np.ndarray:
+        """Tweets per hour of the day (UTC)."""
+        return self.tweet_heatmap.sum(axis=0)
+
+    def _bin_pending_times(self) -> None:
+        """Bin the buffered tweet times into the heatmap as one batch."""
+        if self._pending_times:
+            timestamps = epoch_seconds_array(self._pending_times)
+            self._tweet_heatmap += activity_heatmap(timestamps)
+            if self.local_time:
+                offsets = np.repeat(self._pending_offsets, self._pending_counts)
+                self._local_tweet_heatmap += activity_heatmap(timestamps, offsets)
+            self._pending_times = []
+        self._pending_offsets = []
+        self._pending_counts = []
+
+    def follower_columns(self) -> Dict[str, np.ndarray]:
+        """Get the per-follower FOLLOWER_COLUMNS as arrays, in insertion order."""
+        if not self.keep_followers:
+            raise ValueError("Per-follower columns were not kept")
+        return {name: np.asarray(values) for name, values in self._followers.items()}
+
+    @staticmethod
+    def follower_bin(followers_count: int) -> int:
+        """Index of the log-spaced bin holding a follower count."""
+        return int(math.log10(max(followers_count, 0) + 1) * FOLLOWER_BINS_PER_DECADE)
+
+    @staticmethod
+    def follower_bin_label(index: int) -> str:
+        """Label of a follower count bin (its lower bound)."""
+        lower = math.ceil(10 ** (index / FOLLOWER_BINS_PER_DECADE) - 1)
+        return f"{lower:,}+"
+
+    def summary_stats(self) -> Dict[str, Any]:
+        """Summary statistics in the shape of the static dashboard's cards."""
+        total = self.total_followers
+        return {
+            "total_followers": total,
+            "verified_count": self.verified_count,
+            "verification_rate": (self.verified_count / total * 100) if total else 0,
+            "avg_followers": int(self.followers_sum / total) if total else 0,
+            "unique_locations": len(self.locations),
+            "total_tweets_analyzed": self.total_tweets,
+            "unique_hashtags": len(self.hashtags),
+            "analysis_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def follower_distribution(self) -> Tuple[List[str], List[int]]:
+        """Followers per log-spaced follower count bin, empty bins included."""
+        if not self.follower_bins:
+            return [], []
+        indices = range(max(self.follower_bins) + 1)
+        return (
+            [self.follower_bin_label(i) for i in indices],
+            [self.follower_bins.get(i, 0) for i in indices],
+        )
+
+    def top_locations(self, limit: int = TOP_LOCATIONS) -> List[Tuple[str, int]]:
+        """Most common follower locations."""
+        return self.locations.most_common(limit)
+
+    def top_hashtags(self, limit: int = TOP_HASHTAGS) -> List[Tuple[str, int]]:
+        """Most used hashtags across recent tweets."""
+        return self.hashtags.most_common(limit)
+
+    def activity_distribution(self) -> Tuple[List[int], List[int]]:
+        """Followers per number of recent tweets collected."""
+        counts = sorted(self.activity)
+        return counts, [self.activity[count] for count in counts]
@@ -0,0 +1,74 @@
+"""Shared asset directory for dashboards that link their charts and scripts.
+
+Instead of inlining base64 images and the plotly.js bundle, a dashboard can
+write them into an asset directory and reference them by relative URL. Chart
+files are named after a hash of their content and plotly.js after its
+version, so any number of dashboards can share one directory: each file is
+written once and identical charts are stored once.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+class DashboardAssets:
+    """Content-addressed asset directory shared between dashboards."""
+
+    def __init__(self, asset_dir: Union[str, Path]):
+        """Initialize dashboard assets.
+
+        Args:
+            asset_dir: Directory holding chart images and plotly.js
+        """
+        self.asset_dir = Path(asset_dir)
+
+    def write_chart(self, name: str, data: bytes) -> Path:
+        """Write a PNG chart, returning its path.
+
+        Args:
+            name: Chart name (used as the file name prefix)
+            data: PNG image data
+
+        Returns:
+            Path of the chart file
+        """
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        path = self.asset_dir / "charts" / f"{name}-{digest}.png"
+        self._write_once(path, data)
+        return path
+
+    def plotly_js(self) -> Path:
+        """Write the plotly.js bundle once, returning its path."""
+        # Imported here so only dashboards load plotly
+        import plotly
+        from plotly.offline import get_plotlyjs
+
+        path = self.asset_dir / f"plotly-{plotly.__version__}.min.js"
+        if not path.exists():
+            self._write_once(path, get_plotlyjs().encode("utf-8"))
+        return path
+
+    @staticmethod
+    def url(path: Path, html_path: Union[str, Path]) -> str:
+        """Get the URL of an asset relative to an HTML file."""
+        html_dir = Path(html_path).resolve().parent
+        return Path(os.path.relpath(path.resolve(), html_dir)).as_posix()
+
+    @staticmethod
+    def _write_once(path: Path, data: bytes) -> None:
+        """Atomically write a file unless it already exists."""
+        if path.exists():
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -1,242 +1,741 @@
-"""Chart generation utilities for follower analysis visualization."""
+"""Chart generation utilities for follower analysis visualization.
 
-import io
-import base64
-from typing import List, Dict, Any, Tuple
+Every static chart is split into a payload extractor, which reduces the
+analyses to the few lists and counts the chart plots, and a module-level
+renderer that draws the payload. Payloads are small and picklable, so
+renderers can run in worker processes (pyplot state is not thread-safe).
+Rendering every static chart builds all payloads from one
+``DashboardAggregates`` pass instead of running each extractor.
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
-import pandas as pd
 from wordcloud import WordCloud
-import numpy as np
 
+from ..models.config import RenderProfile
 from ..models.user import FollowerAnalysis
-
-
-class ChartGenerator:
-    """Generate various charts and visualizations for follower analysis."""
-
-    def __init__(self, style: str = "seaborn-v0_8", figsize: Tuple[int, int] = (12, 8)):
-        """Initialize chart generator with style settings."""
-        self.style = style
-        self.figsize = figsize
-        plt.style.use(style)
-        sns.set_palette("husl")
-
-    def create_follower_distribution_chart(
-        self, analyses: List[FollowerAnalysis]
-    ) -> str:
-        """Create follower count distribution chart."""
-        follower_counts = [analysis.profile.followers_count for analysis in analyses]
-
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=self.figsize)
-
-        # Histogram
-        ax1.hist(
-            follower_counts, bins=20, alpha=0.7, color="skyblue", edgecolor="black"
+from ..utils.metrics import get_metrics
+from .activity import (
+    WEEKDAYS,
+    activity_heatmap,
+    best_posting_times,
+    tweet_timestamps,
+)
+from .aggregates import DashboardAggregates
+from .output import (
+    ChartOutput,
+    ChartResult,
+    ChartTarget,
+    deliver,
+    deliver_many,
+    save_figure,
+)
+from .render_cache import LayoutCache, RenderCache
+
+Payload = Dict[str, Any]
+
+# Resolution of rendered PNGs unless a render profile says otherwise
+CHART_DPI = RenderProfile.STANDARD.dpi
+
+# Hashtags drawn in the word cloud (the payload keeps only these)
+WORDCLOUD_MAX_WORDS = 100
+WORDCLOUD_OPTIONS: Dict[str, Any] = {
+    "width": 800,
+    "height": 400,
+    "background_color": "white",
+    "colormap": "viridis",
+    "max_words": WORDCLOUD_MAX_WORDS,
+    "relative_scaling": 0.5,
+    "random_state": 0,
+}
+
+
+def _apply_style(style: str) -> None:
+    """Apply the shared plot style (also used to initialize worker processes)."""
+    plt.style.use(style)
+    sns.set_palette("husl")
+
+
+def _create_no_data_chart(
+    message: str, dpi: int = CHART_DPI, output: ChartTarget = ChartOutput.BASE64
+) -> ChartResult:
+    """Create a simple chart indicating no data available."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.text(
+        0.5,
+        0.5,
+        message,
+        transform=ax.transAxes,
+        fontsize=16,
+        ha="center",
+        va="center",
+        bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray"),
+    )
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis("off")
+    return save_figure(dpi, output)
+
+
+def follower_distribution_payload(analyses: List[FollowerAnalysis]) -> Payload:
+    """Extract follower counts."""
+    return {"follower_counts": [a.profile.followers_count for a in analyses]}
+
+
+def verification_payload(analyses: List[FollowerAnalysis]) -> Payload:
+    """Extract verified / non-verified counts."""
+    verified_count = sum(1 for analysis in analyses if analysis.profile.verified)
+    return {
+        "verified_count": verified_count,
+        "non_verified_count": len(analyses) - verified_count,
+    }
+
+
+def location_payload(analyses: List[FollowerAnalysis]) -> Payload:
+    """Extract the ten most common locations."""
+    locations = Counter(
+        analysis.profile.location for analysis in analyses if analysis.profile.location
+    )
+    return {"top_locations": locations.most_common(10)}
+
+
+def engagement_payload(analyses: List[FollowerAnalysis]) -> Payload:
+    """Extract per-follower activity and engagement for followers with tweets."""
+    payload: Payload = {
+        "followers_count": [],
+        "tweets_count": [],
+        "avg_retweets": [],
+        "avg_likes": [],
+    }
+    for analysis in analyses:
+        metrics = get_metrics(analysis)
+        if metrics.recent_tweets_count:
+            payload["followers_count"].append(analysis.profile.followers_count)
+            payload["tweets_count"].append(metrics.recent_tweets_count)
+            payload["avg_retweets"].append(metrics.avg_retweets)
+            payload["avg_likes"].append(metrics.avg_favorites)
+    return payload
+
+
+def hashtag_payload(analyses: List[FollowerAnalysis]) -> Payload:
+    """Extract the most frequent hashtags across all recent tweets."""
+    hashtag_counts: Counter = Counter()
+    for analysis in analyses:
+        hashtag_counts.update(get_metrics(analysis).hashtag_counts)
+    return {"hashtag_counts": dict(hashtag_counts.most_common(WORDCLOUD_MAX_WORDS))}
+
+
+def activity_timeline_payload(analyses: List[FollowerAnalysis]) -> Payload:
+    """Extract tweet counts per hour of day (UTC)."""
+    timestamps, _ = tweet_timestamps(analyses)
+    return {"hour_counts": activity_heatmap(timestamps).sum(axis=0).tolist()}
+
+
+def activity_heatmap_payload(
+    analyses: List[FollowerAnalysis], local_time: bool = False
+) -> Payload:
+    """Extract tweet counts per weekday and hour.
+
+    Args:
+        analyses: List of FollowerAnalysis objects
+        local_time: Bin in each follower's local time inferred from their
+            location (UTC where unknown) instead of UTC
+    """
+    timestamps, utc_offsets = tweet_timestamps(analyses, local_time)
+    return {
+        "heatmap": activity_heatmap(timestamps, utc_offsets).tolist(),
+        "local_time": local_time,
+    }
+
+
+def render_follower_distribution(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+) -> ChartResult:
+    """Render follower count histogram and box plot."""
+    follower_counts = payload["follower_counts"]
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+
+    # Histogram
+    ax1.hist(follower_counts, bins=20, alpha=0.7, color="skyblue", edgecolor="black")
+    ax1.set_xlabel("Follower Count")
+    ax1.set_ylabel("Number of Users")
+    ax1.set_title("Distribution of Follower Counts")
+    ax1.grid(True, alpha=0.3)
+
+    # Box plot
+    ax2.boxplot(follower_counts, vert=True)
+    ax2.set_ylabel("Follower Count")
+    ax2.set_title("Follower Count Statistics")
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    return save_figure(dpi, output)
+
+
+def render_verification(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+) -> ChartResult:
+    """Render verified vs non-verified pie chart."""
+    fig, ax = plt.subplots(figsize=(8, 8))
+    labels = ["Verified", "Non-Verified"]
+    sizes = [payload["verified_count"], payload["non_verified_count"]]
+    colors = ["#1DA1F2", "#657786"]
+
+    wedges, texts, autotexts = ax.pie(
+        sizes, labels=labels, colors=colors, autopct="%1.1f%%", startangle=90
+    )
+    ax.set_title("Account Verification Status", fontsize=16, fontweight="bold")
+
+    return save_figure(dpi, output)
+
+
+def render_location(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+) -> ChartResult:
+    """Render horizontal bar chart of top locations."""
+    top_locations = payload["top_locations"]
+    if not top_locations:
+        return _create_no_data_chart("No location data available", dpi, output)
+
+    names = [location for location, _ in top_locations]
+    counts = [count for _, count in top_locations]
+
+    fig, ax = plt.subplots(figsize=figsize)
+    colors = plt.cm.Set3(np.linspace(0, 1, len(counts)))
+
+    bars = ax.barh(range(len(counts)), counts, color=colors)
+    ax.set_yticks(range(len(counts)))
+    ax.set_yticklabels(names)
+    ax.set_xlabel("Number of Followers")
+    ax.set_title("Top 10 Follower Locations", fontsize=16, fontweight="bold")
+
+    # Add value labels on bars
+    for i, bar in enumerate(bars):
+        width = bar.get_width()
+        ax.text(
+            width + 0.1,
+            bar.get_y() + bar.get_height() / 2,
+            f"{int(width)}",
+            ha="left",
+            va="center",
         )
-        ax1.set_xlabel("Follower Count")
-        ax1.set_ylabel("Number of Users")
-        ax1.set_title("Distribution of Follower Counts")
-        ax1.grid(True, alpha=0.3)
 
-        # Box plot
-        ax2.boxplot(follower_counts, vert=True)
-        ax2.set_ylabel("Follower Count")
-        ax2.set_title("Follower Count Statistics")
-        ax2.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return save_figure(dpi, output)
 
-        plt.tight_layout()
-        return self._save_plot_as_base64()
 
-    def create_verification_pie_chart(self, analyses: List[FollowerAnalysis]) -> str:
-        """Create pie chart showing verified vs non-verified users."""
-        verified_count = sum(1 for analysis in analyses if analysis.profile.verified)
-        total_count = len(analyses)
-        non_verified_count = total_count - verified_count
-
-        fig, ax = plt.subplots(figsize=(8, 8))
-        labels = ["Verified", "Non-Verified"]
-        sizes = [verified_count, non_verified_count]
-        colors = ["#1DA1F2", "#657786"]
-
-        wedges, texts, autotexts = ax.pie(
-            sizes, labels=labels, colors=colors, autopct="%1.1f%%", startangle=90
+def render_engagement(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+) -> ChartResult:
+    """Render follower count vs tweet activity and engagement panels."""
+    if not payload["followers_count"]:
+        return _create_no_data_chart(
+            "No tweet data available for engagement analysis", dpi, output
         )
-        ax.set_title("Account Verification Status", fontsize=16, fontweight="bold")
 
-        return self._save_plot_as_base64()
-
-    def create_location_analysis_chart(self, analyses: List[FollowerAnalysis]) -> str:
-        """Create horizontal bar chart for top locations."""
-        locations = [
-            analysis.profile.location
-            for analysis in analyses
-            if analysis.profile.location
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+
+    # Followers vs Tweet Count
+    ax1.scatter(
+        payload["followers_count"], payload["tweets_count"], alpha=0.6, color="blue"
+    )
+    ax1.set_xlabel("Follower Count")
+    ax1.set_ylabel("Recent Tweet Count")
+    ax1.set_title("Follower Count vs Tweet Activity")
+    ax1.grid(True, alpha=0.3)
+
+    # Average Retweets Distribution
+    ax2.hist(
+        payload["avg_retweets"], bins=15, alpha=0.7, color="green", edgecolor="black"
+    )
+    ax2.set_xlabel("Average Retweets")
+    ax2.set_ylabel("Number of Users")
+    ax2.set_title("Distribution of Average Retweets")
+    ax2.grid(True, alpha=0.3)
+
+    # Average Likes Distribution
+    ax3.hist(payload["avg_likes"], bins=15, alpha=0.7, color="red", edgecolor="black")
+    ax3.set_xlabel("Average Likes")
+    ax3.set_ylabel("Number of Users")
+    ax3.set_title("Distribution of Average Likes")
+    ax3.grid(True, alpha=0.3)
+
+    # Retweets vs Likes
+    ax4.scatter(
+        payload["avg_retweets"], payload["avg_likes"], alpha=0.6, color="purple"
+    )
+    ax4.set_xlabel("Average Retweets")
+    ax4.set_ylabel("Average Likes")
+    ax4.set_title("Retweets vs Likes Correlation")
+    ax4.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    return save_figure(dpi, output)
+
+
+def render_hashtag_wordcloud(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+    layout_cache: Optional[LayoutCache] = None,
+) -> ChartResult:
+    """Render word cloud of hashtags."""
+    hashtag_counts = payload["hashtag_counts"]
+    if not hashtag_counts:
+        return _create_no_data_chart("No hashtag data available", dpi, output)
+
+    fig, ax = plt.subplots(figsize=figsize)
+
+    wordcloud = _hashtag_wordcloud(hashtag_counts, layout_cache)
+
+    ax.imshow(wordcloud, interpolation="bilinear")
+    ax.set_title("Most Common Hashtags", fontsize=16, fontweight="bold")
+    ax.axis("off")
+
+    return save_figure(dpi, output)
+
+
+def _hashtag_wordcloud(
+    hashtag_counts: Dict[str, int], layout_cache: Optional[LayoutCache]
+) -> WordCloud:
+    """Lay out the hashtag word cloud, reusing a cached layout if possible."""
+    wordcloud = WordCloud(**WORDCLOUD_OPTIONS)
+    if layout_cache is None:
+        return wordcloud.generate_from_frequencies(hashtag_counts)
+
+    key = LayoutCache.key(
+        "hashtag_wordcloud",
+        sorted(hashtag_counts.items()),
+        font_path=wordcloud.font_path,
+        **WORDCLOUD_OPTIONS,
+    )
+    layout = layout_cache.get_layout(key)
+    if layout is not None:
+        wordcloud.layout_ = [
+            ((word, freq), font_size, tuple(position), orientation, color)
+            for (word, freq), font_size, position, orientation, color in layout
         ]
-
-        if not locations:
-            return self._create_no_data_chart("No location data available")
-
-        location_counts = pd.Series(locations).value_counts().head(10)
-
-        fig, ax = plt.subplots(figsize=self.figsize)
-        colors = plt.cm.Set3(np.linspace(0, 1, len(location_counts)))
-
-        bars = ax.barh(
-            range(len(location_counts)), location_counts.values, color=colors
-        )
-        ax.set_yticks(range(len(location_counts)))
-        ax.set_yticklabels(location_counts.index)
-        ax.set_xlabel("Number of Followers")
-        ax.set_title("Top 10 Follower Locations", fontsize=16, fontweight="bold")
-
-        # Add value labels on bars
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(
-                width + 0.1,
-                bar.get_y() + bar.get_height() / 2,
-                f"{int(width)}",
-                ha="left",
-                va="center",
+        return wordcloud
+
+    wordcloud.generate_from_frequencies(hashtag_counts)
+    layout_cache.put_layout(
+        key,
+        [
+            (
+                (word, float(freq)),
+                int(font_size),
+                (int(position[0]), int(position[1])),
+                None if orientation is None else int(orientation),
+                color,
             )
-
-        plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_engagement_analysis_chart(self, analyses: List[FollowerAnalysis]) -> str:
-        """Create scatter plot for follower count vs tweet count analysis."""
-        data = []
-        for analysis in analyses:
-            if analysis.recent_tweets:
-                data.append(
-                    {
-                        "followers_count": analysis.profile.followers_count,
-                        "tweets_count": len(analysis.recent_tweets),
-                        "avg_retweets": np.mean(
-                            [tweet.retweet_count for tweet in analysis.recent_tweets]
-                        ),
-                        "avg_likes": np.mean(
-                            [tweet.favorite_count for tweet in analysis.recent_tweets]
-                        ),
-                    }
-                )
-
-        if not data:
-            return self._create_no_data_chart(
-                "No tweet data available for engagement analysis"
+            for (word, freq), font_size, position, orientation, color in (
+                wordcloud.layout_
+            )
+        ],
+    )
+    return wordcloud
+
+
+def render_activity_timeline(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+) -> ChartResult:
+    """Render tweet activity by hour of day."""
+    counts = payload["hour_counts"]
+    if not any(counts):
+        return _create_no_data_chart("No tweet timing data available", dpi, output)
+
+    fig, ax = plt.subplots(figsize=figsize)
+
+    hours = range(24)
+    bars = ax.bar(hours, counts, color="lightcoral", alpha=0.7, edgecolor="black")
+    ax.set_xlabel("Hour of Day (UTC)")
+    ax.set_ylabel("Number of Tweets")
+    ax.set_title("Tweet Activity by Hour of Day", fontsize=16, fontweight="bold")
+    ax.set_xticks(range(0, 24, 2))
+    ax.grid(True, alpha=0.3)
+
+    # Highlight peak hours
+    peak_hour = counts.index(max(counts))
+    bars[peak_hour].set_color("red")
+    bars[peak_hour].set_alpha(1.0)
+
+    plt.tight_layout()
+    return save_figure(dpi, output)
+
+
+def render_activity_heatmap(
+    payload: Payload,
+    figsize: Tuple[int, int] = (12, 8),
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+) -> ChartResult:
+    """Render tweet activity by weekday and hour, outlining the best times."""
+    heatmap = np.asarray(payload["heatmap"])
+    if not heatmap.any():
+        return _create_no_data_chart("No tweet timing data available", dpi, output)
+
+    fig, ax = plt.subplots(figsize=(figsize[0], figsize[0] * 0.4))
+    image = ax.imshow(heatmap, cmap="YlOrRd", aspect="auto")
+    fig.colorbar(image, ax=ax, label="Number of Tweets")
+
+    clock = "Local Time" if payload["local_time"] else "UTC"
+    ax.set_xlabel(f"Hour of Day ({clock})")
+    ax.set_xticks(range(0, 24, 2))
+    ax.set_yticks(range(7))
+    ax.set_yticklabels(WEEKDAYS)
+    ax.set_title("Tweet Activity by Day and Hour", fontsize=16, fontweight="bold")
+
+    for slot in best_posting_times(heatmap):
+        ax.add_patch(
+            plt.Rectangle(
+                (slot.hour - 0.5, slot.weekday - 0.5),
+                1,
+                1,
+                fill=False,
+                edgecolor="blue",
+                linewidth=2,
             )
-
-        df = pd.DataFrame(data)
-
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-
-        # Followers vs Tweet Count
-        ax1.scatter(df["followers_count"], df["tweets_count"], alpha=0.6, color="blue")
-        ax1.set_xlabel("Follower Count")
-        ax1.set_ylabel("Recent Tweet Count")
-        ax1.set_title("Follower Count vs Tweet Activity")
-        ax1.grid(True, alpha=0.3)
-
-        # Average Retweets Distribution
-        ax2.hist(
-            df["avg_retweets"], bins=15, alpha=0.7, color="green", edgecolor="black"
         )
-        ax2.set_xlabel("Average Retweets")
-        ax2.set_ylabel("Number of Users")
-        ax2.set_title("Distribution of Average Retweets")
-        ax2.grid(True, alpha=0.3)
-
-        # Average Likes Distribution
-        ax3.hist(df["avg_likes"], bins=15, alpha=0.7, color="red", edgecolor="black")
-        ax3.set_xlabel("Average Likes")
-        ax3.set_ylabel("Number of Users")
-        ax3.set_title("Distribution of Average Likes")
-        ax3.grid(True, alpha=0.3)
-
-        # Retweets vs Likes
-        ax4.scatter(df["avg_retweets"], df["avg_likes"], alpha=0.6, color="purple")
-        ax4.set_xlabel("Average Retweets")
-        ax4.set_ylabel("Average Likes")
-        ax4.set_title("Retweets vs Likes Correlation")
-        ax4.grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_hashtag_wordcloud(self, analyses: List[FollowerAnalysis]) -> str:
-        """Create word cloud from hashtags in recent tweets."""
-        hashtags = []
-        for analysis in analyses:
-            if analysis.recent_tweets:
-                for tweet in analysis.recent_tweets:
-                    if tweet.hashtags:
-                        hashtags.extend(tweet.hashtags)
 
-        if not hashtags:
-            return self._create_no_data_chart("No hashtag data available")
+    plt.tight_layout()
+    return save_figure(dpi, output)
+
+
+# Chart name -> (payload extractor, renderer), in dashboard order
+STATIC_CHARTS: Dict[
+    str,
+    Tuple[
+        Callable[[List[FollowerAnalysis]], Payload],
+        Callable[..., ChartResult],
+    ],
+] = {
+    "follower_distribution": (
+        follower_distribution_payload,
+        render_follower_distribution,
+    ),
+    "verification": (verification_payload, render_verification),
+    "location": (location_payload, render_location),
+    "engagement": (engagement_payload, render_engagement),
+    "hashtag_wordcloud": (hashtag_payload, render_hashtag_wordcloud),
+    "activity_timeline": (activity_timeline_payload, render_activity_timeline),
+    "activity_heatmap": (activity_heatmap_payload, render_activity_heatmap),
+}
+
+
+def render_chart(
+    name: str,
+    payload: Payload,
+    figsize: Tuple[int, int],
+    dpi: int = CHART_DPI,
+    output: ChartTarget = ChartOutput.BASE64,
+    layout_cache: Optional[LayoutCache] = None,
+) -> ChartResult:
+    """Render one static chart by name (process pool entry point)."""
+    if name == "hashtag_wordcloud":
+        return render_hashtag_wordcloud(payload, figsize, dpi, output, layout_cache)
+    return STATIC_CHARTS[name][1](payload, figsize, dpi, output)
+
+
+def static_chart_payloads(
+    analyses: List[FollowerAnalysis], local_time: bool = False
+) -> Dict[str, Payload]:
+    """Extract the payload of every static chart (see STATIC_CHARTS)."""
+    return aggregate_chart_payloads(
+        DashboardAggregates.from_analyses(analyses, local_time=local_time)
+    )
+
+
+def aggregate_chart_payloads(aggregates: DashboardAggregates) -> Dict[str, Payload]:
+    """Build every static chart payload from one pass's aggregates.
+
+    The payloads equal those of the STATIC_CHARTS extractors (the heatmap
+    in local time when the aggregates bin it), so rendered charts share
+    render cache entries.
+
+    Args:
+        aggregates: Aggregates that kept the per-follower columns
+
+    Returns:
+        Mapping of chart name to payload, in STATIC_CHARTS order
+    """
+    followers = aggregates.follower_columns()
+    active = followers["recent_tweets_count"] > 0
+    return {
+        "follower_distribution": {
+            "follower_counts": followers["followers_count"].tolist()
+        },
+        "verification": {
+            "verified_count": aggregates.verified_count,
+            "non_verified_count": aggregates.total_followers
+            - aggregates.verified_count,
+        },
+        "location": {"top_locations": aggregates.top_locations(10)},
+        "engagement": {
+            "followers_count": followers["followers_count"][active].tolist(),
+            "tweets_count": followers["recent_tweets_count"][active].tolist(),
+            "avg_retweets": followers["avg_retweets"][active].tolist(),
+            "avg_likes": followers["avg_likes"][active].tolist(),
+        },
+        "hashtag_wordcloud": {
+            "hashtag_counts": dict(aggregates.top_hashtags(WORDCLOUD_MAX_WORDS))
+        },
+        "activity_timeline": {"hour_counts": aggregates.tweet_hours.tolist()},
+        "activity_heatmap": {
+            "heatmap": (
+                aggregates.local_tweet_heatmap
+                if aggregates.local_time
+                else aggregates.tweet_heatmap
+            ).tolist(),
+            "local_time": aggregates.local_time,
+        },
+    }
 
-        hashtag_text = " ".join(hashtags)
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+class ChartGenerator:
+    """Generate various charts and visualizations for follower analysis."""
 
-        wordcloud = WordCloud(
-            width=800,
-            height=400,
-            background_color="white",
-            colormap="viridis",
-            max_words=100,
-            relative_scaling=0.5,
-        ).generate(hashtag_text)
+    def __init__(
+        self,
+        style: str = "seaborn-v0_8",
+        figsize: Tuple[int, int] = (12, 8),
+        max_workers: Optional[int] = None,
+        render_cache: Optional[RenderCache] = None,
+        render_profile: RenderProfile = RenderProfile.STANDARD,
+        layout_cache: Optional[LayoutCache] = None,
+    ):
+        """Initialize chart generator with style settings.
+
+        Args:
+            style: Matplotlib style
+            figsize: Default figure size
+            max_workers: Processes used by ``render_charts`` (default: one per
+                chart, capped at the CPU count; 1 renders in-process)
+            render_cache: Cache serving charts whose payload is unchanged
+            render_profile: Render quality (image resolution)
+            layout_cache: Cache of word cloud layouts, reused at any resolution
+        """
+        self.style = style
+        self.figsize = figsize
+        self.max_workers = max_workers
+        self.render_cache = render_cache
+        self.render_profile = render_profile
+        self.layout_cache = layout_cache
+        _apply_style(style)
 
-        ax.imshow(wordcloud, interpolation="bilinear")
-        ax.set_title("Most Common Hashtags", fontsize=16, fontweight="bold")
-        ax.axis("off")
+    def create_follower_distribution_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create follower count distribution chart."""
+        return self._create_chart("follower_distribution", analyses, output)
 
-        return self._save_plot_as_base64()
+    def create_verification_pie_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create pie chart showing verified vs non-verified users."""
+        return self._create_chart("verification", analyses, output)
 
-    def create_activity_timeline_chart(self, analyses: List[FollowerAnalysis]) -> str:
-        """Create timeline chart showing tweet posting patterns."""
-        tweet_times = []
-        for analysis in analyses:
-            if analysis.recent_tweets:
-                for tweet in analysis.recent_tweets:
-                    if tweet.created_at:
-                        tweet_times.append(tweet.created_at.hour)
+    def create_location_analysis_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create horizontal bar chart for top locations."""
+        return self._create_chart("location", analyses, output)
 
-        if not tweet_times:
-            return self._create_no_data_chart("No tweet timing data available")
+    def create_engagement_analysis_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create scatter plot for follower count vs tweet count analysis."""
+        return self._create_chart("engagement", analyses, output)
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+    def create_hashtag_wordcloud(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create word cloud from hashtags in recent tweets."""
+        return self._create_chart("hashtag_wordcloud", analyses, output)
 
-        # Create hourly distribution
-        hour_counts = pd.Series(tweet_times).value_counts().sort_index()
-        hours = range(24)
-        counts = [hour_counts.get(hour, 0) for hour in hours]
+    def create_activity_timeline_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create timeline chart showing tweet posting patterns."""
+        return self._create_chart("activity_timeline", analyses, output)
+
+    def create_activity_heatmap_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+        local_time: bool = False,
+    ) -> ChartResult:
+        """Create weekday × hour heatmap of tweet posting times.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+            output: Output format or file path
+            local_time: Use each follower's inferred local time instead of UTC
+        """
+        payload = activity_heatmap_payload(analyses, local_time)
+        return deliver(
+            self._render_pngs({"activity_heatmap": payload})["activity_heatmap"],
+            output,
+        )
 
-        bars = ax.bar(hours, counts, color="lightcoral", alpha=0.7, edgecolor="black")
-        ax.set_xlabel("Hour of Day (UTC)")
-        ax.set_ylabel("Number of Tweets")
-        ax.set_title("Tweet Activity by Hour of Day", fontsize=16, fontweight="bold")
-        ax.set_xticks(range(0, 24, 2))
-        ax.grid(True, alpha=0.3)
+    def create_static_charts(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+        local_time: bool = False,
+    ) -> Dict[str, ChartResult]:
+        """Create every static dashboard chart, rendering them in parallel.
+
+        Payloads are extracted in this process; only they are sent to the
+        worker processes.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+            output: Output format, or a directory to write ``<name>.png`` files to
+            local_time: Bin the activity heatmap in each follower's inferred
+                local time instead of UTC
+
+        Returns:
+            Mapping of chart name (see STATIC_CHARTS) to chart
+        """
+        return self.render_charts(static_chart_payloads(analyses, local_time), output)
+
+    def render_charts(
+        self,
+        payloads: Dict[str, Payload],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> Dict[str, ChartResult]:
+        """Render several static charts from their payloads.
+
+        Charts found in the render cache are served from it; only the others
+        are rendered (and then cached).
+
+        Args:
+            payloads: Mapping of chart name to payload
+            output: Output format, or a directory to write ``<name>.png`` files to
+
+        Returns:
+            Mapping of chart name to chart, in input order
+        """
+        return deliver_many(self._render_pngs(payloads), output)
+
+    def _render_pngs(self, payloads: Dict[str, Payload]) -> Dict[str, bytes]:
+        """Render charts to PNG bytes, serving cached ones from the cache."""
+        if self.render_cache is None:
+            return self._render_uncached(payloads)
+
+        charts: Dict[str, bytes] = {}
+        keys = {
+            name: self._cache_key(name, payload) for name, payload in payloads.items()
+        }
+        pending = {}
+        for name, payload in payloads.items():
+            cached = self.render_cache.get(keys[name])
+            if cached is None:
+                pending[name] = payload
+            else:
+                charts[name] = cached
+
+        rendered = self._render_uncached(pending) if pending else {}
+        for name, chart in rendered.items():
+            self.render_cache.put(keys[name], chart)
+            charts[name] = chart
+        return {name: charts[name] for name in payloads}
+
+    def _create_chart(
+        self, name: str, analyses: List[FollowerAnalysis], output: ChartTarget
+    ) -> ChartResult:
+        """Create one static chart by name."""
+        payload = STATIC_CHARTS[name][0](analyses)
+        return deliver(self._render_pngs({name: payload})[name], output)
+
+    def _cache_key(self, name: str, payload: Payload) -> str:
+        """Build the render cache key of a chart."""
+        return RenderCache.key(
+            name,
+            payload,
+            style=self.style,
+            figsize=self.figsize,
+            dpi=self.render_profile.dpi,
+        )
 
-        # Highlight peak hours
-        peak_hour = counts.index(max(counts))
-        bars[peak_hour].set_color("red")
-        bars[peak_hour].set_alpha(1.0)
+    def _render_uncached(self, payloads: Dict[str, Payload]) -> Dict[str, bytes]:
+        """Render charts, in worker processes when there are several."""
+        max_workers = self.max_workers or min(len(payloads), os.cpu_count() or 1)
+        if max_workers <= 1 or len(payloads) <= 1:
+            return {
+                name: render_chart(
+                    name,
+                    payload,
+                    self.figsize,
+                    self.render_profile.dpi,
+                    ChartOutput.BYTES,
+                    self.layout_cache,
+                )
+                for name, payload in payloads.items()
+            }
 
-        plt.tight_layout()
-        return self._save_plot_as_base64()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_apply_style,
+            initargs=(self.style,),
+        ) as executor:
+            futures = {
+                name: executor.submit(
+                    render_chart,
+                    name,
+                    payload,
+                    self.figsize,
+                    self.render_profile.dpi,
+                    ChartOutput.BYTES,
+                    self.layout_cache,
+                )
+                for name, payload in payloads.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
 
     def create_interactive_dashboard_data(
         self, analyses: List[FollowerAnalysis]
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """Create data structure for interactive Plotly dashboard."""
         # Prepare data for various charts
         follower_data = []
         for analysis in analyses:
+            metrics = get_metrics(analysis)
             data = {
                 "username": analysis.profile.username,
                 "display_name": analysis.profile.display_name,
@@ -246,52 +745,11 @@ class ChartGenerator:
                 "verified": analysis.profile.verified,
                 "location": analysis.profile.location or "Unknown",
                 "description": analysis.profile.description or "",
-                "recent_tweets_count": (
-                    len(analysis.recent_tweets) if analysis.recent_tweets else 0
-                ),
-                "liked_tweets_count": (
-                    len(analysis.liked_tweets) if analysis.liked_tweets else 0
-                ),
+                "recent_tweets_count": metrics.recent_tweets_count,
+                "liked_tweets_count": metrics.liked_tweets_count,
+                "avg_retweets": metrics.avg_retweets,
+                "avg_likes": metrics.avg_favorites,
             }
-
-            if analysis.recent_tweets:
-                data["avg_retweets"] = np.mean(
-                    [t.retweet_count for t in analysis.recent_tweets]
-                )
-                data["avg_likes"] = np.mean(
-                    [t.favorite_count for t in analysis.recent_tweets]
-                )
-            else:
-                data["avg_retweets"] = 0
-                data["avg_likes"] = 0
-
             follower_data.append(data)
 
         return follower_data
-
-    def _save_plot_as_base64(self) -> str:
-        """Save current matplotlib plot as base64 encoded string."""
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        return image_base64
-
-    def _create_no_data_chart(self, message: str) -> str:
-        """Create a simple chart indicating no data available."""
-        fig, ax = plt.subplots(figsize=(8, 6))
-        ax.text(
-            0.5,
-            0.5,
-            message,
-            transform=ax.transAxes,
-            fontsize=16,
-            ha="center",
-            va="center",
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightgray"),
-        )
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis("off")
-        return self._save_plot_as_base64()
@@ -1,61 +1,105 @@
 """HTML dashboard generator for follower analysis visualization."""
 
-from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import plotly.offline as pyo
+from plotly.subplots import make_subplots
 
+from ..models.config import RenderProfile
 from ..models.user import FollowerAnalysis
-from .charts import ChartGenerator
+from ..utils.metrics import get_metrics_engine
+from .activity import PostingSlot, best_posting_times
+from .aggregates import DashboardAggregates
+from .assets import DashboardAssets
+from .charts import ChartGenerator, aggregate_chart_payloads
+from .density import (
+    AGGREGATE_MIN_POINTS,
+    WEBGL_MIN_POINTS,
+    outlier_indices,
+    scatter_density,
+)
+from .output import ChartOutput, deliver
+from .render_cache import LayoutCache, RenderCache
 
 
 class DashboardGenerator:
     """Generate interactive HTML dashboard for follower analysis."""
 
-    def __init__(self):
-        """Initialize dashboard generator."""
-        self.chart_generator = ChartGenerator()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        render_cache: Optional[RenderCache] = None,
+        render_profile: RenderProfile = RenderProfile.STANDARD,
+        asset_dir: Optional[str] = None,
+        layout_cache: Optional[LayoutCache] = None,
+        local_time: bool = False,
+    ):
+        """Initialize dashboard generator.
+
+        Args:
+            max_workers: Processes used to render the static charts
+                (default: one per chart, capped at the CPU count)
+            render_cache: Cache of previously rendered static charts
+            render_profile: Render quality of the static charts (preview renders
+                fastest, print gives the sharpest images)
+            asset_dir: Directory the charts and plotly.js are written to and
+                linked from, shared between dashboards (default: inline them)
+            layout_cache: Cache of word cloud layouts
+            local_time: Bin the activity heatmap and best posting times in
+                each follower's local time inferred from their location
+        """
+        self.chart_generator = ChartGenerator(
+            max_workers=max_workers,
+            render_cache=render_cache,
+            render_profile=render_profile,
+            layout_cache=layout_cache,
+        )
+        self.assets = DashboardAssets(asset_dir) if asset_dir else None
+        self.local_time = local_time
 
     def generate_dashboard(
         self, analyses: List[FollowerAnalysis], target_username: str, output_path: str
     ) -> str:
         """Generate complete HTML dashboard with all visualizations."""
 
-        # Generate static charts
-        follower_dist_chart = self.chart_generator.create_follower_distribution_chart(
-            analyses
-        )
-        verification_chart = self.chart_generator.create_verification_pie_chart(
-            analyses
+        # Compute every follower's metrics up front in one batch, then gather
+        # every dashboard aggregate in a single pass
+        get_metrics_engine().get_many(analyses)
+        aggregates = DashboardAggregates.from_analyses(
+            analyses, local_time=self.local_time
         )
-        location_chart = self.chart_generator.create_location_analysis_chart(analyses)
-        engagement_chart = self.chart_generator.create_engagement_analysis_chart(
-            analyses
-        )
-        hashtag_cloud = self.chart_generator.create_hashtag_wordcloud(analyses)
-        activity_timeline = self.chart_generator.create_activity_timeline_chart(
-            analyses
+
+        # Render the independent static charts in parallel worker processes
+        payloads = aggregate_chart_payloads(aggregates)
+        static_charts = self._chart_sources(
+            self.chart_generator.render_charts(payloads, ChartOutput.BYTES),
+            output_path,
         )
+        best_times = best_posting_times(payloads["activity_heatmap"]["heatmap"])
 
         # Generate interactive charts
-        interactive_charts = self._create_interactive_charts(analyses)
+        interactive_charts = self._create_interactive_charts(aggregates)
 
         # Generate summary statistics
-        stats = self._generate_summary_stats(analyses)
+        stats = aggregates.summary_stats()
 
         # Create HTML content
         html_content = self._generate_html_template(
             target_username=target_username,
             stats=stats,
-            follower_dist_chart=follower_dist_chart,
-            verification_chart=verification_chart,
-            location_chart=location_chart,
-            engagement_chart=engagement_chart,
-            hashtag_cloud=hashtag_cloud,
-            activity_timeline=activity_timeline,
+            follower_dist_chart=static_charts["follower_distribution"],
+            verification_chart=static_charts["verification"],
+            location_chart=static_charts["location"],
+            engagement_chart=static_charts["engagement"],
+            hashtag_cloud=static_charts["hashtag_wordcloud"],
+            activity_timeline=static_charts["activity_timeline"],
+            activity_heatmap=static_charts["activity_heatmap"],
+            best_times=self._format_best_times(best_times, self.local_time),
             interactive_charts=interactive_charts,
+            plotly_script=self._plotly_script(output_path),
         )
 
         # Save dashboard
@@ -65,9 +109,47 @@ class DashboardGenerator:
 
         return output_path
 
-    def _create_interactive_charts(self, analyses: List[FollowerAnalysis]) -> str:
+    def _chart_sources(
+        self, static_charts: Dict[str, bytes], output_path: str
+    ) -> Dict[str, str]:
+        """Get the image URL of each chart: an asset file or a data URI."""
+        if self.assets is None:
+            return {
+                name: "data:image/png;base64," + deliver(chart, ChartOutput.BASE64)
+                for name, chart in static_charts.items()
+            }
+
+        return {
+            name: self.assets.url(self.assets.write_chart(name, chart), output_path)
+            for name, chart in static_charts.items()
+        }
+
+    @staticmethod
+    def _format_best_times(
+        best_times: List[PostingSlot], local_time: bool = False
+    ) -> str:
+        """Describe the recommended posting slots."""
+        if not best_times:
+            return "Not enough tweet timing data for recommendations."
+        slots = ", ".join(
+            f"<strong>{slot.label}</strong> ({slot.tweets:,} tweets)"
+            for slot in best_times
+        )
+        clock = "followers' local time" if local_time else "UTC"
+        return f"Best times to post ({clock}): {slots}"
+
+    def _plotly_script(self, output_path: str) -> str:
+        """Get the tag loading the shared plotly.js (empty when inlined)."""
+        if self.assets is None:
+            return ""
+
+        url = self.assets.url(self.assets.plotly_js(), output_path)
+        return f'<script src="{url}" charset="utf-8"></script>'
+
+    def _create_interactive_charts(self, aggregates: DashboardAggregates) -> str:
         """Create interactive Plotly charts."""
-        follower_data = self.chart_generator.create_interactive_dashboard_data(analyses)
+        followers = aggregates.follower_columns()
+        usernames = followers["username"]
 
         # Create subplot figure
         fig = make_subplots(
@@ -86,68 +168,44 @@ class DashboardGenerator:
         )
 
         # Follower vs Following scatter plot
-        fig.add_trace(
-            go.Scatter(
-                x=[d["followers_count"] for d in follower_data],
-                y=[d["following_count"] for d in follower_data],
-                mode="markers",
-                marker=dict(
-                    color=[d["avg_likes"] for d in follower_data],
-                    colorscale="Viridis",
-                    showscale=True,
-                    colorbar=dict(title="Avg Likes"),
-                    size=8,
-                ),
-                text=[
-                    (
-                        f"@{d['username']}<br>Followers: {d['followers_count']}"
-                        f"<br>Following: {d['following_count']}"
-                    )
-                    for d in follower_data
-                ],
-                hovertemplate="%{text}<extra></extra>",
-                name="Users",
+        for trace in self._scatter_traces(
+            followers,
+            x_key="followers_count",
+            y_key="following_count",
+            color_key="avg_likes",
+            colorscale="Viridis",
+            colorbar_title="Avg Likes",
+            size=8,
+            hover=lambda i: (
+                f"@{usernames[i]}<br>Followers: {followers['followers_count'][i]}"
+                f"<br>Following: {followers['following_count'][i]}"
             ),
-            row=1,
-            col=1,
-        )
+            name="Users",
+        ):
+            fig.add_trace(trace, row=1, col=1)
 
         # Engagement scatter plot
-        fig.add_trace(
-            go.Scatter(
-                x=[d["avg_retweets"] for d in follower_data],
-                y=[d["avg_likes"] for d in follower_data],
-                mode="markers",
-                marker=dict(
-                    color=[d["followers_count"] for d in follower_data],
-                    colorscale="Plasma",
-                    showscale=True,
-                    colorbar=dict(title="Followers"),
-                    size=10,
-                ),
-                text=[
-                    (
-                        f"@{d['username']}<br>Avg RT: {d['avg_retweets']:.1f}"
-                        f"<br>Avg Likes: {d['avg_likes']:.1f}"
-                    )
-                    for d in follower_data
-                ],
-                hovertemplate="%{text}<extra></extra>",
-                name="Engagement",
+        for trace in self._scatter_traces(
+            followers,
+            x_key="avg_retweets",
+            y_key="avg_likes",
+            color_key="followers_count",
+            colorscale="Plasma",
+            colorbar_title="Followers",
+            size=10,
+            hover=lambda i: (
+                f"@{usernames[i]}<br>Avg RT: {followers['avg_retweets'][i]:.1f}"
+                f"<br>Avg Likes: {followers['avg_likes'][i]:.1f}"
             ),
-            row=1,
-            col=2,
-        )
+            name="Engagement",
+        ):
+            fig.add_trace(trace, row=1, col=2)
 
         # Location bar chart
-        location_counts = {}
-        for d in follower_data:
-            loc = d["location"]
-            location_counts[loc] = location_counts.get(loc, 0) + 1
-
-        top_locations = sorted(
-            location_counts.items(), key=lambda x: x[1], reverse=True
-        )[:10]
+        location_counts = aggregates.locations.copy()
+        if aggregates.unknown_locations:
+            location_counts["Unknown"] += aggregates.unknown_locations
+        top_locations = location_counts.most_common(10)
 
         fig.add_trace(
             go.Bar(
@@ -161,17 +219,25 @@ class DashboardGenerator:
             col=1,
         )
 
-        # Activity histogram
-        fig.add_trace(
-            go.Histogram(
-                x=[d["recent_tweets_count"] for d in follower_data],
+        # Activity histogram (binned here for large audiences)
+        tweet_counts = followers["recent_tweets_count"]
+        if len(tweet_counts) >= AGGREGATE_MIN_POINTS:
+            bin_counts, edges = np.histogram(tweet_counts, bins=20)
+            activity_trace = go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=bin_counts,
+                width=np.diff(edges),
+                marker_color="coral",
+                name="Tweet Activity",
+            )
+        else:
+            activity_trace = go.Histogram(
+                x=tweet_counts,
                 nbinsx=20,
                 marker_color="coral",
                 name="Tweet Activity",
-            ),
-            row=2,
-            col=2,
-        )
+            )
+        fig.add_trace(activity_trace, row=2, col=2)
 
         # Update layout
         fig.update_layout(
@@ -191,46 +257,66 @@ class DashboardGenerator:
         fig.update_xaxes(title_text="Recent Tweets Count", row=2, col=2)
         fig.update_yaxes(title_text="Number of Users", row=2, col=2)
 
-        return pyo.plot(fig, output_type="div", include_plotlyjs=True)
-
-    def _generate_summary_stats(
-        self, analyses: List[FollowerAnalysis]
-    ) -> Dict[str, Any]:
-        """Generate summary statistics for the dashboard."""
-        total_followers = len(analyses)
-        verified_count = sum(1 for a in analyses if a.profile.verified)
-
-        follower_counts = [a.profile.followers_count for a in analyses]
-        avg_followers = (
-            sum(follower_counts) / len(follower_counts) if follower_counts else 0
+        return pyo.plot(fig, output_type="div", include_plotlyjs=self.assets is None)
+
+    @staticmethod
+    def _scatter_traces(
+        followers: Dict[str, np.ndarray],
+        x_key: str,
+        y_key: str,
+        color_key: str,
+        colorscale: str,
+        colorbar_title: str,
+        size: int,
+        hover: Callable[[int], str],
+        name: str,
+    ) -> List[Any]:
+        """Create the traces of a per-follower scatter plot.
+
+        Large audiences are drawn with WebGL, and the largest ones as a 2D
+        histogram (computed here, so its size does not grow with the number
+        of followers) overlaid with the outlying followers. ``hover`` builds
+        the hover text of the follower at an index, only for plotted points.
+        """
+        x = followers[x_key]
+        y = followers[y_key]
+        if len(x) < AGGREGATE_MIN_POINTS:
+            points = np.arange(len(x))
+            traces = []
+        else:
+            density = scatter_density(x, y)
+            traces = [
+                go.Heatmap(
+                    x=density.x_edges,
+                    y=density.y_edges,
+                    z=np.where(density.counts > 0, density.counts, None),
+                    colorscale="Greys",
+                    showscale=False,
+                    hovertemplate="%{z} followers<extra></extra>",
+                    name=f"{name} density",
+                )
+            ]
+            points = outlier_indices(x, y)
+
+        scatter = go.Scattergl if len(x) >= WEBGL_MIN_POINTS else go.Scatter
+        traces.append(
+            scatter(
+                x=x[points],
+                y=y[points],
+                mode="markers",
+                marker=dict(
+                    color=followers[color_key][points],
+                    colorscale=colorscale,
+                    showscale=True,
+                    colorbar=dict(title=colorbar_title),
+                    size=size,
+                ),
+                text=[hover(i) for i in points],
+                hovertemplate="%{text}<extra></extra>",
+                name=name,
+            )
         )
-
-        locations = [a.profile.location for a in analyses if a.profile.location]
-        unique_locations = len(set(locations))
-
-        total_tweets = sum(len(a.recent_tweets) for a in analyses if a.recent_tweets)
-
-        hashtags = []
-        for a in analyses:
-            if a.recent_tweets:
-                for tweet in a.recent_tweets:
-                    if tweet.hashtags:
-                        hashtags.extend(tweet.hashtags)
-
-        unique_hashtags = len(set(hashtags))
-
-        return {
-            "total_followers": total_followers,
-            "verified_count": verified_count,
-            "verification_rate": (
-                (verified_count / total_followers * 100) if total_followers > 0 else 0
-            ),
-            "avg_followers": int(avg_followers),
-            "unique_locations": unique_locations,
-            "total_tweets_analyzed": total_tweets,
-            "unique_hashtags": unique_hashtags,
-            "analysis_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        return traces
 
     def _generate_html_template(self, **kwargs) -> str:
         """Generate HTML template with all charts and data."""
@@ -325,6 +411,11 @@ class DashboardGenerator:
             gap: 30px;
         }}
 
+        .recommendations {{
+            color: #14171a;
+            margin-top: 15px;
+        }}
+
         .footer {{
             text-align: center;
             color: #657786;
@@ -343,6 +434,7 @@ class DashboardGenerator:
             }}
         }}
     </style>
+    {kwargs['plotly_script']}
 </head>
 <body>
     <div class="header">
@@ -393,7 +485,7 @@ class DashboardGenerator:
                 <h3 class="chart-title">👥 Follower Distribution</h3>
             </div>
             <div class="chart-content">
-                <img src="data:image/png;base64,{kwargs['follower_dist_chart']}" \
+                <img src="{kwargs['follower_dist_chart']}" loading="lazy" \
                      alt="Follower Distribution" class="chart-image">
             </div>
         </div>
@@ -403,7 +495,7 @@ class DashboardGenerator:
                 <h3 class="chart-title">✅ Verification Status</h3>
             </div>
             <div class="chart-content">
-                <img src="data:image/png;base64,{kwargs['verification_chart']}" \
+                <img src="{kwargs['verification_chart']}" loading="lazy" \
                      alt="Verification Status" class="chart-image">
             </div>
         </div>
@@ -415,7 +507,7 @@ class DashboardGenerator:
                 <h3 class="chart-title">🌍 Geographic Distribution</h3>
             </div>
             <div class="chart-content">
-                <img src="data:image/png;base64,{kwargs['location_chart']}" \
+                <img src="{kwargs['location_chart']}" loading="lazy" \
                      alt="Location Analysis" class="chart-image">
             </div>
         </div>
@@ -425,7 +517,7 @@ class DashboardGenerator:
                 <h3 class="chart-title">💬 Engagement Analysis</h3>
             </div>
             <div class="chart-content">
-                <img src="data:image/png;base64,{kwargs['engagement_chart']}" \
+                <img src="{kwargs['engagement_chart']}" loading="lazy" \
                      alt="Engagement Analysis" class="chart-image">
             </div>
         </div>
@@ -437,7 +529,7 @@ class DashboardGenerator:
                 <h3 class="chart-title">#️⃣ Popular Hashtags</h3>
             </div>
             <div class="chart-content">
-                <img src="data:image/png;base64,{kwargs['hashtag_cloud']}" \
+                <img src="{kwargs['hashtag_cloud']}" loading="lazy" \
                      alt="Hashtag Word Cloud" class="chart-image">
             </div>
         </div>
@@ -447,12 +539,23 @@ class DashboardGenerator:
                 <h3 class="chart-title">⏰ Activity Timeline</h3>
             </div>
             <div class="chart-content">
-                <img src="data:image/png;base64,{kwargs['activity_timeline']}" \
+                <img src="{kwargs['activity_timeline']}" loading="lazy" \
                      alt="Activity Timeline" class="chart-image">
             </div>
         </div>
     </div>
 
+    <div class="chart-section">
+        <div class="chart-header">
+            <h3 class="chart-title">🗓️ Weekly Activity Heatmap</h3>
+        </div>
+        <div class="chart-content">
+            <img src="{kwargs['activity_heatmap']}" loading="lazy" \
+                 alt="Weekly Activity Heatmap" class="chart-image">
+            <p class="recommendations">{kwargs['best_times']}</p>
+        </div>
+    </div>
+
     <div class="footer">
         <p>Generated by X Follower Analyzer | \
 Analysis Date: {kwargs['stats']['analysis_date']}</p>
@@ -0,0 +1,76 @@
+"""Server-side aggregation of large scatter plots.
+
+Plotting one marker (and one hover string) per follower makes the dashboard
+HTML grow linearly with the audience. Above a size threshold the interactive
+scatter plots instead show a 2D histogram computed here, whose size depends
+only on the bin count, plus a handful of outlier points that keep their hover
+details.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Followers from which scatter plots are drawn with WebGL (Scattergl)
+WEBGL_MIN_POINTS = 1000
+# Followers from which scatter plots are aggregated into a 2D histogram
+AGGREGATE_MIN_POINTS = 5000
+# Bins per axis of aggregated scatter plots
+DENSITY_BINS = 60
+# Individual points kept (with hover text) on aggregated scatter plots
+OUTLIER_POINTS = 200
+
+
+@dataclass
+class ScatterDensity:
+    """2D histogram of a scatter plot on log-spaced bins."""
+
+    x_edges: np.ndarray
+    y_edges: np.ndarray
+    counts: np.ndarray  # shape (len(y_edges) - 1, len(x_edges) - 1)
+
+
+def _log_edges(values: np.ndarray, bins: int) -> np.ndarray:
+    """Log-spaced bin edges covering non-negative, heavy-tailed values."""
+    upper = np.log10(values.max() + 1) if values.size else 0.0
+    return np.power(10.0, np.linspace(0.0, max(upper, 1e-9), bins + 1)) - 1
+
+
+def scatter_density(x, y, bins: int = DENSITY_BINS) -> ScatterDensity:
+    """Count points per cell of a log-spaced grid.
+
+    Args:
+        x: Non-negative x values
+        y: Non-negative y values
+        bins: Bins per axis
+
+    Returns:
+        ScatterDensity with counts indexed [y bin, x bin] (heatmap order)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x_edges = _log_edges(x, bins)
+    y_edges = _log_edges(y, bins)
+    counts, _, _ = np.histogram2d(x, y, bins=(x_edges, y_edges))
+    return ScatterDensity(x_edges, y_edges, counts.T.astype(np.int64))
+
+
+def outlier_indices(x, y, n: int = OUTLIER_POINTS) -> np.ndarray:
+    """Find the points farthest from the bulk of a heavy-tailed scatter.
+
+    Distance is measured on log scale from the per-axis median, in units of
+    each axis' spread, and the ``n`` farthest points are selected in linear
+    time with ``np.argpartition``.
+
+    Returns:
+        Indices of the outliers, farthest first
+    """
+    coords = np.log1p(np.column_stack([x, y]).astype(np.float64))
+    if len(coords) <= n:
+        return np.arange(len(coords))
+
+    spread = coords.std(axis=0)
+    spread[spread == 0] = 1.0
+    distance = np.hypot(*((coords - np.median(coords, axis=0)) / spread).T)
+    top = np.argpartition(distance, -n)[-n:]
+    return top[np.argsort(distance[top])[::-1]]
@@ -0,0 +1,674 @@
+"""Paginated follower explorer served over HTTP.
+
+The static dashboard embeds every follower into its HTML. The explorer
+instead loads a collected snapshot (a JSON or NDJSON export) into compact
+numpy columns and serves a page that only receives what is on screen:
+filtering, sorting and paging happen server side with vectorized operations,
+and chart data is aggregated before it is sent, so very large audiences stay
+browsable.
+"""
+
+import html
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
+
+from ..exporters.json_exporter import iter_json_followers
+from ..exporters.ndjson_exporter import read_ndjson
+from ..models.user import FollowerAnalysis
+from ..utils.compression import detect_compression
+from ..utils.metrics import get_metrics
+from .density import outlier_indices, scatter_density
+from .server import LocalServer, Response
+
+DEFAULT_PORT = 8060
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 200
+TOP_LOCATIONS = 15
+
+# Table column -> header label, in display order
+TABLE_COLUMNS = {
+    "username": "Username",
+    "display_name": "Name",
+    "followers_count": "Followers",
+    "following_count": "Following",
+    "tweets_count": "Tweets",
+    "verified": "Verified",
+    "location": "Location",
+    "recent_tweets_count": "Recent Tweets",
+    "avg_retweets": "Avg RT",
+    "avg_favorites": "Avg Likes",
+}
+TEXT_COLUMNS = ("username", "display_name", "location")
+SORTABLE_COLUMNS = tuple(name for name in TABLE_COLUMNS if name != "display_name")
+CHARTS = ("follower_distribution", "locations", "engagement", "activity")
+
+
+def _lru_get(cache: OrderedDict, key: Hashable, build, maxsize: int) -> Any:
+    """Get ``cache[key]``, building and inserting it (LRU-evicted) if missing."""
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    value = cache[key] = build()
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+    return value
+
+
+class FollowerTable:
+    """Columnar, read-only follower snapshot with vectorized queries."""
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """Initialize follower table.
+
+        Args:
+            columns: Array per TABLE_COLUMNS name, all of the same length
+        """
+        self.columns = columns
+        # Distinct lowercased values per text column and each row's index
+        # into them, so a search scans repeated values (locations) only once
+        self._search_values: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for name in TEXT_COLUMNS:
+            values, inverse = np.unique(
+                np.array([value.lower() for value in columns[name]], dtype=object),
+                return_inverse=True,
+            )
+            self._search_values[name] = (values, inverse)
+        self._orders: Dict[str, np.ndarray] = {}
+        self._masks: OrderedDict = OrderedDict()
+        self._views: OrderedDict = OrderedDict()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> "FollowerTable":
+        """Build a table from rows of values in TABLE_COLUMNS order."""
+        values = list(zip(*rows)) or [()] * len(TABLE_COLUMNS)
+        columns = {}
+        for name, column in zip(TABLE_COLUMNS, values):
+            if name in TEXT_COLUMNS:
+                columns[name] = np.array(
+                    [value or "" for value in column], dtype=object
+                )
+            elif name == "verified":
+                columns[name] = np.array(column, dtype=bool)
+            elif name.startswith("avg_"):
+                columns[name] = np.array(column, dtype=np.float64)
+            else:
+                columns[name] = np.array(column, dtype=np.int64)
+        return cls(columns)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "FollowerTable":
+        """Build a table from JSON/NDJSON export records."""
+        return cls.from_rows(
+            (
+                record["profile"]["username"],
+                record["profile"].get("display_name"),
+                record["profile"].get("followers_count", 0),
+                record["profile"].get("following_count", 0),
+                record["profile"].get("tweets_count", 0),
+                record["profile"].get("verified", False),
+                record["profile"].get("location"),
+                record["analysis"]["activity_metrics"]["recent_tweets_count"],
+                record["analysis"]["engagement_metrics"]["avg_retweets_per_tweet"],
+                record["analysis"]["engagement_metrics"]["avg_favorites_per_tweet"],
+            )
+            for record in records
+        )
+
+    @classmethod
+    def from_analyses(cls, analyses: Iterable[FollowerAnalysis]) -> "FollowerTable":
+        """Build a table from follower analyses."""
+        rows = []
+        for analysis in analyses:
+            profile = analysis.profile
+            metrics = get_metrics(analysis)
+            rows.append(
+                (
+                    profile.username,
+                    profile.display_name,
+                    profile.followers_count,
+                    profile.following_count,
+                    profile.tweets_count,
+                    profile.verified,
+                    profile.location,
+                    metrics.recent_tweets_count,
+                    metrics.avg_retweets,
+                    metrics.avg_favorites,
+                )
+            )
+        return cls.from_rows(rows)
+
+    def __len__(self) -> int:
+        return len(self.columns["username"])
+
+    def select(
+        self,
+        search: str = "",
+        verified: Optional[bool] = None,
+        min_followers: int = 0,
+        location: str = "",
+    ) -> np.ndarray:
+        """Get the indices of the followers matching every filter.
+
+        Args:
+            search: Case-insensitive substring of username, name or location
+            verified: Only verified (True) or unverified (False) followers
+            min_followers: Minimum follower count
+            location: Exact location
+
+        Returns:
+            Matching row indices in ascending order
+        """
+        key = (search.strip().lower(), verified, min_followers, location)
+        return _lru_get(self._masks, key, lambda: self._select(*key), maxsize=16)
+
+    def _select(
+        self, search: str, verified: Optional[bool], min_followers: int, location: str
+    ) -> np.ndarray:
+        mask = np.ones(len(self), dtype=bool)
+        if search:
+            mask &= self._search_mask(search)
+        if verified is not None:
+            mask &= self.columns["verified"] == verified
+        if min_followers:
+            mask &= self.columns["followers_count"] >= min_followers
+        if location:
+            mask &= self.columns["location"] == location
+        return np.flatnonzero(mask)
+
+    def _search_mask(self, search: str) -> np.ndarray:
+        """Rows whose username, name or location contains ``search``."""
+        mask = np.zeros(len(self), dtype=bool)
+        for values, inverse in self._search_values.values():
+            hits = np.fromiter(
+                (search in value for value in values), dtype=bool, count=len(values)
+            )
+            mask |= hits[inverse]
+        return mask
+
+    def order(self, sort: str, descending: bool = False) -> np.ndarray:
+        """Get the row indices sorted by a column (each sort computed once)."""
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(
+                f"Unknown sort column: {sort}. "
+                f"Must be one of {', '.join(SORTABLE_COLUMNS)}"
+            )
+
+        if sort not in self._orders:
+            column = self.columns[sort]
+            if sort in TEXT_COLUMNS:
+                column = np.char.lower(column.astype(str))
+            self._orders[sort] = np.argsort(column, kind="stable")
+        order = self._orders[sort]
+        return order[::-1] if descending else order
+
+    def page(
+        self,
+        page: int = 1,
+        per_page: int = DEFAULT_PER_PAGE,
+        sort: str = "followers_count",
+        descending: bool = True,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """Get one page of the filtered, sorted followers.
+
+        Args:
+            page: Page number, starting at 1
+            per_page: Rows per page (at most MAX_PER_PAGE)
+            sort: Column to sort by (one of SORTABLE_COLUMNS)
+            descending: Sort in descending order
+            **filters: Filters accepted by ``select``
+
+        Returns:
+            Dictionary with ``total``, ``page``, ``pages``, ``per_page`` and
+            the page's ``rows``
+        """
+        per_page = min(max(per_page, 1), MAX_PER_PAGE)
+        view = self._view(sort, descending, filters)
+        pages = max(-(-len(view) // per_page), 1)
+        page = min(max(page, 1), pages)
+        rows = view[(page - 1) * per_page : page * per_page]
+        return {
+            "total": int(len(view)),
+            "page": page,
+            "pages": pages,
+            "per_page": per_page,
+            "rows": self.rows(rows),
+        }
+
+    def _view(self, sort: str, descending: bool, filters: Dict[str, Any]):
+        """Filtered row indices in sort order, cached for paging through."""
+
+        def build() -> np.ndarray:
+            selected = np.zeros(len(self), dtype=bool)
+            selected[self.select(**filters)] = True
+            order = self.order(sort, descending)
+            return order[selected[order]]
+
+        key = (sort, descending, tuple(sorted(filters.items())))
+        return _lru_get(self._views, key, build, maxsize=8)
+
+    def rows(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """Get rows as JSON-compatible dictionaries."""
+        values = {
+            name: column[indices].tolist() for name, column in self.columns.items()
+        }
+        return [dict(zip(values, row)) for row in zip(*values.values())]
+
+    def chart(self, name: str, **filters: Any) -> go.Figure:
+        """Create a chart over the filtered followers.
+
+        Args:
+            name: Chart name (one of CHARTS)
+            **filters: Filters accepted by ``select``
+
+        Returns:
+            Plotly figure holding aggregated data only
+        """
+        if name not in CHARTS:
+            raise ValueError(
+                f"Unknown chart: {name}. Must be one of {', '.join(CHARTS)}"
+            )
+
+        indices = self.select(**filters)
+        fig = getattr(self, f"_{name}_chart")(indices)
+        fig.update_layout(height=380, margin=dict(l=50, r=20, t=50, b=50))
+        return fig
+
+    def _follower_distribution_chart(self, indices: np.ndarray) -> go.Figure:
+        """Followers per log-spaced follower count bin."""
+        log_counts = np.log10(self.columns["followers_count"][indices] + 1)
+        counts, edges = np.histogram(log_counts, bins=30)
+        lower = np.round(np.power(10.0, edges[:-1]) - 1).astype(np.int64)
+        fig = go.Figure(
+            go.Bar(
+                x=[f"{value:,}+" for value in lower], y=counts, marker_color="#1DA1F2"
+            )
+        )
+        fig.update_layout(title="Follower Count Distribution")
+        return fig
+
+    def _locations_chart(self, indices: np.ndarray) -> go.Figure:
+        """Most common follower locations."""
+        locations = self.columns["location"][indices]
+        names, counts = np.unique(locations[locations != ""], return_counts=True)
+        top = np.argsort(counts, kind="stable")[::-1][:TOP_LOCATIONS][::-1]
+        fig = go.Figure(
+            go.Bar(
+                x=counts[top], y=names[top], orientation="h", marker_color="lightblue"
+            )
+        )
+        fig.update_layout(title="Top Locations")
+        return fig
+
+    def _engagement_chart(self, indices: np.ndarray) -> go.Figure:
+        """Average retweets vs likes as a density map with outlying followers."""
+        x = self.columns["avg_retweets"][indices]
+        y = self.columns["avg_favorites"][indices]
+        density = scatter_density(x, y)
+        outliers = indices[outlier_indices(x, y)]
+        fig = go.Figure(
+            [
+                go.Heatmap(
+                    x=density.x_edges,
+                    y=density.y_edges,
+                    z=np.where(density.counts > 0, density.counts, None),
+                    colorscale="Greys",
+                    showscale=False,
+                    hovertemplate="%{z} followers<extra></extra>",
+                ),
+                go.Scattergl(
+                    x=self.columns["avg_retweets"][outliers],
+                    y=self.columns["avg_favorites"][outliers],
+                    mode="markers",
+                    marker=dict(color="#E0245E", size=7),
+                    text=[f"@{name}" for name in self.columns["username"][outliers]],
+                    hovertemplate="%{text}<br>Avg RT: %{x:.1f}"
+                    "<br>Avg Likes: %{y:.1f}<extra></extra>",
+                ),
+            ]
+        )
+        fig.update_layout(
+            title="Engagement", xaxis_title="Avg Retweets", yaxis_title="Avg Likes"
+        )
+        return fig
+
+    def _activity_chart(self, indices: np.ndarray) -> go.Figure:
+        """Followers per number of recent tweets collected."""
+        counts = np.bincount(self.columns["recent_tweets_count"][indices])
+        fig = go.Figure(
+            go.Bar(x=np.arange(len(counts)), y=counts, marker_color="coral")
+        )
+        fig.update_layout(
+            title="Recent Tweets per Follower",
+            xaxis_title="Recent Tweets",
+            yaxis_title="Followers",
+        )
+        return fig
+
+
+def load_snapshot(path: Union[str, Path]) -> FollowerTable:
+    """Load a JSON or NDJSON export (optionally ``.gz`` / ``.zst``) as a table.
+
+    Args:
+        path: Path to the export
+
+    Returns:
+        FollowerTable of the exported followers
+
+    Raises:
+        ValueError: If the file is not a JSON or NDJSON export
+    """
+    name = Path(path)
+    if detect_compression(name):
+        name = name.with_suffix("")
+
+    if name.suffix.lower() == ".ndjson":
+        return FollowerTable.from_records(read_ndjson(str(path)))
+    if name.suffix.lower() == ".json":
+        return FollowerTable.from_records(iter_json_followers(str(path)))
+    raise ValueError(f"Unsupported snapshot file: {path}. Expected .json or .ndjson")
+
+
+def _parse_filters(query: Dict[str, str]) -> Dict[str, Any]:
+    """Parse the filter parameters of a request."""
+    verified = query.get("verified", "")
+    if verified not in ("", "true", "false"):
+        raise ValueError("verified must be 'true' or 'false'")
+    return {
+        "search": query.get("q", ""),
+        "verified": None if not verified else verified == "true",
+        "min_followers": _parse_int(query, "min_followers", 0),
+        "location": query.get("location", ""),
+    }
+
+
+def _parse_int(query: Dict[str, str], name: str, default: int) -> int:
+    """Parse an integer request parameter."""
+    value = query.get(name, "")
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+
+class FollowerExplorer(LocalServer):
+    """Local web app browsing a follower snapshot page by page.
+
+    Routes:
+        ``/``: Explorer page
+        ``/api/followers``: One page of followers (``page``, ``per_page``,
+            ``sort``, ``order`` and the filter parameters)
+        ``/api/charts/<name>``: Plotly figure of a chart over the filtered
+            followers (``q``, ``verified``, ``min_followers``, ``location``)
+    """
+
+    thread_name = "follower-explorer"
+
+    def __init__(
+        self,
+        table: FollowerTable,
+        title: str = "Follower Explorer",
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+    ):
+        """Initialize follower explorer.
+
+        Args:
+            table: Follower snapshot to browse
+            title: Page title
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        super().__init__(host, port)
+        self.table = table
+        self.title = title
+        self._charts: OrderedDict = OrderedDict()
+        # Requests are served concurrently; queries share the table's caches
+        self._lock = threading.Lock()
+
+    def route(self, path: str, query: Dict[str, str]) -> Optional[Response]:
+        """Serve the page and its JSON endpoints."""
+        if path in ("/", "/index.html"):
+            return Response.html(self.render_page())
+        if not path.startswith("/api/"):
+            return None
+
+        with self._lock:
+            return self._route_api(path, query)
+
+    def _route_api(self, path: str, query: Dict[str, str]) -> Optional[Response]:
+        """Serve a JSON endpoint."""
+        if path == "/api/followers":
+            order = query.get("order", "desc")
+            if order not in ("asc", "desc"):
+                raise ValueError("order must be 'asc' or 'desc'")
+            result = self.table.page(
+                page=_parse_int(query, "page", 1),
+                per_page=_parse_int(query, "per_page", DEFAULT_PER_PAGE),
+                sort=query.get("sort", "followers_count"),
+                descending=order == "desc",
+                **_parse_filters(query),
+            )
+            return Response.json(json.dumps(result).encode("utf-8"))
+        if path.startswith("/api/charts/"):
+            name = path[len("/api/charts/") :]
+            filters = _parse_filters(query)
+            key = (name, tuple(sorted(filters.items())))
+            body = _lru_get(
+                self._charts,
+                key,
+                lambda: json.dumps(
+                    self.table.chart(name, **filters), cls=PlotlyJSONEncoder
+                ).encode("utf-8"),
+                maxsize=64,
+            )
+            return Response.json(body)
+        return None
+
+    def render_page(self) -> str:
+        """Render the explorer page, which loads its data from the API."""
+        title = html.escape(self.title)
+        headers = "".join(
+            f'<th data-column="{name}">{label}</th>'
+            for name, label in TABLE_COLUMNS.items()
+        )
+        chart_divs = "".join(
+            f'<div class="chart" id="chart-{name}"></div>' for name in CHARTS
+        )
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: 'Arial', sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+            color: #333;
+        }}
+        .header {{
+            background: linear-gradient(135deg, #1DA1F2, #14171A);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+        }}
+        .controls, .pager {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 10px;
+            align-items: center;
+            margin-bottom: 10px;
+        }}
+        table {{
+            width: 100%;
+            border-collapse: collapse;
+            background: white;
+        }}
+        th, td {{
+            padding: 6px 10px;
+            border-bottom: 1px solid #e1e8ed;
+            text-align: left;
+            white-space: nowrap;
+        }}
+        th {{
+            background: #f8f9fa;
+            cursor: pointer;
+            user-select: none;
+        }}
+        th[data-column="display_name"] {{
+            cursor: default;
+        }}
+        .charts {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(450px, 1fr));
+            gap: 20px;
+            margin-top: 20px;
+        }}
+        .chart {{
+            background: white;
+            border-radius: 8px;
+        }}
+    </style>
+    <script src="plotly.min.js" charset="utf-8"></script>
+</head>
+<body>
+    <div class="header">
+        <h1>🔎 {title}</h1>
+        <p><span id="total">-</span> followers match</p>
+    </div>
+
+    <div class="controls">
+        <input id="q" type="search" placeholder="Search username, name, location">
+        <select id="verified">
+            <option value="">All accounts</option>
+            <option value="true">Verified</option>
+            <option value="false">Not verified</option>
+        </select>
+        <input id="min_followers" type="number" min="0" placeholder="Min followers">
+        <input id="location" type="text" placeholder="Exact location">
+    </div>
+
+    <table>
+        <thead><tr>{headers}</tr></thead>
+        <tbody id="rows"></tbody>
+    </table>
+
+    <div class="pager">
+        <button id="prev">&larr; Prev</button>
+        <span>Page <span id="page">1</span> / <span id="pages">1</span></span>
+        <button id="next">Next &rarr;</button>
+        <select id="per_page">
+            <option>25</option><option selected>50</option>
+            <option>100</option><option>{MAX_PER_PAGE}</option>
+        </select>
+    </div>
+
+    <div class="charts">{chart_divs}</div>
+
+    <script>
+        const CHARTS = {json.dumps(list(CHARTS))};
+        const state = {{page: 1, pages: 1, sort: "followers_count", order: "desc"}};
+
+        function filterParams() {{
+            const params = new URLSearchParams();
+            for (const id of ["q", "verified", "min_followers", "location"]) {{
+                const value = document.getElementById(id).value.trim();
+                if (value) params.set(id, value);
+            }}
+            return params;
+        }}
+
+        function formatCell(value) {{
+            if (typeof value === "number" && !Number.isInteger(value)) {{
+                return value.toFixed(1);
+            }}
+            return value.toLocaleString();
+        }}
+
+        async function loadRows() {{
+            const params = filterParams();
+            params.set("page", state.page);
+            params.set("per_page", document.getElementById("per_page").value);
+            params.set("sort", state.sort);
+            params.set("order", state.order);
+            const data = await (await fetch("api/followers?" + params)).json();
+            Object.assign(state, {{page: data.page, pages: data.pages}});
+            document.getElementById("total").textContent = data.total.toLocaleString();
+            document.getElementById("page").textContent = data.page;
+            document.getElementById("pages").textContent = data.pages;
+            const body = document.getElementById("rows");
+            body.replaceChildren(...data.rows.map(row => {{
+                const tr = document.createElement("tr");
+                for (const th of document.querySelectorAll("th")) {{
+                    const td = document.createElement("td");
+                    td.textContent = formatCell(row[th.dataset.column]);
+                    tr.appendChild(td);
+                }}
+                return tr;
+            }}));
+        }}
+
+        async function loadCharts() {{
+            const params = filterParams();
+            for (const name of CHARTS) {{
+                const response = await fetch(`api/charts/${{name}}?` + params);
+                const figure = await response.json();
+                Plotly.react(`chart-${{name}}`, figure.data, figure.layout);
+            }}
+        }}
+
+        let timer = null;
+        function filtersChanged() {{
+            clearTimeout(timer);
+            timer = setTimeout(() => {{
+                state.page = 1;
+                loadRows();
+                loadCharts();
+            }}, 300);
+        }}
+
+        for (const id of ["q", "verified", "min_followers", "location"]) {{
+            document.getElementById(id).addEventListener("input", filtersChanged);
+        }}
+        document.getElementById("per_page").addEventListener("change", () => {{
+            state.page = 1;
+            loadRows();
+        }});
+        document.getElementById("prev").addEventListener("click", () => {{
+            if (state.page > 1) {{ state.page -= 1; loadRows(); }}
+        }});
+        document.getElementById("next").addEventListener("click", () => {{
+            if (state.page < state.pages) {{ state.page += 1; loadRows(); }}
+        }});
+        for (const th of document.querySelectorAll("th")) {{
+            if (th.dataset.column === "display_name") continue;
+            th.addEventListener("click", () => {{
+                const column = th.dataset.column;
+                state.order = state.sort === column && state.order === "desc"
+                    ? "asc" : "desc";
+                state.sort = column;
+                state.page = 1;
+                loadRows();
+            }});
+        }}
+
+        loadRows();
+        loadCharts();
+    </script>
+</body>
+</html>
+"""
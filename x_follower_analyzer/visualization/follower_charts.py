@@ -1,16 +1,96 @@
 """Specialized charts for follower analysis based on initial requirements."""
 
-import io
-import base64
-from typing import List, Tuple
-from collections import Counter
+import os
 import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import seaborn as sns
+
+from ..models.config import RenderProfile
+from ..models.user import FollowerAnalysis, LikedTweet
+from ..utils.engagement import engagement_buckets
+from ..utils.metrics import get_metrics
+from .fonts import apply_japanese_fonts
+from .output import (
+    ChartOutput,
+    ChartResult,
+    ChartTarget,
+    deliver,
+    deliver_many,
+    save_figure,
+)
+from .render_cache import RenderCache, analyses_digest
+
+# Report chart name -> FollowerAnalysisCharts method, in report order
+REQUIREMENT_CHARTS: Dict[str, str] = {
+    "profile_collection": "create_profile_collection_analysis",
+    "posts_collection": "create_posts_collection_analysis",
+    "likes_collection": "create_likes_collection_analysis",
+    "geographic_insights": "create_geographic_insights",
+    "comprehensive_summary": "create_comprehensive_summary",
+}
+
+
+@dataclass
+class RequirementReport:
+    """Rendered requirement charts with a per-chart timing breakdown."""
+
+    charts: Dict[str, ChartResult] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cached: List[str] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    def format_timings(self) -> str:
+        """Format the timing breakdown as a small text table."""
+        lines = [
+            f"  {name:<24} {seconds:>7.2f}s"
+            + (" (failed)" if name in self.errors else "")
+            + (" (cached)" if name in self.cached else "")
+            for name, seconds in self.timings.items()
+        ]
+        lines.append(f"  {'total (wall clock)':<24} {self.total_seconds:>7.2f}s")
+        return "\n".join(lines)
+
+
+# Per-process state of report workers, set once by _init_report_worker so the
+# analyses are shipped to each worker once rather than with every chart
+_worker_charts: Optional["FollowerAnalysisCharts"] = None
+_worker_analyses: List[FollowerAnalysis] = []
+
+
+def _init_report_worker(
+    style: str,
+    figsize: Tuple[int, int],
+    render_profile: RenderProfile,
+    analyses: List[FollowerAnalysis],
+) -> None:
+    """Initialize a report worker process."""
+    global _worker_charts, _worker_analyses
+    _worker_charts = FollowerAnalysisCharts(
+        style=style, figsize=figsize, render_profile=render_profile
+    )
+    _worker_analyses = analyses
 
-from ..models.user import FollowerAnalysis
+
+def _render_report_chart(
+    name: str, target_username: str
+) -> Tuple[Optional[bytes], float, Optional[str]]:
+    """Render one requirement chart in a report worker."""
+    return _worker_charts._render_timed(name, _worker_analyses, target_username)
+
+
+def _liked_tweet_engagement(liked_tweet: LikedTweet) -> Optional[int]:
+    """Engagement of a liked tweet, or None when its counts were not collected."""
+    if liked_tweet.retweet_count is None and liked_tweet.favorite_count is None:
+        return None
+    return (liked_tweet.retweet_count or 0) + (liked_tweet.favorite_count or 0)
 
 
 class FollowerAnalysisCharts:
@@ -20,52 +100,86 @@ class FollowerAnalysisCharts:
     1. プロフィール収集項目: ユーザーID、ユーザー名、自己紹介文、フォロー数、フォロワー数、位置情報など
     2. 投稿収集項目: 各フォロワーのポスト（最大n件）
     3. いいね履歴収集項目: 各フォロワーが「いいね」したポスト（最大n件）
+
+    With a render cache, every ``create_*`` chart and the requirement report
+    serve charts rendered before from the same analyses from the cache.
     """
 
-    def __init__(self, style: str = "seaborn-v0_8", figsize: Tuple[int, int] = (12, 8)):
+    def __init__(
+        self,
+        style: str = "seaborn-v0_8",
+        figsize: Tuple[int, int] = (12, 8),
+        render_cache: Optional[RenderCache] = None,
+        render_profile: RenderProfile = RenderProfile.STANDARD,
+    ):
         """Initialize chart generator with style settings."""
         self.style = style
         self.figsize = figsize
+        self.render_cache = render_cache
+        self.render_profile = render_profile
         plt.style.use(style)
         sns.set_palette("husl")
 
-        # 日本語フォント設定
-        try:
-            import japanize_matplotlib
+        # 日本語フォント設定 (resolved once per process)
+        apply_japanese_fonts()
 
-            japanize_matplotlib.japanize()
-        except ImportError:
-            pass
+    def create_profile_collection_analysis(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """要件1: プロフィール収集項目の詳細分析 - ユーザーID、ユーザー名、自己紹介文、フォロー数、フォロワー数、位置情報など"""
+        return self._create_chart("profile_collection", analyses, output)
 
-        # 直接フォント設定 - macOSで確実に利用可能
-        plt.rcParams["font.family"] = [
-            "Hiragino Sans",
-            "Hiragino Maru Gothic Pro",
-            "AppleGothic",
-        ]
-        plt.rcParams["font.sans-serif"] = [
-            "Hiragino Sans",
-            "Hiragino Maru Gothic Pro",
-            "AppleGothic",
-            "DejaVu Sans",
-        ]
+    def create_bio_analysis_chart(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Analyze follower bio/description text."""
+        return self._create_chart("bio_analysis", analyses, output)
 
-        # 文字化け対策
-        plt.rcParams["axes.unicode_minus"] = False
+    def create_posts_collection_analysis(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """要件2: 投稿収集項目の詳細分析 - 各フォロワーのポスト（最大n件）"""
+        return self._create_chart("posts_collection", analyses, output)
 
-        # フォントキャッシュクリア
-        try:
-            import matplotlib.font_manager
+    def create_likes_collection_analysis(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """要件3: いいね履歴収集項目の詳細分析 - 各フォロワーが「いいね」したポスト（最大n件）"""
+        return self._create_chart("likes_collection", analyses, output)
 
-            matplotlib.font_manager._rebuild()
-        except Exception:
-            # Font cache rebuild may fail on some systems - ignore safely
-            pass  # nosec
+    def create_geographic_insights(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create geographic analysis of followers."""
+        return self._create_chart("geographic_insights", analyses, output)
 
-    def create_profile_collection_analysis(
-        self, analyses: List[FollowerAnalysis]
-    ) -> str:
-        """要件1: プロフィール収集項目の詳細分析 - ユーザーID、ユーザー名、自己紹介文、フォロー数、フォロワー数、位置情報など"""
+    def create_comprehensive_summary(
+        self,
+        analyses: List[FollowerAnalysis],
+        target_username: str,
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Create comprehensive summary visualization."""
+        return self._create_chart(
+            "comprehensive_summary", analyses, output, target_username
+        )
+
+    def _draw_profile_collection(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Draw the profile collection chart."""
         fig = plt.figure(figsize=(20, 16))
 
         # Extract profile data
@@ -218,15 +332,19 @@ class FollowerAnalysisCharts:
             y=0.98,
         )
         plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_bio_analysis_chart(self, analyses: List[FollowerAnalysis]) -> str:
-        """Analyze follower bio/description text."""
+        return self._save_plot(output)
+
+    def _draw_bio_analysis(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Draw the bio text chart."""
         # Extract and analyze bio texts
         bios = [a.profile.description for a in analyses if a.profile.description]
 
         if not bios:
-            return self._create_no_data_chart("自己紹介文データがありません")
+            return self._create_no_data_chart("自己紹介文データがありません", output)
 
         # Common keywords in bios
         bio_text = " ".join(bios).lower()
@@ -257,10 +375,14 @@ class FollowerAnalysisCharts:
 
         plt.suptitle("フォロワー自己紹介文分析", fontsize=16, fontweight="bold")
         plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_posts_collection_analysis(self, analyses: List[FollowerAnalysis]) -> str:
-        """要件2: 投稿収集項目の詳細分析 - 各フォロワーのポスト（最大n件）"""
+        return self._save_plot(output)
+
+    def _draw_posts_collection(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Draw the posts collection chart."""
         fig = plt.figure(figsize=(20, 16))
 
         # Extract posting data
@@ -374,30 +496,16 @@ class FollowerAnalysisCharts:
         # 7. 高エンゲージメント投稿分析
         ax7 = fig.add_subplot(gs[2, 0])
         if tweet_engagement:
-            high_engagement = [
-                e for e in tweet_engagement if e > np.percentile(tweet_engagement, 90)
-            ]
-            medium_engagement = [
-                e
-                for e in tweet_engagement
-                if np.percentile(tweet_engagement, 50)
-                < e
-                <= np.percentile(tweet_engagement, 90)
-            ]
-            low_engagement = [
-                e for e in tweet_engagement if e <= np.percentile(tweet_engagement, 50)
-            ]
+            buckets = engagement_buckets(tweet_engagement)
 
             categories = [
                 "高エンゲージメント\n(上位10%)",
                 "中エンゲージメント\n(50-90%)",
                 "低エンゲージメント\n(下位50%)",
             ]
-            counts = [len(high_engagement), len(medium_engagement), len(low_engagement)]
-
             ax7.bar(
                 categories,
-                counts,
+                buckets.counts,
                 color=["#E74C3C", "#F39C12", "#95A5A6"],
                 alpha=0.8,
                 edgecolor="black",
@@ -413,16 +521,11 @@ class FollowerAnalysisCharts:
         if user_post_counts and tweet_engagement:
             user_avg_engagement = {}
             for analysis in analyses:
-                if analysis.recent_tweets:
-                    avg_eng = np.mean(
-                        [
-                            t.retweet_count + t.favorite_count
-                            for t in analysis.recent_tweets
-                        ]
-                    )
+                metrics = get_metrics(analysis)
+                if metrics.recent_tweets_count:
                     user_avg_engagement[analysis.profile.username] = (
-                        len(analysis.recent_tweets),
-                        avg_eng,
+                        metrics.recent_tweets_count,
+                        metrics.avg_engagement,
                     )
 
             if user_avg_engagement:
@@ -477,10 +580,14 @@ class FollowerAnalysisCharts:
             y=0.98,
         )
         plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_likes_collection_analysis(self, analyses: List[FollowerAnalysis]) -> str:
-        """要件3: いいね履歴収集項目の詳細分析 - 各フォロワーが「いいね」したポスト（最大n件）"""
+        return self._save_plot(output)
+
+    def _draw_likes_collection(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Draw the likes collection chart."""
         fig = plt.figure(figsize=(20, 16))
 
         # Extract likes data
@@ -489,18 +596,27 @@ class FollowerAnalysisCharts:
         liked_tweet_texts = []
         liked_tweet_authors = []
         liked_tweet_engagement = []
+        user_avg_liked_engagement = {}
 
         for analysis in analyses:
             like_count = len(analysis.liked_tweets) if analysis.liked_tweets else 0
             user_like_counts.append(like_count)
 
             if analysis.liked_tweets:
+                user_engagement = []
                 for liked_tweet in analysis.liked_tweets:
                     all_liked_tweets.append(liked_tweet)
                     liked_tweet_texts.append(liked_tweet.text)
                     liked_tweet_authors.append(liked_tweet.original_username)
-                    engagement = liked_tweet.retweet_count + liked_tweet.favorite_count
-                    liked_tweet_engagement.append(engagement)
+                    engagement = _liked_tweet_engagement(liked_tweet)
+                    if engagement is not None:
+                        user_engagement.append(engagement)
+                liked_tweet_engagement.extend(user_engagement)
+                if user_engagement:
+                    user_avg_liked_engagement[analysis.profile.username] = (
+                        like_count,
+                        sum(user_engagement) / len(user_engagement),
+                    )
 
         # Create subplot grid
         gs = fig.add_gridspec(3, 3, height_ratios=[1, 1, 1], width_ratios=[1, 1, 1])
@@ -569,6 +685,8 @@ class FollowerAnalysisCharts:
             )
             ax4.set_xscale("log")
             ax4.grid(True, alpha=0.3)
+        else:
+            self._mark_not_collected(ax4, "いいね対象ツイートのエンゲージメント分布")
 
         # 5. 最もいいねされている投稿者TOP10
         ax5 = fig.add_subplot(gs[1, 1])
@@ -630,42 +748,27 @@ class FollowerAnalysisCharts:
 
         # 8. いいね数vs対象投稿人気度相関
         ax8 = fig.add_subplot(gs[2, 1])
-        if user_like_counts and liked_tweet_engagement:
-            user_avg_liked_engagement = {}
-            for analysis in analyses:
-                if analysis.liked_tweets:
-                    avg_eng = np.mean(
-                        [
-                            t.retweet_count + t.favorite_count
-                            for t in analysis.liked_tweets
-                        ]
-                    )
-                    user_avg_liked_engagement[analysis.profile.username] = (
-                        len(analysis.liked_tweets),
-                        avg_eng,
-                    )
-
-            if user_avg_liked_engagement:
-                like_counts_plot = [
-                    data[0] for data in user_avg_liked_engagement.values()
-                ]
-                avg_liked_engagements = [
-                    data[1] for data in user_avg_liked_engagement.values()
-                ]
+        if user_avg_liked_engagement:
+            like_counts_plot = [data[0] for data in user_avg_liked_engagement.values()]
+            avg_liked_engagements = [
+                data[1] for data in user_avg_liked_engagement.values()
+            ]
 
-                ax8.scatter(
-                    like_counts_plot,
-                    avg_liked_engagements,
-                    alpha=0.6,
-                    color="#FF5722",
-                    s=50,
-                )
-                ax8.set_xlabel("いいね数")
-                ax8.set_ylabel("いいね対象の平均エンゲージメント")
-                ax8.set_title(
-                    "いいね数vs対象投稿人気度相関", fontsize=12, fontweight="bold"
-                )
-                ax8.grid(True, alpha=0.3)
+            ax8.scatter(
+                like_counts_plot,
+                avg_liked_engagements,
+                alpha=0.6,
+                color="#FF5722",
+                s=50,
+            )
+            ax8.set_xlabel("いいね数")
+            ax8.set_ylabel("いいね対象の平均エンゲージメント")
+            ax8.set_title(
+                "いいね数vs対象投稿人気度相関", fontsize=12, fontweight="bold"
+            )
+            ax8.grid(True, alpha=0.3)
+        else:
+            self._mark_not_collected(ax8, "いいね数vs対象投稿人気度相関")
 
         # 9. いいね収集統計
         ax9 = fig.add_subplot(gs[2, 2])
@@ -707,14 +810,18 @@ class FollowerAnalysisCharts:
             y=0.98,
         )
         plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_geographic_insights(self, analyses: List[FollowerAnalysis]) -> str:
-        """Create geographic analysis of followers."""
+        return self._save_plot(output)
+
+    def _draw_geographic_insights(
+        self,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Draw the geographic chart."""
         locations = [a.profile.location for a in analyses if a.profile.location]
 
         if not locations:
-            return self._create_no_data_chart("位置情報データがありません")
+            return self._create_no_data_chart("位置情報データがありません", output)
 
         # Process locations
         location_counts = Counter(locations).most_common(15)
@@ -830,12 +937,15 @@ class FollowerAnalysisCharts:
 
         plt.suptitle("フォロワー地理的分析", fontsize=16, fontweight="bold")
         plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def create_comprehensive_summary(
-        self, analyses: List[FollowerAnalysis], target_username: str
-    ) -> str:
-        """Create comprehensive summary visualization."""
+        return self._save_plot(output)
+
+    def _draw_comprehensive_summary(
+        self,
+        analyses: List[FollowerAnalysis],
+        target_username: str,
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> ChartResult:
+        """Draw the summary chart."""
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
 
         # Calculate key metrics
@@ -959,18 +1069,162 @@ class FollowerAnalysisCharts:
             fontweight="bold",
         )
         plt.tight_layout()
-        return self._save_plot_as_base64()
-
-    def _save_plot_as_base64(self) -> str:
-        """Save current matplotlib plot as base64 encoded string."""
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        return image_base64
-
-    def _create_no_data_chart(self, message: str) -> str:
+        return self._save_plot(output)
+
+    def create_requirement_report(
+        self,
+        analyses: List[FollowerAnalysis],
+        target_username: str = "unknown",
+        charts: Optional[Sequence[str]] = None,
+        max_workers: Optional[int] = None,
+        output: ChartTarget = ChartOutput.BASE64,
+    ) -> RequirementReport:
+        """Render the requirement charts concurrently across processes.
+
+        A chart that fails is recorded in ``errors`` instead of aborting the
+        rest of the report. With a render cache, charts rendered before from
+        the same analyses are served from it and listed in ``cached``.
+
+        Args:
+            analyses: List of FollowerAnalysis objects
+            target_username: Target account shown in the summary chart
+            charts: Chart names from REQUIREMENT_CHARTS (default: all)
+            max_workers: Worker processes (default: one per chart, capped at
+                the CPU count; 1 renders in-process)
+            output: Chart output format, or a directory to write
+                ``<chart name>.png`` files to
+
+        Returns:
+            RequirementReport with the charts and per-chart render times
+        """
+        names = list(charts) if charts is not None else list(REQUIREMENT_CHARTS)
+        unknown = [name for name in names if name not in REQUIREMENT_CHARTS]
+        if unknown:
+            raise ValueError(
+                f"Unknown requirement chart: {', '.join(unknown)}. "
+                f"Must be one of {', '.join(REQUIREMENT_CHARTS)}"
+            )
+
+        report = RequirementReport()
+        start = time.perf_counter()
+        results: Dict[str, Tuple[Optional[bytes], float, Optional[str]]] = {}
+
+        keys: Dict[str, str] = {}
+        if self.render_cache is not None:
+            digest = analyses_digest(analyses)
+            for name in names:
+                lookup_start = time.perf_counter()
+                keys[name] = self._cache_key(name, digest, target_username)
+                chart = self.render_cache.get(keys[name])
+                if chart is not None:
+                    results[name] = (chart, time.perf_counter() - lookup_start, None)
+                    report.cached.append(name)
+
+        pending = [name for name in names if name not in results]
+        max_workers = max_workers or min(len(pending), os.cpu_count() or 1)
+
+        if max_workers <= 1 or len(pending) <= 1:
+            for name in pending:
+                results[name] = self._render_timed(name, analyses, target_username)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_report_worker,
+                initargs=(self.style, self.figsize, self.render_profile, analyses),
+            ) as executor:
+                futures = {
+                    name: executor.submit(_render_report_chart, name, target_username)
+                    for name in pending
+                }
+                for name, future in futures.items():
+                    results[name] = future.result()
+
+        pngs: Dict[str, bytes] = {}
+        for name in names:
+            chart, seconds, error = results[name]
+            report.timings[name] = seconds
+            if error is None:
+                pngs[name] = chart
+                if name in keys and name not in report.cached:
+                    self.render_cache.put(keys[name], chart)
+            else:
+                report.errors[name] = error
+        report.charts = deliver_many(pngs, output)
+        report.total_seconds = time.perf_counter() - start
+        return report
+
+    def _create_chart(
+        self,
+        name: str,
+        analyses: List[FollowerAnalysis],
+        output: ChartTarget,
+        target_username: str = "unknown",
+    ) -> ChartResult:
+        """Draw one chart, serving it from the render cache when possible."""
+        draw = getattr(self, f"_draw_{name}")
+        args = (target_username,) if name == "comprehensive_summary" else ()
+        if self.render_cache is None:
+            return draw(analyses, *args, output)
+
+        key = self._cache_key(name, analyses_digest(analyses), target_username)
+        chart = self.render_cache.get(key)
+        if chart is None:
+            chart = draw(analyses, *args, ChartOutput.BYTES)
+            self.render_cache.put(key, chart)
+        return deliver(chart, output)
+
+    def _cache_key(self, name: str, digest: str, target_username: str) -> str:
+        """Build the render cache key of a requirement chart."""
+        data = {"analyses": digest}
+        if name == "comprehensive_summary":
+            data["target_username"] = target_username
+        return RenderCache.key(
+            name,
+            data,
+            style=self.style,
+            figsize=self.figsize,
+            dpi=self.render_profile.dpi,
+        )
+
+    def _render_timed(
+        self, name: str, analyses: List[FollowerAnalysis], target_username: str
+    ) -> Tuple[Optional[bytes], float, Optional[str]]:
+        """Render one requirement chart, returning (PNG, seconds, error)."""
+        method = getattr(self, f"_draw_{name}")
+        start = time.perf_counter()
+        try:
+            if name == "comprehensive_summary":
+                chart = method(analyses, target_username, ChartOutput.BYTES)
+            else:
+                chart = method(analyses, ChartOutput.BYTES)
+        except Exception as e:
+            plt.close("all")
+            return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+        return chart, time.perf_counter() - start, None
+
+    def _save_plot(self, output: ChartTarget = ChartOutput.BASE64) -> ChartResult:
+        """Save and close the current matplotlib plot in the requested output."""
+        return save_figure(self.render_profile.dpi, output)
+
+    @staticmethod
+    def _mark_not_collected(ax, title: str) -> None:
+        """Label a panel whose data was not collected instead of plotting it."""
+        ax.text(
+            0.5,
+            0.5,
+            "エンゲージメント数は未収集\n(not collected)",
+            transform=ax.transAxes,
+            fontsize=12,
+            ha="center",
+            va="center",
+            color="#657786",
+        )
+        ax.set_title(title, fontsize=12, fontweight="bold")
+        ax.axis("off")
+
+    def _create_no_data_chart(
+        self, message: str, output: ChartTarget = ChartOutput.BASE64
+    ) -> ChartResult:
         """Create a simple chart indicating no data available."""
         fig, ax = plt.subplots(figsize=(8, 6))
         ax.text(
@@ -986,4 +1240,4 @@ class FollowerAnalysisCharts:
         ax.set_xlim(0, 1)
         ax.set_ylim(0, 1)
         ax.axis("off")
-        return self._save_plot_as_base64()
+        return self._save_plot(output)
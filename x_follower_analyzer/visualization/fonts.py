@@ -0,0 +1,68 @@
+"""Process-wide Japanese font setup for matplotlib charts.
+
+The fonts able to render the Japanese chart labels are resolved once per
+process from matplotlib's existing font list (never by rebuilding the font
+cache) and then only referenced in rcParams, so applying them to a new chart
+generator costs a few dictionary updates.
+"""
+
+import threading
+from typing import List, Optional
+
+import matplotlib.pyplot as plt
+
+# Japanese-capable fonts in order of preference (macOS, Windows, Linux)
+JAPANESE_FONT_CANDIDATES = (
+    "Hiragino Sans",
+    "Hiragino Maru Gothic Pro",
+    "Yu Gothic",
+    "Meiryo",
+    "Noto Sans CJK JP",
+    "Noto Sans JP",
+    "IPAexGothic",
+    "IPAGothic",
+    "TakaoGothic",
+    "AppleGothic",
+)
+
+# Last-resort font shipped with matplotlib (no Japanese glyphs)
+FALLBACK_FONT = "DejaVu Sans"
+
+_fonts: Optional[List[str]] = None
+_fonts_lock = threading.Lock()
+
+
+def _resolve_japanese_fonts() -> List[str]:
+    """Find the installed Japanese-capable fonts."""
+    try:
+        # Registers its bundled IPAexGothic font with matplotlib on import
+        import japanize_matplotlib  # noqa: F401
+    except ImportError:
+        pass
+
+    from matplotlib import font_manager
+
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    return [name for name in JAPANESE_FONT_CANDIDATES if name in installed]
+
+
+def japanese_fonts() -> List[str]:
+    """Get the installed Japanese-capable fonts, resolved once per process."""
+    global _fonts
+    if _fonts is None:
+        with _fonts_lock:
+            if _fonts is None:
+                _fonts = _resolve_japanese_fonts()
+    return list(_fonts)
+
+
+def apply_japanese_fonts() -> None:
+    """Use the Japanese-capable fonts for chart text.
+
+    Idempotent and cheap after the first call; call it after applying a
+    style, since styles reset the font settings.
+    """
+    plt.rcParams["font.family"] = "sans-serif"
+    plt.rcParams["font.sans-serif"] = japanese_fonts() + [FALLBACK_FONT]
+    # 文字化け対策
+    plt.rcParams["axes.unicode_minus"] = False
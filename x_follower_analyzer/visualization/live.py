@@ -0,0 +1,351 @@
+"""Live dashboard served over HTTP while followers are being collected.
+
+A small local server shows the dashboard's summary cards and Plotly charts
+and refreshes them as analyses stream in. The page polls a JSON snapshot of
+the incrementally maintained aggregates; the snapshot is rebuilt at most once
+per change and unchanged ones are answered with ``304 Not Modified``.
+
+When collection ends, ``finish`` marks the snapshot as final so the page can
+show that the numbers will not change any more and stop polling.
+"""
+
+import html
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from plotly.utils import PlotlyJSONEncoder
+
+from ..models.user import FollowerAnalysis
+from .aggregates import DashboardAggregates
+from .server import LocalServer, Response
+
+DEFAULT_PORT = 8050
+
+# Summary card id -> label, in page order
+STAT_CARDS = {
+    "total_followers": "Followers Analyzed",
+    "verification_rate": "Verification Rate",
+    "avg_followers": "Average Followers",
+    "unique_locations": "Unique Locations",
+    "total_tweets_analyzed": "Tweets Analyzed",
+    "unique_hashtags": "Unique Hashtags",
+}
+
+
+_STAT_CARD = """        <div class="stat-card">
+            <div class="stat-number" id="{card_id}">-</div>
+            <div class="stat-label">{label}</div>
+        </div>"""
+
+
+class LiveDashboard(LocalServer):
+    """Local HTTP server showing dashboard aggregates as they grow."""
+
+    thread_name = "live-dashboard"
+
+    def __init__(
+        self,
+        target_username: str = "unknown",
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        refresh_seconds: float = 5.0,
+    ):
+        """Initialize live dashboard.
+
+        Args:
+            target_username: Target account shown in the dashboard
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+            refresh_seconds: Interval at which the page polls for updates
+        """
+        super().__init__(host, port)
+        self.target_username = target_username
+        self.refresh_seconds = refresh_seconds
+        self.aggregates = DashboardAggregates(keep_followers=False)
+        self.version = 0
+        self._lock = threading.Lock()
+        self._snapshot: Optional[bytes] = None
+        self._snapshot_version = -1
+        self.finished = False
+        self.polled = False
+        self._final_delivered = threading.Event()
+
+    def route(self, path: str, query: Dict[str, str]) -> Optional[Response]:
+        """Serve the page and its data snapshot."""
+        if path in ("/", "/index.html"):
+            return Response.html(self.render_page())
+        if path == "/data.json":
+            version, body = self.snapshot()
+            self.polled = True
+            if self.finished and version == self.version:
+                self._final_delivered.set()
+            return Response.json(
+                body, {"ETag": f'"{version}"', "Cache-Control": "no-cache"}
+            )
+        return None
+
+    def add(self, analysis: FollowerAnalysis) -> None:
+        """Fold a newly collected follower into the dashboard."""
+        with self._lock:
+            self.aggregates.add(analysis)
+            self.version += 1
+
+    def finish(self) -> None:
+        """Mark collection as finished in the next snapshot."""
+        with self._lock:
+            self.finished = True
+            self.version += 1
+
+    def wait_final_delivered(self, timeout: float) -> bool:
+        """Wait until a page has polled the finished snapshot.
+
+        Returns:
+            Whether it was delivered within ``timeout`` seconds
+        """
+        return self._final_delivered.wait(timeout)
+
+    def snapshot(self) -> Tuple[int, bytes]:
+        """Get the version and JSON snapshot of the summary cards and charts.
+
+        The snapshot is rebuilt only when followers were added since the last
+        one, however often the page polls.
+        """
+        with self._lock:
+            if self._snapshot_version != self.version:
+                self._snapshot = json.dumps(
+                    {
+                        "version": self.version,
+                        "finished": self.finished,
+                        "stats": self._format_stats(self.aggregates.summary_stats()),
+                        "figure": self._create_figure(self.aggregates),
+                    },
+                    cls=PlotlyJSONEncoder,
+                ).encode("utf-8")
+                self._snapshot_version = self.version
+            return self._snapshot_version, self._snapshot
+
+    @staticmethod
+    def _format_stats(stats: Dict[str, Any]) -> Dict[str, str]:
+        """Format the summary statistics for the stat cards."""
+        return {
+            "total_followers": f"{stats['total_followers']:,}",
+            "verification_rate": f"{stats['verification_rate']:.1f}%",
+            "avg_followers": f"{stats['avg_followers']:,}",
+            "unique_locations": f"{stats['unique_locations']:,}",
+            "total_tweets_analyzed": f"{stats['total_tweets_analyzed']:,}",
+            "unique_hashtags": f"{stats['unique_hashtags']:,}",
+            "analysis_date": stats["analysis_date"],
+        }
+
+    @staticmethod
+    def _create_figure(aggregates: DashboardAggregates) -> go.Figure:
+        """Create the live charts from the aggregates."""
+        fig = make_subplots(
+            rows=3,
+            cols=2,
+            subplot_titles=(
+                "Follower Count Distribution",
+                "Verification Status",
+                "Top Locations",
+                "Top Hashtags",
+                "Recent Tweets per Follower",
+                "Tweets by Hour (UTC)",
+            ),
+            specs=[
+                [{"type": "bar"}, {"type": "domain"}],
+                [{"type": "bar"}, {"type": "bar"}],
+                [{"type": "bar"}, {"type": "bar"}],
+            ],
+            vertical_spacing=0.1,
+        )
+
+        labels, counts = aggregates.follower_distribution()
+        fig.add_trace(go.Bar(x=labels, y=counts, marker_color="#1DA1F2"), 1, 1)
+
+        fig.add_trace(
+            go.Pie(
+                labels=["Verified", "Not Verified"],
+                values=[
+                    aggregates.verified_count,
+                    aggregates.total_followers - aggregates.verified_count,
+                ],
+                marker_colors=["#1DA1F2", "#AAB8C2"],
+                sort=False,
+            ),
+            1,
+            2,
+        )
+
+        locations = aggregates.top_locations()[::-1]
+        fig.add_trace(
+            go.Bar(
+                x=[count for _, count in locations],
+                y=[location for location, _ in locations],
+                orientation="h",
+                marker_color="lightblue",
+            ),
+            2,
+            1,
+        )
+
+        hashtags = aggregates.top_hashtags()[::-1]
+        fig.add_trace(
+            go.Bar(
+                x=[count for _, count in hashtags],
+                y=[f"#{hashtag}" for hashtag, _ in hashtags],
+                orientation="h",
+                marker_color="#17BF63",
+            ),
+            2,
+            2,
+        )
+
+        tweet_counts, followers = aggregates.activity_distribution()
+        fig.add_trace(go.Bar(x=tweet_counts, y=followers, marker_color="coral"), 3, 1)
+
+        fig.add_trace(
+            go.Bar(
+                x=list(range(24)),
+                y=aggregates.tweet_hours.tolist(),
+                marker_color="#794BC4",
+            ),
+            3,
+            2,
+        )
+
+        fig.update_layout(height=1100, showlegend=False, margin=dict(t=60))
+        return fig
+
+    def render_page(self) -> str:
+        """Render the dashboard page, which loads its data from ``data.json``."""
+        cards = "\n".join(
+            _STAT_CARD.format(card_id=card_id, label=label)
+            for card_id, label in STAT_CARDS.items()
+        )
+        refresh_ms = round(self.refresh_seconds * 1000)
+        username = html.escape(self.target_username)
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Live Follower Analysis - @{username}</title>
+    <style>
+        body {{
+            font-family: 'Arial', sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+            color: #333;
+        }}
+        .header {{
+            text-align: center;
+            background: linear-gradient(135deg, #1DA1F2, #14171A);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+        }}
+        .stats-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
+            gap: 20px;
+            margin-bottom: 20px;
+        }}
+        .stat-card {{
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            border-left: 4px solid #1DA1F2;
+        }}
+        .stat-number {{
+            font-size: 2em;
+            font-weight: bold;
+            color: #1DA1F2;
+        }}
+        .stat-label {{
+            color: #657786;
+            font-size: 0.9em;
+            margin-top: 5px;
+        }}
+        .status {{
+            margin: 0 0 20px;
+            padding: 10px 20px;
+            border-radius: 8px;
+            text-align: center;
+        }}
+        .status:empty {{
+            display: none;
+        }}
+        .status.finished {{
+            background: #e8f5fd;
+            color: #14171A;
+        }}
+        .status.error {{
+            background: #fdecea;
+            color: #b71c1c;
+        }}
+        #charts {{
+            background: white;
+            border-radius: 8px;
+        }}
+    </style>
+    <script src="plotly.min.js" charset="utf-8"></script>
+</head>
+<body>
+    <div class="header">
+        <h1>📡 Live Follower Analysis</h1>
+        <h2>@{username}</h2>
+        <p>Last update: <span id="analysis_date">waiting for data...</span></p>
+    </div>
+
+    <div class="status" id="status"></div>
+
+    <div class="stats-grid">
+{cards}
+    </div>
+
+    <div id="charts"></div>
+
+    <script>
+        const status = document.getElementById("status");
+        let etag = null;
+        let finished = false;
+        async function refresh() {{
+            const headers = etag ? {{"If-None-Match": etag}} : {{}};
+            const response = await fetch("data.json", {{headers, cache: "no-store"}});
+            if (response.status === 304) return;
+            if (!response.ok) throw new Error(`HTTP ${{response.status}}`);
+            etag = response.headers.get("ETag");
+            const data = await response.json();
+            for (const [id, value] of Object.entries(data.stats)) {{
+                const element = document.getElementById(id);
+                if (element) element.textContent = value;
+            }}
+            Plotly.react("charts", data.figure.data, data.figure.layout);
+            finished = data.finished;
+        }}
+        async function poll() {{
+            try {{
+                await refresh();
+            }} catch (error) {{
+                status.className = "status error";
+                status.textContent = `Connection lost (${{error.message}}): `
+                    + "showing the last data received, retrying...";
+                return;
+            }}
+            status.className = finished ? "status finished" : "status";
+            status.textContent = finished
+                ? "Collection finished: showing the final results" : "";
+            if (finished) clearInterval(timer);
+        }}
+        const timer = setInterval(poll, {refresh_ms});
+        poll();
+    </script>
+</body>
+</html>
+"""
@@ -0,0 +1,76 @@
+"""Chart output targets.
+
+Chart methods render PNG bytes and hand them back through ``deliver`` in
+whichever form the caller needs: a base64 string (for embedding in HTML), the
+raw bytes, or a file the bytes are written to. Asking for bytes or a file
+skips the base64 encoding and its 33% size overhead.
+"""
+
+import base64
+import io
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Union
+
+import matplotlib.pyplot as plt
+
+
+class ChartOutput(Enum):
+    """In-memory chart output formats."""
+
+    BASE64 = "base64"
+    BYTES = "bytes"
+
+
+# A ChartOutput, or a file path (str or Path) to write the PNG to
+ChartTarget = Union[ChartOutput, str, Path]
+# base64 str, PNG bytes, or the Path of the written file
+ChartResult = Union[str, bytes, Path]
+
+
+def save_figure(dpi: int, output: ChartTarget = ChartOutput.BASE64) -> ChartResult:
+    """Save the current matplotlib figure as PNG and close it.
+
+    Args:
+        dpi: Image resolution
+        output: Output format, or a file path to write to
+
+    Returns:
+        The chart in the requested form
+    """
+    buffer = io.BytesIO()
+    try:
+        plt.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        plt.close()
+    return deliver(buffer.getvalue(), output)
+
+
+def deliver(png: bytes, output: ChartTarget) -> ChartResult:
+    """Convert rendered PNG bytes to the requested output.
+
+    Args:
+        png: PNG image data
+        output: Output format, or a file path to write to
+
+    Returns:
+        The chart in the requested form
+    """
+    if output is ChartOutput.BYTES:
+        return png
+    if output is ChartOutput.BASE64:
+        return base64.b64encode(png).decode()
+
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(png)
+    return path
+
+
+def deliver_many(pngs: Dict[str, bytes], output: ChartTarget) -> Dict[str, ChartResult]:
+    """Convert several named PNGs; a path output is a directory of ``<name>.png``."""
+    if isinstance(output, ChartOutput):
+        return {name: deliver(png, output) for name, png in pngs.items()}
+    return {
+        name: deliver(png, Path(output) / f"{name}.png") for name, png in pngs.items()
+    }
@@ -0,0 +1,158 @@
+"""On-disk cache of rendered chart images and layouts.
+
+Charts are keyed by a SHA-256 hash of everything that determines their pixels
+(chart name, input data, style, figure size, dpi), so a chart whose inputs
+did not change is served from disk instead of being re-rendered. Expensive
+layouts (the hashtag word cloud) are cached the same way, independently of
+the resolution they are drawn at.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from ..models.user import FollowerAnalysis
+
+
+def analyses_digest(analyses: List[FollowerAnalysis]) -> str:
+    """Hash the data of a list of follower analyses.
+
+    Covers every dataclass field of the profiles, tweets and liked tweets.
+    """
+    digest = hashlib.sha256()
+    for analysis in analyses:
+        digest.update(
+            json.dumps(asdict(analysis), sort_keys=True, default=str).encode("utf-8")
+        )
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Directory of rendered PNGs with least-recently-used eviction.
+
+    Each entry is one ``<key>.png`` file; reading an entry refreshes its
+    modification time, and the oldest files are removed once more than
+    ``max_entries`` are stored. Writes are atomic, so several processes can
+    share a cache directory.
+    """
+
+    suffix = ".png"
+
+    def __init__(self, cache_dir: Union[str, Path], max_entries: int = 256):
+        """Initialize render cache.
+
+        Args:
+            cache_dir: Directory holding the cached images
+            max_entries: Maximum number of cached charts
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(chart: str, data: Any, **params: Any) -> str:
+        """Build the cache key of a chart.
+
+        Args:
+            chart: Chart name
+            data: JSON-serializable chart input (payload or data digest)
+            **params: Render parameters (style, figsize, dpi, ...)
+
+        Returns:
+            Hex SHA-256 key
+        """
+        material = json.dumps(
+            {"chart": chart, "data": data, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Get the file path of a cache entry."""
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached entry, or None if it is not cached."""
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def get_base64(self, key: str) -> Optional[str]:
+        """Get a cached PNG as a base64 string, or None if it is not cached."""
+        data = self.get(key)
+        return base64.b64encode(data).decode() if data is not None else None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an entry and evict the least recently used ones."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+
+    def put_base64(self, key: str, image_base64: str) -> None:
+        """Store a rendered PNG given as a base64 string."""
+        self.put(key, base64.b64decode(image_base64))
+
+    def clear(self) -> None:
+        """Remove every cached chart."""
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob(f"*{self.suffix}"))
+
+    def _evict(self) -> None:
+        """Remove the oldest entries beyond ``max_entries``."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except FileNotFoundError:
+                continue
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+
+class LayoutCache(RenderCache):
+    """Directory of computed chart layouts, stored as ``<key>.json`` files."""
+
+    suffix = ".json"
+
+    def get_layout(self, key: str) -> Optional[Any]:
+        """Get a cached layout, or None if it is not cached."""
+        data = self.get(key)
+        return json.loads(data) if data is not None else None
+
+    def put_layout(self, key: str, layout: Any) -> None:
+        """Store a JSON-serializable layout."""
+        self.put(key, json.dumps(layout).encode("utf-8"))
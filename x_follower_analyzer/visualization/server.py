@@ -0,0 +1,173 @@
+"""Local HTTP serving for the dashboard web apps.
+
+The live dashboard and the follower explorer are small local web apps. This
+module runs one on a background ``ThreadingHTTPServer`` and handles the
+plumbing they share: routing GET requests, complete responses, ``ETag``
+revalidation and serving the plotly.js bundle, so neither app needs a web
+framework or a CDN.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+
+@dataclass
+class Response:
+    """Complete HTTP response of a local app."""
+
+    status: int = 200
+    body: Union[bytes, str] = b""
+    content_type: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def html(cls, page: str) -> "Response":
+        """HTML page response."""
+        return cls(200, page, "text/html; charset=utf-8")
+
+    @classmethod
+    def json(cls, body: bytes, headers: Optional[Dict[str, str]] = None) -> "Response":
+        """Response with an already serialized JSON body."""
+        return cls(200, body, "application/json", headers or {})
+
+
+class LocalServer:
+    """Base class of local web apps served from a background thread.
+
+    Subclasses answer GET requests in ``route``; ``/plotly.min.js`` is served
+    for every app. A ``ValueError`` raised by ``route`` becomes a
+    ``400 Bad Request`` with its message.
+    """
+
+    thread_name = "local-server"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """Initialize local server.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+        """
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the server is running."""
+        return self._server is not None
+
+    @property
+    def url(self) -> str:
+        """URL of the app's page."""
+        if self._server is None:
+            return f"http://{self.host}:{self.port}/"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> str:
+        """Start serving in a background thread, returning the page URL."""
+        if self._server is None:
+            self._server = ThreadingHTTPServer(
+                (self.host, self.port), partial(_LocalRequestHandler, self)
+            )
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name=self.thread_name, daemon=True
+            )
+            self._thread.start()
+        return self.url
+
+    def serve(self) -> None:
+        """Serve until interrupted (e.g. by Ctrl+C), then stop."""
+        self.start()
+        try:
+            self._thread.join()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def route(self, path: str, query: Dict[str, str]) -> Optional[Response]:
+        """Answer a GET request (``None`` for unknown paths).
+
+        Args:
+            path: Request path
+            query: Query string parameters
+        """
+        raise NotImplementedError
+
+
+_plotly_js: Optional[bytes] = None
+
+
+def _plotly_bundle() -> bytes:
+    """The plotly.js bundle, encoded once per process."""
+    global _plotly_js
+    if _plotly_js is None:
+        from plotly.offline import get_plotlyjs
+
+        _plotly_js = get_plotlyjs().encode("utf-8")
+    return _plotly_js
+
+
+class _LocalRequestHandler(BaseHTTPRequestHandler):
+    """Dispatch GET requests to a local app."""
+
+    def __init__(self, app: LocalServer, *args, **kwargs):
+        self.app = app
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        """Answer a GET request."""
+        url = urlsplit(self.path)
+        if url.path == "/plotly.min.js":
+            response = Response(
+                200,
+                _plotly_bundle(),
+                "application/javascript",
+                {"Cache-Control": "max-age=86400"},
+            )
+        else:
+            try:
+                response = self.app.route(url.path, dict(parse_qsl(url.query)))
+            except ValueError as e:
+                response = Response(400, str(e), "text/plain; charset=utf-8")
+            if response is None:
+                response = Response(404, "Not found", "text/plain; charset=utf-8")
+
+        etag = response.headers.get("ETag")
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            response = Response(304, headers=response.headers)
+        self._send(response)
+
+    def _send(self, response: Response) -> None:
+        """Send a complete response."""
+        body = response.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(response.status)
+        if response.content_type:
+            self.send_header("Content-Type", response.content_type)
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep request logs out of the terminal output."""